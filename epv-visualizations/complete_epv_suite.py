@@ -15,15 +15,33 @@ from matplotlib.patches import Patch
 import warnings
 warnings.filterwarnings('ignore')
 
+from epv_bootstrap import bootstrap_mean_ci
+from epv_dcf import DCF_RANGE_WACC_STEP, dcf_scenarios
+from epv_engine import EPV_SCENARIO_FACTORS
+from epv_franchise import franchise_value
+from epv_interactive import CAPEX_FACTORS, TAX_SHIFTS, attach_cube, epv_cube, slider_script
+from epv_screening import ZONE_RULES
+from epv_sensitivity import epv_inputs, tornado
+from epv_universe import company_record, sample_company_universe
+from epv_valuation_ranges import RISK_CLASSES, valuation_ranges
+
 # Enhanced styling
 plt.style.use('seaborn-v0_8-whitegrid')
 sns.set_palette("husl")
 
+def _optional_range(method, values, **row):
+    """A football-field row, or None when the company has no data for the method"""
+    return {'method': method, **values, **row} if values else None
+
+
 class EnhancedEPVSuite:
     """Complete EPV Analysis Suite with all enhanced visualizations"""
     
-    def __init__(self):
+    def __init__(self, precision='float64', company=None):
+        self.precision = precision
         self.setup_data()
+        if company is not None:
+            self.load_company(company)
         print("🎯 Enhanced EPV Visualization Suite Initialized")
         print("📈 Based on Bruce Greenwald's Earnings Power Value Framework")
         print("=" * 60)
@@ -45,23 +63,82 @@ class EnhancedEPVSuite:
         })
         
         # 3. DCF scenarios
-        self.dcf_df = pd.DataFrame({
-            'Growth Rate': ['0%', '2%', '4%', '6%'],
-            'DCF Value': [95.00, 120.00, 165.00, 240.00]
-        })
         self.epv_scenarios = {"Conservative": 115.00, "Base Case": 125.00, "Optimistic": 135.00}
+        self.normalized_earnings = 10.00  # Per share
+        self.wacc = 0.08
+        self.current_price = 105.00
+        self.dcf_df = self.build_dcf_df()
+        self.epv_inputs = epv_inputs(company_record(sample_company_universe(), 'SAMPLE'), self.precision)
+        self.asset_range = {'method': 'Asset-Based (Liquidation)', 'low': 80, 'mid': 95, 'high': 110}
+        self.comparable_range = {'low': 130, 'mid': 155, 'high': 180}
+        # Sample-only football-field inputs: a universe company has no data behind them
+        self.precedent_range = {'low': 140, 'mid': 165, 'high': 195}
+        self.sotp_range = {'low': 135, 'mid': 155, 'high': 175}
+        self.analyst_targets = [130, 150, 170]
         
         # 4. Valuation summary for football field
         self.valuation_data = [
             {'method': 'Earnings Power Value (EPV)', 'low': 122, 'high': 128, 'color': 'green'},
-            {'method': 'Discounted Cash Flow (DCF)', 'low': 110, 'high': 165, 'color': 'blue'},
+            {'method': 'Discounted Cash Flow (DCF)', 'low': self.dcf_value('0%'), 'high': self.dcf_value('4%'),
+             'color': 'blue'},
             {'method': 'Comparable Companies', 'low': 135, 'high': 175, 'color': 'purple'},
             {'method': 'Precedent Transactions', 'low': 150, 'high': 190, 'color': 'orange'},
             {'method': 'Asset-Based Valuation', 'low': 90, 'high': 120, 'color': 'brown'},
             {'method': 'Sum-of-the-Parts', 'low': 140, 'high': 170, 'color': 'pink'}
         ]
 
-    def plot_1_normalized_ebit_enhanced(self):
+    def load_company(self, company):
+        """Replace the sample history with one company from a columnar universe"""
+        self.ticker = company['ticker']
+        self.ebit_df = pd.DataFrame({
+            'Year': company['year'],
+            'EBIT': np.round(company['ebit'], 1)
+        })
+        self.capex_df = pd.DataFrame({
+            'Year': company['year'][-5:],
+            'Total Capex': np.round(company['total_capex'][-5:], 1),
+            'Maintenance Capex': np.round(company['maint_capex'][-5:], 1)
+        })
+        
+        epv = company['epv_per_share']
+        self.epv_scenarios = {name: epv * factor for name, factor in EPV_SCENARIO_FACTORS.items()}
+        self.normalized_earnings = epv * company['wacc']
+        self.wacc = company['wacc']
+        self.current_price = company['price']
+        self.dcf_df = self.build_dcf_df()
+        self.epv_inputs = epv_inputs(company, self.precision)
+        assets = franchise_value(company, precision=self.precision)
+        low, high = sorted([assets['liquidation_per_share'], assets['reproduction_per_share']])
+        self.asset_range = {'method': 'Asset-Based (Liquidation to Reproduction)',
+                            'low': low, 'mid': (low + high) / 2, 'high': high}
+        # Peer price / EPV multiples from the universe (epv_peers.universe_comparable_range), if given
+        self.comparable_range = company.get('comparable_range')
+        self.precedent_range = self.sotp_range = self.analyst_targets = None
+
+    def build_dcf_df(self):
+        """DCF value and terminal multiple per growth scenario from the normalized earnings.
+
+        'DCF Low' / 'DCF High' are the same scenarios at WACC +/- DCF_RANGE_WACC_STEP.
+        """
+        dcf = dcf_scenarios(self.normalized_earnings, self.wacc)
+        return pd.DataFrame({
+            'Growth Rate': dcf['growth_rate'],
+            'DCF Value': dcf['value'],
+            'Terminal Multiple': dcf['terminal_multiple'],
+            'DCF Low': dcf_scenarios(self.normalized_earnings, self.wacc + DCF_RANGE_WACC_STEP)['value'],
+            'DCF High': dcf_scenarios(self.normalized_earnings, self.wacc - DCF_RANGE_WACC_STEP)['value']
+        })
+
+    def dcf_value(self, growth_rate, column='DCF Value'):
+        """One growth scenario's value from dcf_df, e.g. dcf_value('4%')"""
+        return float(self.dcf_df.loc[self.dcf_df['Growth Rate'] == growth_rate, column].iloc[0])
+
+    def dcf_range(self, growth_rate):
+        """Football-field low/mid/high for one DCF growth scenario"""
+        return {'low': self.dcf_value(growth_rate, 'DCF Low'), 'mid': self.dcf_value(growth_rate),
+                'high': self.dcf_value(growth_rate, 'DCF High')}
+
+    def plot_1_normalized_ebit_enhanced(self, show=True):
         """1. Enhanced Normalized EBIT Chart with Advanced Analytics"""
         print("\n📊 Generating Enhanced EBIT Normalization Chart...")
         
@@ -70,6 +147,7 @@ class EnhancedEPVSuite:
         # Main normalization chart
         avg_ebit = self.ebit_df['EBIT'].mean()
         std_ebit = self.ebit_df['EBIT'].std()
+        ci_low, ci_high = bootstrap_mean_ci(self.ebit_df['EBIT'])
         peak_year = self.ebit_df.loc[self.ebit_df['EBIT'].idxmax(), 'Year']
         trough_year = self.ebit_df.loc[self.ebit_df['EBIT'].idxmin(), 'Year']
         
@@ -143,6 +221,7 @@ class EnhancedEPVSuite:
         • Min: ${self.ebit_df['EBIT'].min()}M
         • Max: ${self.ebit_df['EBIT'].max()}M
         • Normalized Range: ${avg_ebit-std_ebit:.1f}M - ${avg_ebit+std_ebit:.1f}M
+        • 90% Block-Bootstrap CI: ${ci_low:.1f}M - ${ci_high:.1f}M
         """
         ax4.text(0.1, 0.5, stats_text, transform=ax4.transAxes, fontsize=11,
                 bbox=dict(boxstyle="round,pad=0.5", facecolor='lightblue', alpha=0.8),
@@ -151,9 +230,11 @@ class EnhancedEPVSuite:
         ax4.axis('off')
         
         plt.tight_layout()
-        plt.show()
+        if show:
+            plt.show()
+        return fig
 
-    def plot_2_capex_breakdown_enhanced(self):
+    def plot_2_capex_breakdown_enhanced(self, show=True):
         """2. Enhanced Capex Breakdown with Advanced Metrics"""
         print("\n📊 Generating Enhanced Capex Analysis...")
         
@@ -242,9 +323,11 @@ class EnhancedEPVSuite:
         ax4.axis('off')
         
         plt.tight_layout()
-        plt.show()
+        if show:
+            plt.show()
+        return fig
 
-    def plot_3_epv_dcf_interactive_enhanced(self):
+    def plot_3_epv_dcf_interactive_enhanced(self, show=True):
         """3. Enhanced Interactive EPV vs DCF Analysis"""
         print("\n📊 Generating Enhanced EPV vs DCF Interactive Analysis...")
         
@@ -278,38 +361,33 @@ class EnhancedEPVSuite:
                          annotation_position="right", row=1, col=1)
         
         # Terminal multiples analysis
-        terminal_multiples = [val/10 for val in self.dcf_df['DCF Value']]  # Simplified calculation
         fig.add_trace(
-            go.Scatter(x=self.dcf_df['Growth Rate'], y=terminal_multiples,
+            go.Scatter(x=self.dcf_df['Growth Rate'], y=self.dcf_df['Terminal Multiple'],
                       mode='lines+markers', name='Implied Terminal Multiple',
                       line=dict(color='red', width=4), marker=dict(size=10)),
             row=1, col=2
         )
         
-        # Sensitivity tornado chart
-        base_dcf = self.dcf_df['DCF Value'].iloc[0]
-        sensitivity_data = [val - base_dcf for val in self.dcf_df['DCF Value']]
-        
-        fig.add_trace(
-            go.Waterfall(x=self.dcf_df['Growth Rate'], y=sensitivity_data,
-                        name="Growth Impact on Valuation",
-                        connector={"line": {"color": "rgb(63, 63, 63)"}},
-                        increasing={"marker": {"color": "green"}},
-                        decreasing={"marker": {"color": "red"}},
-                        textposition="outside",
-                        texttemplate='%{y:+.0f}'),
-            row=2, col=1
-        )
+        # Sensitivity tornado chart: every EPV input bumped down and up, largest swing on top
+        swings = tornado(self.epv_inputs)
+        order = swings['order'][::-1]
+        labels = [name.replace('_', ' ').title() for name in swings['inputs'][order]]
+        for side, color in (('low', 'red'), ('high', 'green')):
+            fig.add_trace(
+                go.Bar(y=labels, x=swings[side][order] - swings['base'], orientation='h',
+                       name=f"Input {'Down' if side == 'low' else 'Up'}", marker_color=color,
+                       opacity=0.8, texttemplate='%{x:+.1f}', textposition='outside'),
+                row=2, col=1
+            )
         
         # Risk-return scatter
-        growth_rates = [0, 2, 4, 6]
         uncertainty = [10, 25, 45, 80]  # Increasing uncertainty with growth
         
         fig.add_trace(
             go.Scatter(x=uncertainty, y=self.dcf_df['DCF Value'],
                       mode='markers+text', name='Risk-Return Profile',
                       marker=dict(size=15, color=colors, opacity=0.8),
-                      text=[f"{g}%" for g in growth_rates],
+                      text=self.dcf_df['Growth Rate'],
                       textposition="middle center",
                       hovertemplate='<b>Growth: %{text}</b><br>Uncertainty: %{x}%<br>Value: $%{y:.0f}<extra></extra>'),
             row=2, col=2
@@ -317,7 +395,7 @@ class EnhancedEPVSuite:
         
         # Add EPV as low-risk reference point
         fig.add_trace(
-            go.Scatter(x=[5], y=[125], mode='markers+text',
+            go.Scatter(x=[5], y=[self.epv_scenarios['Base Case']], mode='markers+text',
                       marker=dict(size=20, color='green', symbol='star'),
                       text=['EPV'], textposition="top center",
                       name='EPV (Low Risk)', showlegend=False),
@@ -328,33 +406,43 @@ class EnhancedEPVSuite:
             title_text="Enhanced EPV vs DCF Comprehensive Analysis",
             showlegend=True,
             height=800,
+            barmode='overlay',
             template='plotly_white'
         )
         
-        fig.show()
+        if show:
+            fig.show()
+        return fig
 
-    def plot_4_wacc_sensitivity_enhanced(self):
+    def plot_4_wacc_sensitivity_enhanced(self, show=True):
         """4. Enhanced WACC Sensitivity with Multiple Scenarios"""
         print("\n📊 Generating Enhanced WACC Sensitivity Analysis...")
         
         wacc_range = np.arange(0.06, 0.121, 0.005)
-        normalized_earnings = 10.00  # Per share
-        market_price = 105.00
+        normalized_earnings = self.normalized_earnings
+        market_price = self.current_price
         
         # Multiple scenario analysis
         scenarios = {
-            'Conservative (90% of Base)': normalized_earnings * 0.9,
-            'Base Case': normalized_earnings,
-            'Optimistic (110% of Base)': normalized_earnings * 1.1,
-            'Bull Case (125% of Base)': normalized_earnings * 1.25
+            'Conservative (90% of Base)': 0.9,
+            'Base Case': 1.0,
+            'Optimistic (110% of Base)': 1.1,
+            'Bull Case (125% of Base)': 1.25
         }
         
+        # EPV for every scenario x WACC x tax x capex step, precomputed for the sliders
+        inputs = self.epv_inputs
+        cube = epv_cube(normalized_earnings, list(scenarios.values()), wacc_range,
+                        inputs['ebit'] / inputs['shares'], inputs['maint_capex'] / inputs['shares'],
+                        inputs['tax_rate'], precision=self.precision)
+        base_tax, base_capex = TAX_SHIFTS.index(0.00), CAPEX_FACTORS.index(1.00)
+        epv_grid = cube[:, :, base_tax, base_capex]
+        active_wacc = len(wacc_range) // 2
+        
         fig = go.Figure()
         
         colors = ['red', 'blue', 'green', 'purple']
-        for i, (scenario, earnings) in enumerate(scenarios.items()):
-            epv_values = earnings / wacc_range
-            
+        for i, (scenario, epv_values) in enumerate(zip(scenarios, epv_grid)):
             fig.add_trace(go.Scatter(
                 x=wacc_range, y=epv_values,
                 mode='lines+markers',
@@ -364,41 +452,49 @@ class EnhancedEPVSuite:
                 hovertemplate=f'<b>{scenario}</b><br>WACC: %{{x:.1%}}<br>EPV: $%{{y:.2f}}<extra></extra>'
             ))
         
+        # EPV readout at the selected WACC
+        selected = epv_grid[:, active_wacc]
+        fig.add_trace(go.Scatter(
+            x=[wacc_range[active_wacc]] * len(selected), y=selected,
+            mode='markers+text', name='Selected WACC',
+            text=[f"${v:.2f}" for v in selected], textposition='middle right',
+            marker=dict(size=14, color='orange', line=dict(color='black', width=1)),
+            showlegend=False, hoverinfo='skip'
+        ))
+        
         # Market price reference with bands
         fig.add_hline(y=market_price, line_dash="solid", line_color="black", line_width=3,
                      annotation_text=f"Current Market Price: ${market_price:.0f}",
                      annotation_position="bottom right")
         
-        # Value zones with enhanced styling
-        fig.add_hrect(y0=market_price*1.25, y1=300, fillcolor="rgba(0, 255, 0, 0.15)", 
+        # Value zones with enhanced styling (same thresholds as the screening engine)
+        hold_floor, buy_floor, strong_buy_floor = [
+            market_price * (1 + t) for t in ZONE_RULES['wacc_sensitivity']]
+        fig.add_hrect(y0=strong_buy_floor, y1=300, fillcolor="rgba(0, 255, 0, 0.15)", 
                      line_width=0, annotation_text="Strong Buy Zone (+25%)",
                      annotation_position="top left")
-        fig.add_hrect(y0=market_price*1.1, y1=market_price*1.25, fillcolor="rgba(144, 238, 144, 0.15)", 
+        fig.add_hrect(y0=buy_floor, y1=strong_buy_floor, fillcolor="rgba(144, 238, 144, 0.15)", 
                      line_width=0, annotation_text="Buy Zone (+10%)")
-        fig.add_hrect(y0=market_price*0.9, y1=market_price*1.1, fillcolor="rgba(255, 255, 0, 0.15)", 
+        fig.add_hrect(y0=hold_floor, y1=buy_floor, fillcolor="rgba(255, 255, 0, 0.15)", 
                      line_width=0, annotation_text="Fair Value Zone (±10%)")
-        fig.add_hrect(y0=50, y1=market_price*0.9, fillcolor="rgba(255, 0, 0, 0.15)", 
+        fig.add_hrect(y0=50, y1=hold_floor, fillcolor="rgba(255, 0, 0, 0.15)", 
                      line_width=0, annotation_text="Overvalued Zone")
-        
-        # Add dynamic slider for WACC selection
-        steps = []
-        for wacc in wacc_range[::2]:  # Every other value for cleaner slider
-            step = dict(
-                method="relayout",
-                args=[{"shapes": [dict(
-                    type='line', x0=wacc, x1=wacc, y0=50, y1=300,
-                    line=dict(color='orange', width=3, dash='dot')
-                )]}],
-                label=f"{wacc:.1%}"
-            )
-            steps.append(step)
-        
-        sliders = [dict(
-            active=len(steps)//2,
-            currentvalue={"prefix": "WACC: "},
-            pad={"t": 50},
-            steps=steps
-        )]
+        fig.add_vline(x=wacc_range[active_wacc], line=dict(color='orange', width=3, dash='dot'))
+        
+        # WACC, tax and capex sliders; the embedded cube redraws the curves in the browser
+        def slider(name, prefix, labels, active, x):
+            return dict(name=name, active=active, currentvalue={"prefix": prefix},
+                        pad={"t": 50}, x=x, len=0.3,
+                        steps=[dict(method="skip", args=[None], label=label) for label in labels])
+        
+        sliders = [
+            slider('wacc', "WACC: ", [f"{w:.1%}" for w in wacc_range], active_wacc, 0.0),
+            slider('tax', "Tax Rate: ", [f"{inputs['tax_rate'] + t:.0%}" for t in TAX_SHIFTS],
+                   base_tax, 0.35),
+            slider('capex', "Maint. Capex: ", [f"{c:.0%}" for c in CAPEX_FACTORS], base_capex, 0.7)
+        ]
+        attach_cube(fig, cube, wacc_range, curve_traces=range(len(scenarios)),
+                    marker_trace=len(scenarios), wacc_shape=len(fig.layout.shapes) - 1)
         
         fig.update_layout(
             title_text='Enhanced WACC Sensitivity Analysis with Investment Zones',
@@ -409,12 +505,14 @@ class EnhancedEPVSuite:
             hovermode='x unified',
             sliders=sliders,
             width=1000,
-            height=600
+            height=650
         )
         
-        fig.show()
+        if show:
+            fig.show(post_script=slider_script(fig))
+        return fig
 
-    def plot_5_epv_waterfall_enhanced(self):
+    def plot_5_epv_waterfall_enhanced(self, show=True):
         """5. Enhanced EPV Waterfall with Multiple Scenarios"""
         print("\n📊 Generating Enhanced EPV Waterfall Analysis...")
         
@@ -485,89 +583,107 @@ class EnhancedEPVSuite:
             template='plotly_white'
         )
         
-        fig.show()
+        if show:
+            fig.show()
+        return fig
 
-    def plot_6_football_field_enhanced(self):
+    def plot_6_football_field_enhanced(self, show=True):
         """6. Enhanced Football Field with Confidence Intervals and Risk Metrics"""
         print("\n📊 Generating Enhanced Football Field Valuation...")
         
-        # Enhanced valuation data with confidence metrics
+        # Valuation ranges with confidence metrics; EPV rows span the EPV scenarios
+        conservative, base, optimistic = (self.epv_scenarios[name] for name in EPV_SCENARIO_FACTORS)
         enhanced_valuation = [
-            {'method': 'EPV Conservative', 'low': 115, 'mid': 122, 'high': 128, 'confidence': 95, 'risk': 'Low'},
-            {'method': 'EPV Base Case', 'low': 122, 'mid': 125, 'high': 135, 'confidence': 90, 'risk': 'Low'},
-            {'method': 'DCF (0% Growth)', 'low': 90, 'mid': 110, 'high': 130, 'confidence': 75, 'risk': 'Medium'},
-            {'method': 'DCF (4% Growth)', 'low': 120, 'mid': 165, 'high': 220, 'confidence': 60, 'risk': 'High'},
-            {'method': 'Comparable Companies', 'low': 130, 'mid': 155, 'high': 180, 'confidence': 70, 'risk': 'Medium'},
-            {'method': 'Precedent Transactions', 'low': 140, 'mid': 165, 'high': 195, 'confidence': 50, 'risk': 'High'},
-            {'method': 'Asset-Based (Liquidation)', 'low': 80, 'mid': 95, 'high': 110, 'confidence': 85, 'risk': 'Low'},
-            {'method': 'Sum-of-the-Parts', 'low': 135, 'mid': 155, 'high': 175, 'confidence': 65, 'risk': 'Medium'}
+            {'method': 'EPV Conservative', 'low': conservative, 'mid': (conservative + base) / 2, 'high': base,
+             'confidence': 95, 'risk': 'Low'},
+            {'method': 'EPV Base Case', 'low': (conservative + base) / 2, 'mid': base, 'high': optimistic,
+             'confidence': 90, 'risk': 'Low'},
+            {'method': 'DCF (0% Growth)', **self.dcf_range('0%'), 'confidence': 75, 'risk': 'Medium'},
+            {'method': 'DCF (4% Growth)', **self.dcf_range('4%'), 'confidence': 60, 'risk': 'High'},
+            _optional_range('Comparable Companies', self.comparable_range, confidence=70, risk='Medium'),
+            _optional_range('Precedent Transactions', self.precedent_range, confidence=50, risk='High'),
+            dict(self.asset_range, confidence=85, risk='Low'),
+            _optional_range('Sum-of-the-Parts', self.sotp_range, confidence=65, risk='Medium')
         ]
         
+        ranges, methods = valuation_ranges([row for row in enhanced_valuation if row])
+        finite = np.isfinite(ranges['low']) & np.isfinite(ranges['high'])
+        x_min = 0.8 * min(ranges['low'][finite].min(initial=self.current_price), self.current_price)
+        x_max = 1.1 * max(ranges['high'][finite].max(initial=self.current_price), self.current_price)
+        
         fig = go.Figure()
         
         colors = {'Low': 'green', 'Medium': 'orange', 'High': 'red'}
         symbols = {'Low': 'circle', 'Medium': 'square', 'High': 'diamond'}
         
-        for i, item in enumerate(enhanced_valuation):
-            color = colors[item['risk']]
-            symbol = symbols[item['risk']]
+        # One trace per risk class, each carrying all of its methods as arrays
+        for code, risk in enumerate(RISK_CLASSES):
+            group = ranges[ranges['risk'] == code]
+            if group.size == 0:
+                continue
+            color = colors[risk]
             
-            # Main valuation range
+            # Main valuation ranges
             fig.add_trace(go.Scatter(
-                x=[item['mid']],
-                y=[item['method']],
+                x=group['mid'],
+                y=methods[group['method']],
                 error_x=dict(
                     type='data',
                     symmetric=False,
-                    array=[item['high'] - item['mid']],
-                    arrayminus=[item['mid'] - item['low']],
+                    array=group['high'] - group['mid'],
+                    arrayminus=group['mid'] - group['low'],
                     thickness=12,
                     color=color
                 ),
                 mode='markers',
-                marker=dict(symbol=symbol, size=18, color=color, 
+                marker=dict(symbol=symbols[risk], size=18, color=color, 
                            line=dict(width=3, color='black')),
-                name=f"{item['risk']} Risk Methods",
-                legendgroup=item['risk'],
-                showlegend=i==0 or (i==2 and item['risk']=='Medium') or (i==3 and item['risk']=='High'),
-                hovertemplate=(f"<b>{item['method']}</b><br>"
-                              f"Range: ${item['low']:.0f} - ${item['high']:.0f}<br>"
-                              f"Midpoint: ${item['mid']:.0f}<br>"
-                              f"Confidence: {item['confidence']}%<br>"
-                              f"Risk Level: {item['risk']}<extra></extra>")
+                name=f"{risk} Risk Methods",
+                legendgroup=risk,
+                customdata=np.column_stack([group['low'], group['high'], group['confidence']]),
+                hovertemplate=("<b>%{y}</b><br>"
+                              "Range: $%{customdata[0]:.0f} - $%{customdata[1]:.0f}<br>"
+                              "Midpoint: $%{x:.0f}<br>"
+                              "Confidence: %{customdata[2]:.0f}%<br>"
+                              f"Risk Level: {risk}<extra></extra>")
             ))
             
-            # Confidence intervals as text
-            fig.add_annotation(
-                x=item['high'] + 15,
-                y=item['method'],
-                text=f"{item['confidence']}%",
-                showarrow=False,
-                font=dict(size=10, color=color, weight='bold')
-            )
+            # Confidence levels as text beside each range
+            fig.add_trace(go.Scatter(
+                x=group['high'] + 0.05 * x_max,
+                y=methods[group['method']],
+                mode='text',
+                text=[f"{confidence:.0f}%" for confidence in group['confidence']],
+                textfont=dict(size=10, color=color, weight='bold'),
+                legendgroup=risk,
+                showlegend=False,
+                hoverinfo='skip'
+            ))
         
         # Market dynamics
-        current_price = 105
-        target_prices = [130, 150, 170]  # Analyst targets
+        current_price = self.current_price
         
         # Current price line
         fig.add_vline(x=current_price, line_width=4, line_dash="solid", 
                      line_color="black", opacity=0.9,
-                     annotation_text=f"Current Price: ${current_price}",
+                     annotation_text=f"Current Price: ${current_price:.2f}",
                      annotation_position="top right",
                      annotation_font=dict(size=14, color="black"))
         
-        # Analyst target range
-        fig.add_vrect(x0=min(target_prices), x1=max(target_prices), 
-                     fillcolor="blue", opacity=0.1, line_width=0,
-                     annotation_text="Analyst Targets", annotation_position="top left")
+        # Analyst target range (sample company only)
+        if self.analyst_targets:
+            fig.add_vrect(x0=min(self.analyst_targets), x1=max(self.analyst_targets), 
+                         fillcolor="blue", opacity=0.1, line_width=0,
+                         annotation_text="Analyst Targets", annotation_position="top left")
         
         # Investment zones with enhanced styling
+        hold_floor, buy_floor, strong_buy_floor = [
+            current_price * (1 + t) for t in ZONE_RULES['football_field']]
         zones = [
-            {'x0': current_price*1.3, 'x1': 250, 'fillcolor': 'green', 'opacity': 0.15, 'label': 'Strong Buy (+30%)'},
-            {'x0': current_price*1.15, 'x1': current_price*1.3, 'fillcolor': 'lightgreen', 'opacity': 0.15, 'label': 'Buy (+15%)'},
-            {'x0': current_price*0.9, 'x1': current_price*1.15, 'fillcolor': 'yellow', 'opacity': 0.15, 'label': 'Hold (±15%)'},
-            {'x0': 60, 'x1': current_price*0.9, 'fillcolor': 'red', 'opacity': 0.15, 'label': 'Overvalued'}
+            {'x0': strong_buy_floor, 'x1': x_max, 'fillcolor': 'green', 'opacity': 0.15, 'label': 'Strong Buy (+30%)'},
+            {'x0': buy_floor, 'x1': strong_buy_floor, 'fillcolor': 'lightgreen', 'opacity': 0.15, 'label': 'Buy (+15%)'},
+            {'x0': hold_floor, 'x1': buy_floor, 'fillcolor': 'yellow', 'opacity': 0.15, 'label': 'Hold (±15%)'},
+            {'x0': x_min, 'x1': hold_floor, 'fillcolor': 'red', 'opacity': 0.15, 'label': 'Overvalued'}
         ]
         
         for zone in zones:
@@ -580,12 +696,15 @@ class EnhancedEPVSuite:
             template='plotly_white',
             showlegend=True,
             legend=dict(x=0.02, y=0.98),
+            yaxis=dict(categoryorder='array', categoryarray=methods),
             width=1200,
             height=700,
             font=dict(size=12)
         )
         
-        fig.show()
+        if show:
+            fig.show()
+        return fig
 
     def generate_complete_analysis(self):
         """Generate the complete enhanced EPV analysis suite"""
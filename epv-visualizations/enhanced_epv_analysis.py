@@ -16,6 +16,9 @@ from matplotlib.patches import Patch, Rectangle
 import warnings
 warnings.filterwarnings('ignore')
 
+from epv_dcf import dcf_scenarios
+from epv_monte_carlo import simulate_epv, simulate_epv_adaptive
+
 # Set styling
 plt.style.use('seaborn-v0_8-whitegrid')
 sns.set_palette("husl")
@@ -46,10 +49,11 @@ class EPVAnalyzer:
         })
         
         # DCF scenario data
+        dcf = dcf_scenarios(10.00, 0.08, growth_rates=(0.00, 0.02, 0.04, 0.06, 0.08))
         self.dcf_scenarios = pd.DataFrame({
-            'Growth_Rate': ['0%', '2%', '4%', '6%', '8%'],
-            'DCF_Value': [95.00, 120.00, 165.00, 240.00, 385.00],
-            'Terminal_Multiple': [12.5, 15.0, 20.0, 30.0, 48.1]
+            'Growth_Rate': dcf['growth_rate'],
+            'DCF_Value': dcf['value'],
+            'Terminal_Multiple': dcf['terminal_multiple']
         })
         
         # EPV scenarios
@@ -89,7 +93,15 @@ class EPVAnalyzer:
             'wacc_volatility': 0.015,
             'tax_rate': 0.25,
             'maint_capex_pct': 0.06,
-            'simulations': 10000
+            'simulations': 10000,
+            'precision': 'float64',  # 'float32' halves memory traffic per draw
+            # Set to a dict (e.g. {'percentile_tolerance': 0.005}) to simulate in
+            # batches until P10/P50/P90 and upside probability are precise enough
+            'adaptive': None,
+            # 3x3 correlation over (ebit, wacc, tax_rate) for a Gaussian copula, and
+            # 'truncated' sampling to keep draws in bounds without piling up at them
+            'correlation': None,
+            'sampling': 'clip'
         }
         
         # Events for annotations
@@ -100,7 +112,7 @@ class EPVAnalyzer:
             2023: "Supply Chain Recovery"
         }
 
-    def plot_normalized_ebit_advanced(self):
+    def plot_normalized_ebit_advanced(self, show=True):
         """Enhanced EBIT normalization chart with advanced features"""
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 14))
         
@@ -174,9 +186,11 @@ class EPVAnalyzer:
         ax4.grid(True, alpha=0.3)
         
         plt.tight_layout()
-        plt.show()
+        if show:
+            plt.show()
+        return fig
 
-    def plot_interactive_epv_dcf_enhanced(self):
+    def plot_interactive_epv_dcf_enhanced(self, show=True):
         """Enhanced interactive EPV vs DCF comparison"""
         fig = make_subplots(
             rows=2, cols=2,
@@ -220,7 +234,9 @@ class EPVAnalyzer:
         
         # Method comparison radar
         methods = ['EPV Conservative', 'EPV Base', 'DCF 0%', 'DCF 4%', 'DCF 6%']
-        values = [115, 125, 95, 165, 240]
+        dcf_values = dict(zip(self.dcf_scenarios['Growth_Rate'], self.dcf_scenarios['DCF_Value']))
+        values = [self.epv_scenarios['Conservative'], self.epv_scenarios['Base Case'],
+                  dcf_values['0%'], dcf_values['4%'], dcf_values['6%']]
         
         fig.add_trace(
             go.Bar(x=methods, y=values, name='Valuation Methods',
@@ -234,40 +250,24 @@ class EPVAnalyzer:
             height=800
         )
         
-        fig.show()
+        if show:
+            fig.show()
+        return fig
 
-    def plot_monte_carlo_simulation(self):
+    def plot_monte_carlo_simulation(self, show=True):
         """Monte Carlo simulation for EPV distribution"""
-        np.random.seed(42)
-        
-        # Parameters
-        n_sims = self.mc_params['simulations']
-        base_ebit = self.mc_params['base_ebit']
-        ebit_vol = self.mc_params['ebit_volatility']
-        base_wacc = self.mc_params['wacc_base']
-        wacc_vol = self.mc_params['wacc_volatility']
-        
-        # Generate random variables
-        ebit_draws = np.random.normal(base_ebit, base_ebit * ebit_vol, n_sims)
-        wacc_draws = np.random.normal(base_wacc, wacc_vol, n_sims)
-        tax_rate_draws = np.random.normal(0.25, 0.02, n_sims)
-        
-        # Ensure reasonable bounds
-        ebit_draws = np.clip(ebit_draws, base_ebit * 0.5, base_ebit * 2)
-        wacc_draws = np.clip(wacc_draws, 0.05, 0.15)
-        tax_rate_draws = np.clip(tax_rate_draws, 0.15, 0.35)
-        
-        # Calculate EPV distribution
-        epv_results = []
-        for ebit, wacc, tax_rate in zip(ebit_draws, wacc_draws, tax_rate_draws):
-            after_tax_earnings = ebit * (1 - tax_rate)
-            maintenance_capex = ebit * self.mc_params['maint_capex_pct']
-            distributable_earnings = after_tax_earnings - maintenance_capex
-            enterprise_value = distributable_earnings / wacc
-            epv_per_share = enterprise_value / 100  # 100M shares
-            epv_results.append(epv_per_share)
-        
-        epv_results = np.array(epv_results)
+        current_price = 105
+        
+        # Fixed-size run, or batches until the reported percentiles converge
+        if self.mc_params['adaptive']:
+            results = simulate_epv_adaptive(self.mc_params, current_price=current_price)
+        else:
+            results = simulate_epv(self.mc_params)
+        
+        epv_results = results['epv']
+        ebit_draws = results['ebit']
+        wacc_draws = results['wacc']
+        n_sims = len(epv_results)
         
         # Create comprehensive visualization
         fig = make_subplots(
@@ -310,7 +310,6 @@ class EPVAnalyzer:
         )
         
         # Risk metrics
-        current_price = 105
         upside_prob = (epv_results > current_price).mean() * 100
         downside_risk = max(0, current_price - np.percentile(epv_results, 10))
         
@@ -329,7 +328,8 @@ class EPVAnalyzer:
             height=800
         )
         
-        fig.show()
+        if show:
+            fig.show()
         
         # Print summary statistics
         print("\n" + "="*50)
@@ -342,7 +342,12 @@ class EPVAnalyzer:
         print(f"75th Percentile: ${np.percentile(epv_results, 75):.2f}")
         print(f"Probability of Upside: {upside_prob:.1f}%")
         print(f"Value at Risk (10%): ${downside_risk:.2f}")
+        if self.mc_params['adaptive']:
+            status = "converged" if results['converged'] else "hit simulation cap"
+            print(f"Adaptive Stopping: {status} after {results['n_batches']} batches")
         print("="*50)
+        
+        return fig
 
     def generate_comprehensive_report(self):
         """Generate all visualizations in sequence"""
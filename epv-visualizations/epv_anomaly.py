@@ -0,0 +1,78 @@
+"""
+EBIT Anomaly Scan
+Out-of-band years in every company's EBIT and margin history, flagged as (company, year, z-score) rows
+"""
+
+import warnings
+
+import numpy as np
+
+from epv_engine import resolve_dtype
+
+# The professional EBIT chart's "extreme" lines sit at +/-2 sigma
+EXTREME_Z = 2.0
+
+# MAD x 1.4826 estimates sigma for normally distributed data
+MAD_SCALE = 1.4826
+
+SCAN_METHODS = ('std', 'robust')
+
+
+def zscores(panel, method='std'):
+    """Per-year z-scores of each row: (x - mean) / std, or (x - median) / (1.4826 x MAD) when robust.
+
+    Non-finite years are left out of the centre and scale and get NaN, as do
+    rows with no spread, so neither is flagged by z-score.
+    """
+    if method not in SCAN_METHODS:
+        raise ValueError(f"Unknown scan method '{method}'. Choose from: {', '.join(SCAN_METHODS)}")
+    panel = np.where(np.isfinite(panel), panel, np.nan)
+    with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)  # rows with fewer than two finite years
+        if method == 'std':
+            center = np.nanmean(panel, axis=-1, keepdims=True)
+            scale = np.nanstd(panel, axis=-1, ddof=1, keepdims=True)
+        else:
+            center = np.nanmedian(panel, axis=-1, keepdims=True)
+            scale = MAD_SCALE * np.nanmedian(np.abs(panel - center), axis=-1, keepdims=True)
+        return np.where(scale > 0, (panel - center) / scale, np.nan)
+
+
+def scan_anomalies(universe, threshold=EXTREME_Z, method='std', precision='float64'):
+    """Flagged years across the universe as a compact columnar table.
+
+    Scans EBIT and EBIT margin for every company at once and returns one
+    row per year outside +/-``threshold`` z: ticker, year, series, value and
+    z-score, most extreme first. Missing or infinite years (e.g. a zero-revenue
+    margin) are flagged too, with a NaN z-score, after the out-of-band rows.
+    """
+    dtype = resolve_dtype(precision)
+    ebit = np.atleast_2d(np.asarray(universe['ebit'], dtype=dtype))
+    revenue = np.atleast_2d(np.asarray(universe['revenue'], dtype=dtype))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        series = {'ebit': ebit, 'margin': ebit / revenue}
+
+    tickers = np.atleast_1d(np.asarray(universe['ticker']))
+    years = np.asarray(universe['year'])
+    columns = {'ticker': [], 'year': [], 'series': [], 'value': [], 'zscore': []}
+    for name, panel in series.items():
+        z = zscores(panel, method)
+        company, year = np.nonzero((np.abs(z) > threshold) | ~np.isfinite(panel))
+        columns['ticker'].append(tickers[company])
+        columns['year'].append(years[year])
+        columns['series'].append(np.full(company.size, name))
+        columns['value'].append(panel[company, year])
+        columns['zscore'].append(z[company, year])
+
+    table = {name: np.concatenate(parts) for name, parts in columns.items()}
+    order = np.argsort(-np.abs(table['zscore']), kind='stable')
+    return {name: values[order] for name, values in table.items()}
+
+
+def flag_counts(table, tickers):
+    """Number of flagged years per ticker (zero for clean companies); flags on other tickers are ignored"""
+    tickers = np.asarray(tickers)
+    flagged = table['ticker'][np.isin(table['ticker'], tickers)]
+    order = np.argsort(tickers)
+    position = order[np.searchsorted(tickers, flagged, sorter=order)]
+    return np.bincount(position, minlength=tickers.size)
@@ -0,0 +1,150 @@
+"""
+EPV Signal Backtest
+Point-in-time zone signals turned into rebalanced portfolios, vectorized over tickers and dates
+"""
+
+import numpy as np
+
+from epv_screening import UNRATED, ZONE_LABELS, ZONE_RULES, classify_zones
+from epv_timeseries import downsample
+
+TRADING_DAYS = 252
+
+# One backtest configuration; param sets override any of these
+BACKTEST_DEFAULTS = {
+    'rules': 'wacc_sensitivity',
+    'min_zone': 'Buy',       # hold names in this zone or better
+    'rebalance': 'M',        # W / M / Q / Y, on each period's last trading day
+    'cost_bps': 10.0         # one-way cost on traded weight
+}
+
+# Worker-process copies of the panels (set once per process by the pool initializer)
+_PANELS = {}
+
+
+def zone_signals(prices, aligned_epv, rules='wacc_sensitivity'):
+    """Zone code (0=Overvalued ... 3=Strong Buy) per ticker and day; -1 (UNRATED) before any valuation"""
+    zones = classify_zones(aligned_epv, prices, rules)
+    return np.where(prices > 0, zones, np.int8(UNRATED)).astype(np.int8)
+
+
+def carry_prices(prices):
+    """Forward-fill each ticker's last traded (finite) price over later gaps, e.g. after a delisting"""
+    position = np.where(np.isfinite(prices), np.arange(prices.shape[1]), 0)
+    np.maximum.accumulate(position, axis=1, out=position)
+    return np.take_along_axis(prices, position, axis=1)
+
+
+def rebalance_days(dates, freq='M'):
+    """Indices of each period's last trading day"""
+    return downsample(dates, np.arange(dates.size), freq, how='last')[1]
+
+
+def max_drawdown(equity):
+    """Largest peak-to-trough loss of an equity curve (a positive fraction)"""
+    return float(np.max(1 - equity / np.maximum.accumulate(equity)))
+
+
+def simulate_portfolio(prices, aligned_epv, dates, params=None):
+    """Equal-weight portfolio of names in ``min_zone`` or better, rebalanced each period.
+
+    Signals use the EPV known at each rebalance close (aligned_epv must be
+    point-in-time, e.g. from asof_align), and positions earn returns from the
+    next day on. Within a period holdings drift buy-and-hold, so daily equity
+    is the weighted sum of price relatives to the last rebalance. Costs are
+    charged on the change in weights at every rebalance. A held name whose
+    price goes missing is valued at its last traded price until the next
+    rebalance, which drops it.
+    """
+    params = dict(BACKTEST_DEFAULTS, **(params or {}))
+    min_zone = params['min_zone']
+    min_zone = int(np.flatnonzero(ZONE_LABELS == min_zone)[0]) if isinstance(min_zone, str) else min_zone
+    rebalance = rebalance_days(dates, params['rebalance'])
+
+    # Holdings chosen at each rebalance close: (tickers x rebalances)
+    held = zone_signals(prices[:, rebalance], aligned_epv[:, rebalance], params['rules']) >= min_zone
+    counts = held.sum(axis=0)
+    weights = held / np.maximum(counts, 1)
+
+    # Each day's holding period is the last rebalance strictly before it
+    period = np.searchsorted(rebalance, np.arange(dates.size), side='left') - 1
+    invested = period >= 0
+    days = np.flatnonzero(invested)
+    start = rebalance[period[days]]
+    carried = carry_prices(prices)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Held names have a price at their rebalance; unheld ones carry zero weight
+        relative = np.nan_to_num(carried[:, days] / prices[:, start], nan=1.0, posinf=1.0, neginf=1.0)
+    growth = np.ones(dates.size)
+    growth[days] = np.einsum('td,td->d', weights[:, period[days]], relative)
+    growth[days[counts[period[days]] == 0]] = 1
+
+    # Period-end growth compounds into each period's starting equity, net of costs
+    traded = np.abs(np.diff(weights, axis=1, prepend=0)).sum(axis=0)
+    cost = 1 - traded * params['cost_bps'] / 1e4
+    period_growth = np.append(growth[rebalance[1:]], growth[-1])
+    start_equity = np.cumprod(np.r_[1.0, period_growth[:-1] * cost[:-1]]) * cost
+    equity = np.where(invested, start_equity[np.maximum(period, 0)] * growth, 1.0)
+    return {'params': params, 'equity': equity, 'rebalance': rebalance, 'holdings': counts,
+            'turnover': traded}
+
+
+def performance(equity):
+    """Total return, CAGR, volatility, Sharpe (zero rate) and max drawdown of a daily equity curve"""
+    returns = equity[1:] / equity[:-1] - 1
+    years = equity.size / TRADING_DAYS
+    vol = returns.std() * np.sqrt(TRADING_DAYS)
+    cagr = equity[-1] ** (1 / years) - 1
+    return {
+        'total_return': float(equity[-1] - 1),
+        'cagr': float(cagr),
+        'volatility': float(vol),
+        'sharpe': float(returns.mean() * TRADING_DAYS / vol) if vol > 0 else np.nan,
+        'max_drawdown': max_drawdown(equity)
+    }
+
+
+def backtest(prices, aligned_epv, dates, params=None):
+    """One parameter set: strategy vs an equal-weight benchmark of every valued name"""
+    result = simulate_portfolio(prices, aligned_epv, dates, params)
+    benchmark = simulate_portfolio(prices, aligned_epv, dates,
+                                   dict(result['params'], min_zone=0))
+    stats = performance(result['equity'])
+    stats['benchmark_cagr'] = performance(benchmark['equity'])['cagr']
+    stats['excess_cagr'] = stats['cagr'] - stats['benchmark_cagr']
+    stats['avg_holdings'] = float(result['holdings'].mean())
+    stats['avg_turnover'] = float(result['turnover'][1:].mean()) if result['turnover'].size > 1 else 0.0
+    return dict(result, benchmark_equity=benchmark['equity'], stats=stats)
+
+
+def _init_worker(prices, aligned_epv, dates):
+    """Keep the panels in each worker process so tasks only carry parameters"""
+    _PANELS.update(prices=prices, aligned_epv=aligned_epv, dates=dates)
+
+
+def _backtest_task(params):
+    result = backtest(_PANELS['prices'], _PANELS['aligned_epv'], _PANELS['dates'], params)
+    return dict(result['stats'], **result['params'])
+
+
+def run_backtests(prices, aligned_epv, dates, param_sets, workers=1):
+    """Summary stats for every parameter set (one row per set), across worker processes"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    param_sets = [dict(BACKTEST_DEFAULTS, **params) for params in param_sets]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(prices, aligned_epv, dates)) as pool:
+            return list(pool.map(_backtest_task, param_sets))
+    _init_worker(prices, aligned_epv, dates)
+    try:
+        return [_backtest_task(params) for params in param_sets]
+    finally:
+        _PANELS.clear()
+
+
+def parameter_grid(rules=tuple(ZONE_RULES), min_zones=('Buy', 'Strong Buy'), rebalance=('M', 'Q'),
+                   cost_bps=(BACKTEST_DEFAULTS['cost_bps'],)):
+    """Every combination of the given settings as a list of param sets"""
+    return [{'rules': r, 'min_zone': z, 'rebalance': f, 'cost_bps': c}
+            for r in rules for z in min_zones for f in rebalance for c in cost_bps]
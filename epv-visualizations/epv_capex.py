@@ -0,0 +1,54 @@
+"""
+Maintenance Capex Estimation
+Greenwald's growth-capex back-out from PP&E/sales and sales growth, for every company at once
+"""
+
+import numpy as np
+
+from epv_engine import resolve_dtype
+
+
+def estimate_maint_capex(universe, precision='float64'):
+    """Maintenance capex panels estimated from total capex, PP&E and revenue.
+
+    Growth capex is the capital needed to support the year's sales increase:
+    average PP&E/sales x the rise in sales (no credit for falling sales).
+    Maintenance capex is the rest of total capex, kept within [0, total].
+    The first year has no prior sales, so its growth capex is the average of
+    the later years' ratio of growth to total capex, applied to its capex.
+    Returns (companies x years) panels plus per-company summary ratios.
+    """
+    dtype = resolve_dtype(precision)
+    revenue = np.asarray(universe['revenue'], dtype=dtype)
+    total_capex = np.asarray(universe['total_capex'], dtype=dtype)
+    depreciation = np.asarray(universe['depreciation'], dtype=dtype)
+    ppe = np.asarray(universe['ppe'], dtype=dtype)
+
+    ppe_to_sales = (ppe / revenue).mean(axis=-1, keepdims=True)
+    sales_growth = np.maximum(np.diff(revenue, axis=-1), 0)
+    growth_capex = np.minimum(ppe_to_sales * sales_growth, total_capex[..., 1:])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth_share = np.nan_to_num((growth_capex / total_capex[..., 1:]).mean(axis=-1, keepdims=True))
+    growth_capex = np.concatenate([total_capex[..., :1] * growth_share, growth_capex], axis=-1)
+    maint_capex = np.clip(total_capex - growth_capex, 0, None)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sustainability_ratio = (maint_capex / depreciation).mean(axis=-1)
+        capex_intensity = (total_capex / ppe).mean(axis=-1)
+    return {
+        'maint_capex': maint_capex,
+        'growth_capex': growth_capex,
+        'ppe_to_sales': ppe_to_sales[..., 0],
+        'sustainability_ratio': sustainability_ratio,
+        'capex_intensity': capex_intensity
+    }
+
+
+def with_estimated_maint_capex(universe, precision='float64'):
+    """Copy of a universe (or company_record) whose maint_capex panel is the Greenwald estimate.
+
+    The result goes straight into batch_epv, epv_inputs, company_metrics, etc.
+    """
+    estimated = dict(universe)
+    estimated['maint_capex'] = estimate_maint_capex(universe, precision)['maint_capex']
+    return estimated
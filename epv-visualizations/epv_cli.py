@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+EPV Command-Line Entry Point
+Select plots, companies, output formats and worker counts instead of running every suite
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from plot_registry import PLOT_REGISTRY, PlotRun, required_modules
+
+DEFAULT_PLOTS = ['ebit', 'capex', 'epv-dcf', 'wacc', 'waterfall', 'football-field']
+
+FORMATS = ('show', 'png', 'svg', 'pdf', 'html', 'json')
+MATPLOTLIB_FORMATS = {'png', 'svg', 'pdf'}
+METRICS_FORMATS = {'csv': 'csv', 'parquet': 'parquet', 'arrow': 'arrow'}  # format -> file extension
+
+SAMPLE_TICKER = 'SAMPLE'
+
+# Companies per simulation block; each block has its own seed, so results do not depend on --workers
+SIMULATION_BLOCK = 256
+SIMULATION_SEED = 42
+
+# Plots with a template-reuse batch renderer (epv_batch_render) for universe runs
+BATCH_PAGES = {'ebit-professional': 'ebit', 'capex-professional': 'capex'}
+
+
+def parse_args(argv=None):
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(
+        description="Render selected EPV dashboards or compute EPV metrics for selected companies")
+    parser.add_argument('--plots', nargs='+', default=DEFAULT_PLOTS, metavar='PLOT',
+                        help=f"plots to render, or 'all' (choices: {', '.join(PLOT_REGISTRY)})")
+    parser.add_argument('--companies', nargs='+', metavar='TICKER',
+                        help="tickers from the universe (default: the built-in sample company)")
+    parser.add_argument('--universe-size', type=int, default=0,
+                        help="size of the synthetic sample universe to select companies from")
+    parser.add_argument('--format', nargs='+', default=['png'], choices=FORMATS, dest='formats',
+                        help="output formats; 'show' opens interactive windows")
+    parser.add_argument('--output-dir', default='epv_output',
+                        help="directory for rendered files and computed metrics")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes for rendering or simulation")
+    parser.add_argument('--compute-only', action='store_true',
+                        help="compute EPV metrics without importing or rendering any plots")
+    parser.add_argument('--precision', default='float64', choices=('float64', 'float32'),
+                        help="floating-point precision for the batch engines")
+    parser.add_argument('--simulations', type=int, default=2000,
+                        help="Monte Carlo draws per company in compute-only mode")
+    parser.add_argument('--metrics-format', default='csv', choices=METRICS_FORMATS,
+                        help="file format for compute-only metrics (parquet/arrow need pyarrow)")
+    parser.add_argument('--maint-capex', default='reported', choices=('reported', 'greenwald'),
+                        help="maintenance capex as reported, or estimated from PP&E/sales and sales growth")
+    parser.add_argument('--anomalies', choices=('std', 'robust'),
+                        help="in compute-only mode, also write out-of-band EBIT/margin years "
+                             "(mean/std or median/MAD z-scores)")
+    parser.add_argument('--stress', action='store_true',
+                        help="in compute-only mode, also write EPV changes under every registered shock path")
+    parser.add_argument('--store', metavar='PATH',
+                        help="SQLite fundamentals store to load the universe from (an empty store is "
+                             "filled with the --universe-size sample); compute-only saves metrics to it")
+    args = parser.parse_args(argv)
+
+    if 'all' in args.plots:
+        args.plots = list(PLOT_REGISTRY)
+    unknown = [name for name in args.plots if name not in PLOT_REGISTRY]
+    if unknown:
+        parser.error(f"unknown plot(s): {', '.join(unknown)}")
+    if args.companies and not (args.universe_size or args.store):
+        parser.error("--companies selects from a universe; pass --universe-size or --store as well")
+    return args
+
+
+def load_universe(args):
+    """Universe and selected tickers, or (None, [SAMPLE_TICKER]) for the built-in company"""
+    if args.store:
+        universe = apply_maint_capex(load_store_universe(args), args)
+    elif args.universe_size:
+        from epv_universe import make_sample_universe
+        universe = apply_maint_capex(make_sample_universe(args.universe_size, precision=args.precision), args)
+    else:
+        return None, [SAMPLE_TICKER]
+    tickers = args.companies or list(universe['ticker'])
+    unknown = sorted(set(tickers) - set(universe['ticker'].tolist()))
+    if unknown:
+        sys.exit(f"❌ Ticker(s) not in the universe: {', '.join(unknown)}")
+    return universe, tickers
+
+
+def select_companies(universe, tickers):
+    """The selected companies' rows, in universe order (the year axis is shared)"""
+    selected = np.flatnonzero(np.isin(universe['ticker'], tickers))
+    return {name: (values if name == 'year' else values[selected]) for name, values in universe.items()}
+
+
+def load_store_universe(args):
+    """Universe from the --store database (warm starts read its snapshot)"""
+    from epv_store import FundamentalsStore
+    with FundamentalsStore(args.store) as store:
+        if not store.tickers():
+            if not args.universe_size:
+                sys.exit(f"❌ Store {args.store} is empty; pass --universe-size to fill it with the sample universe")
+            from epv_universe import make_sample_universe
+            store.write_universe(make_sample_universe(args.universe_size))
+        return store.load_universe(precision=args.precision)
+
+
+def apply_maint_capex(universe, args):
+    """Swap in Greenwald maintenance capex estimates when requested"""
+    if args.maint_capex == 'greenwald':
+        from epv_capex import with_estimated_maint_capex
+        universe = with_estimated_maint_capex(universe, args.precision)
+    return universe
+
+
+def save_figure(fig, path_stem, formats):
+    """Write one matplotlib or plotly figure in every requested format it supports"""
+    from epv_serialize import write_figure_html, write_figure_json
+    is_matplotlib = hasattr(fig, 'savefig')
+    written = []
+    for fmt in formats:
+        if fmt == 'show':
+            continue
+        path = f"{path_stem}.{fmt}"
+        if is_matplotlib:
+            if fmt not in MATPLOTLIB_FORMATS:
+                print(f"⚠️  Skipping {path}: matplotlib figures support {', '.join(sorted(MATPLOTLIB_FORMATS))}")
+                continue
+            fig.savefig(path, dpi=100, bbox_inches='tight')
+        elif fmt == 'html':
+            from epv_interactive import slider_script
+            write_figure_html(fig, path, include_plotlyjs='cdn', post_script=slider_script(fig))
+        elif fmt == 'json':
+            write_figure_json(fig, path)
+        elif importlib.util.find_spec('kaleido') is None:
+            print(f"⚠️  Skipping {path}: plotly image export requires the kaleido package")
+            continue
+        else:
+            fig.write_image(path)
+        written.append(path)
+    return written
+
+
+def render_company(task):
+    """Render the selected plots for one company (runs inside worker processes)"""
+    company, plot_names, formats, output_dir, precision = task
+    show = 'show' in formats
+    import matplotlib
+    if not show:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    ticker = company['ticker'] if company is not None else SAMPLE_TICKER
+    run = PlotRun(company=company, precision=precision)
+    written = []
+    for name in plot_names:
+        fig = run.render(name, show=show)
+        written += save_figure(fig, os.path.join(output_dir, f"{ticker}_{name}"), formats)
+        if hasattr(fig, 'savefig'):
+            plt.close(fig)
+    return written
+
+
+def simulate_chunk(task):
+    """Simulated EPV percentiles for one slice of the universe (worker process)"""
+    source, lo, hi, n_sims, precision, seed = task
+    from epv_monte_carlo import simulate_universe_percentiles
+    from epv_shared import attach_universe, slice_universe
+    universe = slice_universe(attach_universe(source), lo, hi)
+    return simulate_universe_percentiles(universe, n_sims=n_sims, precision=precision, seed=seed)
+
+
+def compute_metrics(subset, args):
+    """Batch EPV statistics, screening zones and simulated percentiles for the selected companies"""
+    from epv_export import company_metrics
+    from epv_shared import SharedUniverse
+
+    # Fixed-size blocks with seeds spawned from one SeedSequence, so percentiles are the same
+    # for any --workers; workers attach to one shared-memory copy of the subset
+    n_companies = subset['ticker'].size
+    bounds = list(range(0, n_companies, SIMULATION_BLOCK)) + [n_companies]
+    seeds = np.random.SeedSequence(SIMULATION_SEED).spawn(len(bounds) - 1)
+    blocks = list(zip(bounds[:-1], bounds[1:], seeds))
+    if args.workers > 1:
+        with SharedUniverse(subset) as shared, ProcessPoolExecutor(max_workers=args.workers) as pool:
+            tasks = [(shared.manifest, lo, hi, args.simulations, args.precision, seed)
+                     for lo, hi, seed in blocks]
+            chunks = list(pool.map(simulate_chunk, tasks))
+    else:
+        chunks = [simulate_chunk((subset, lo, hi, args.simulations, args.precision, seed))
+                  for lo, hi, seed in blocks]
+    percentiles = {p: np.concatenate([chunk[p] for chunk in chunks]) for p in chunks[0]}
+
+    return company_metrics(subset, percentiles, precision=args.precision)
+
+
+def run_compute_only(args):
+    """Compute-only mode: no plotting modules are imported"""
+    universe, tickers = load_universe(args)
+    if universe is None:
+        from epv_universe import sample_company_universe
+        universe = apply_maint_capex(sample_company_universe(SAMPLE_TICKER, precision=args.precision), args)
+
+    subset = select_companies(universe, tickers)
+    metrics = compute_metrics(subset, args)
+
+    import pandas as pd
+    os.makedirs(args.output_dir, exist_ok=True)
+    metrics_df = pd.DataFrame(metrics)
+    path = os.path.join(args.output_dir, f"epv_metrics.{METRICS_FORMATS[args.metrics_format]}")
+    if args.metrics_format == 'csv':
+        metrics_df.to_csv(path, index=False)
+    else:
+        from epv_export import write_metrics
+        write_metrics(metrics, path, fmt=args.metrics_format)
+
+    print(f"🧮 Computed EPV metrics for {len(metrics_df):,} companies → {path}")
+    if args.store:
+        from epv_store import FundamentalsStore
+        with FundamentalsStore(args.store) as store:
+            store.write_metrics(metrics)
+    if args.anomalies:
+        from epv_anomaly import scan_anomalies
+        anomalies = pd.DataFrame(scan_anomalies(subset, method=args.anomalies, precision=args.precision))
+        anomaly_path = os.path.join(args.output_dir, 'epv_anomalies.csv')
+        anomalies.to_csv(anomaly_path, index=False)
+        print(f"🚩 Flagged {len(anomalies):,} out-of-band EBIT/margin years → {anomaly_path}")
+    if args.stress:
+        from epv_stress import NO_SHOCK, stress_epv
+        stress = stress_epv(subset, precision=args.precision)
+        stress_df = pd.DataFrame({'ticker': subset['ticker'], 'epv_per_share': stress['base_epv']})
+        for shock, delta in zip(stress['shocks'], stress['delta']):
+            stress_df[f"{shock} delta"] = delta
+        stress_df['worst_shock'] = np.where(stress['worst_shock'] == NO_SHOCK, '',
+                                            stress['shocks'][stress['worst_shock']])
+        stress_df['worst_price_impact'] = stress['worst_price_impact']
+        stress_path = os.path.join(args.output_dir, 'epv_stress.csv')
+        stress_df.sort_values('worst_price_impact').to_csv(stress_path, index=False)
+        print(f"🌪️  Stressed {len(stress_df):,} companies under {len(stress['shocks'])} shock paths → {stress_path}")
+    summary_columns = ['ticker', 'normalized_ebit', 'maint_capex', 'epv_per_share', 'epv_p10', 'epv_p50',
+                       'epv_p90', 'price', 'margin_of_safety', 'zone']
+    print(metrics_df[summary_columns].head(10).to_string(index=False))
+    return metrics_df
+
+
+def run_render(args):
+    """Render the selected plots for every selected company"""
+    universe, tickers = load_universe(args)
+    companies = [None]
+    if universe is not None:
+        from epv_engine import batch_epv
+        from epv_universe import company_record
+        epv = batch_epv(universe, precision=args.precision)['epv_per_share']
+        companies = [company_record(universe, ticker, epv) for ticker in tickers]
+        if 'football-field' in args.plots:
+            from epv_peers import universe_comparable_range
+            comparable = universe_comparable_range(universe, epv)
+            rows = {ticker: i for i, ticker in enumerate(universe['ticker'])}
+            for company in companies:
+                company['comparable_range'] = {
+                    bound: float(values[rows[company['ticker']]]) for bound, values in comparable.items()}
+
+    plots = list(args.plots)
+    batch_written = []
+    if universe is not None and 'show' not in args.formats:
+        batch = [name for name in plots if name in BATCH_PAGES]
+        plots = [name for name in plots if name not in BATCH_PAGES]
+        if batch:
+            from epv_batch_render import render_universe
+            print(f"🧩 Template rendering: {', '.join(batch)}")
+            for fmt in args.formats:
+                if fmt in MATPLOTLIB_FORMATS:
+                    batch_written += render_universe(
+                        universe, tickers, pages=[BATCH_PAGES[name] for name in batch],
+                        output_dir=args.output_dir, fmt=fmt, workers=args.workers)
+
+    generic = [name for name in plots if not PLOT_REGISTRY[name]['company_aware']]
+    if universe is not None and generic:
+        print(f"ℹ️  {', '.join(generic)} use built-in sample data, not the selected companies")
+    if plots:
+        print(f"📦 Loading modules: {', '.join(required_modules(plots))}")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    tasks = [(company, plots, args.formats, args.output_dir, args.precision)
+             for company in companies] if plots else []
+
+    # Interactive windows cannot be shown from worker processes
+    if args.workers > 1 and 'show' not in args.formats:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(render_company, tasks))
+    else:
+        results = [render_company(task) for task in tasks]
+
+    results.append(batch_written)
+    n_files = sum(len(paths) for paths in results)
+    print(f"\n✅ Rendered {len(args.plots)} plot(s) for {len(companies)} company(ies): "
+          f"{n_files} file(s) in {args.output_dir}")
+    return results
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.compute_only:
+        run_compute_only(args)
+    else:
+        run_render(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
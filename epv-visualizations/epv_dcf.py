@@ -0,0 +1,105 @@
+"""
+Batch DCF Engine
+Explicit-period plus Gordon-growth DCF, broadcast over growth x WACC x company
+"""
+
+import numpy as np
+
+from epv_engine import batch_epv, resolve_dtype
+
+# Growth scenarios shown on the EPV vs DCF dashboards
+DCF_GROWTH_RATES = (0.00, 0.02, 0.04, 0.06)
+
+# Years of explicit growth before the terminal value
+DCF_YEARS = 10
+
+# Perpetual growth never exceeds long-run nominal GDP growth
+TERMINAL_GROWTH_CAP = 0.03
+
+# WACC shift either side of the base rate for the football fields' DCF low/high
+DCF_RANGE_WACC_STEP = 0.01
+
+
+def dcf_value(cash_flow, wacc, growth, years=DCF_YEARS, terminal_growth=None, dtype=None):
+    """DCF of a base cash flow growing at ``growth`` for ``years``, then at ``terminal_growth``.
+
+    All inputs broadcast against each other (e.g. growth[:, None, None],
+    wacc[None, :, None], cash_flow[None, None, :]). The explicit period uses
+    the closed-form sum of discounted growth factors, so cost does not grow
+    with ``years``. ``terminal_growth`` defaults to the explicit growth capped
+    at TERMINAL_GROWTH_CAP; with zero growth the DCF equals cash_flow / wacc,
+    the EPV. Terminal growth at or above WACC gives NaN.
+    """
+    if dtype is not None:
+        cash_flow, wacc, growth = (np.asarray(x, dtype=dtype) for x in (cash_flow, wacc, growth))
+    cash_flow, wacc, growth = np.asarray(cash_flow), np.asarray(wacc), np.asarray(growth)
+    if terminal_growth is None:
+        terminal_growth = np.minimum(growth, TERMINAL_GROWTH_CAP)
+    terminal_growth = np.asarray(terminal_growth, dtype=np.result_type(growth, wacc))
+
+    # sum_{t=1..N} q^t with q = (1 + g) / (1 + r); equals N when g == r
+    q = (1 + growth) / (1 + wacc)
+    q_n = q ** years
+    with np.errstate(divide='ignore', invalid='ignore'):
+        annuity = np.where(np.isclose(q, 1), years, q * (1 - q_n) / (1 - q))
+        terminal_multiple = np.where(terminal_growth < wacc,
+                                     (1 + terminal_growth) / (wacc - terminal_growth), np.nan)
+
+    pv_explicit = cash_flow * annuity
+    # Year-N cash flow capitalized at the terminal multiple, discounted N years
+    pv_terminal = cash_flow * q_n * terminal_multiple
+    value = pv_explicit + pv_terminal
+    return {
+        'pv_explicit': pv_explicit,
+        'pv_terminal': pv_terminal,
+        'value': value,
+        'terminal_multiple': terminal_multiple,
+        'terminal_share': pv_terminal / value
+    }
+
+
+def batch_dcf(universe, growth_rates=DCF_GROWTH_RATES, wacc=None, years=DCF_YEARS,
+              terminal_growth=None, precision='float64'):
+    """DCF per share for every company and growth rate (and WACC, if a range is given).
+
+    Cash flows are the EPV engine's distributable earnings, so at zero growth
+    the DCF matches batch_epv exactly. Results are (growth x companies), or
+    (growth x wacc x companies) when ``wacc`` is an array of rates to test
+    instead of each company's own.
+    """
+    dtype = resolve_dtype(precision)
+    epv = batch_epv(universe, precision=precision)
+    cash_flow = epv['distributable_earnings']
+    net_debt = np.asarray(universe['net_debt'], dtype=dtype)
+    shares = np.asarray(universe['shares'], dtype=dtype)
+    growth = np.asarray(growth_rates, dtype=dtype)
+
+    if wacc is None:
+        growth = growth[:, np.newaxis]
+        rates = np.asarray(universe['wacc'], dtype=dtype)
+    else:
+        growth = growth[:, np.newaxis, np.newaxis]
+        rates = np.asarray(wacc, dtype=dtype)[:, np.newaxis]
+    if terminal_growth is not None:
+        terminal_growth = np.asarray(terminal_growth, dtype=dtype)
+
+    dcf = dcf_value(cash_flow, rates, growth, years, terminal_growth, dtype=dtype)
+    dcf['enterprise_value'] = dcf.pop('value')
+    dcf['dcf_per_share'] = (dcf['enterprise_value'] - net_debt) / shares
+    dcf['epv_per_share'] = epv['epv_per_share']
+    return dcf
+
+
+def dcf_scenarios(earnings, wacc, growth_rates=DCF_GROWTH_RATES, years=DCF_YEARS,
+                  terminal_growth=None):
+    """Per-share DCF value and implied terminal multiple for each growth scenario.
+
+    ``earnings`` are distributable earnings per share (the dashboards'
+    normalized earnings). Returns plain lists ready for a DataFrame.
+    """
+    dcf = dcf_value(earnings, wacc, np.asarray(growth_rates, dtype=float), years, terminal_growth)
+    return {
+        'growth_rate': [f"{g:.0%}" for g in growth_rates],
+        'value': np.round(dcf['value'], 2).tolist(),
+        'terminal_multiple': np.round(dcf['terminal_multiple'], 1).tolist()
+    }
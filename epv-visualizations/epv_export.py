@@ -0,0 +1,154 @@
+"""
+Columnar Metrics Export
+Per-company EPV statistics written to Arrow IPC or Parquet under one stable schema
+"""
+
+import os
+
+import numpy as np
+
+from epv_engine import EPV_SCENARIO_FACTORS, batch_epv
+from epv_monte_carlo import REPORT_PERCENTILES
+from epv_screening import classify_zones, margin_of_safety, zone_labels
+
+SCHEMA_VERSION = '1'
+
+# Column order and Arrow types are part of the contract; add columns at the end only.
+# Ratios are fractions (0.19, not 19%); scores run 0-100; money is $ millions or $/share.
+METRICS_SCHEMA = (
+    ('ticker', 'string'),
+    # EBIT normalization
+    ('normalized_ebit', 'float64'),
+    ('ebit_std', 'float64'),
+    ('ebit_cv', 'float64'),
+    ('consistency_score', 'float64'),
+    ('avg_margin', 'float64'),
+    ('margin_volatility', 'float64'),
+    # Maintenance capex
+    ('maint_capex', 'float64'),
+    ('growth_capex', 'float64'),
+    ('maint_ratio', 'float64'),
+    ('sustainability_ratio', 'float64'),
+    ('capex_intensity', 'float64'),
+    # Valuation
+    ('distributable_earnings', 'float64'),
+    ('epv_conservative', 'float64'),
+    ('epv_per_share', 'float64'),
+    ('epv_optimistic', 'float64'),
+    *((f'epv_p{p}', 'float64') for p in REPORT_PERCENTILES),
+    ('price', 'float64'),
+    ('margin_of_safety', 'float64'),
+    ('zone', 'string')
+)
+
+# Column name per EPV_SCENARIO_FACTORS entry
+SCENARIO_COLUMNS = dict(zip(EPV_SCENARIO_FACTORS,
+                            ('epv_conservative', 'epv_per_share', 'epv_optimistic')))
+
+# File extension -> writer
+FORMATS = {'.parquet': 'parquet', '.pq': 'parquet', '.arrow': 'arrow', '.feather': 'arrow',
+           '.ipc': 'arrow'}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Arrow/Parquet export requires the pyarrow package "
+                          "(pip install pyarrow)") from None
+    return pyarrow
+
+
+def company_metrics(universe, percentiles=None, precision='float64'):
+    """Every exported statistic for every company, as a dict of column arrays.
+
+    ``percentiles`` maps percentile -> simulated EPV per company (from
+    simulate_universe_percentiles); without it those columns are NaN.
+    """
+    ebit = np.asarray(universe['ebit'], dtype=float)
+    revenue = np.asarray(universe['revenue'], dtype=float)
+    total_capex = np.asarray(universe['total_capex'], dtype=float)
+    maint_capex = np.asarray(universe['maint_capex'], dtype=float)
+    depreciation = np.asarray(universe['depreciation'], dtype=float)
+    ppe = np.asarray(universe['ppe'], dtype=float)
+    price = np.asarray(universe['price'], dtype=float)
+    n = ebit.shape[0]
+
+    epv = batch_epv(universe, precision=precision)
+    normalized_ebit = ebit.mean(axis=1)
+    ebit_std = ebit.std(axis=1, ddof=1)
+    margin = ebit / revenue
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ebit_cv = ebit_std / normalized_ebit
+        margin_volatility = margin.std(axis=1, ddof=1) / margin.mean(axis=1)
+
+    base = np.asarray(epv['epv_per_share'], dtype=float)
+    metrics = {
+        'ticker': np.asarray(universe['ticker']).astype(str),
+        'normalized_ebit': normalized_ebit,
+        'ebit_std': ebit_std,
+        'ebit_cv': ebit_cv,
+        'consistency_score': 100 - ebit_cv * 100,
+        'avg_margin': margin.mean(axis=1),
+        'margin_volatility': margin_volatility,
+        'maint_capex': maint_capex.mean(axis=1),
+        'growth_capex': (total_capex - maint_capex).mean(axis=1),
+        'maint_ratio': maint_capex.sum(axis=1) / total_capex.sum(axis=1),
+        'sustainability_ratio': (maint_capex / depreciation).mean(axis=1),
+        'capex_intensity': (total_capex / ppe).mean(axis=1),
+        'distributable_earnings': np.asarray(epv['distributable_earnings'], dtype=float)
+    }
+    for name, factor in EPV_SCENARIO_FACTORS.items():
+        metrics[SCENARIO_COLUMNS[name]] = base * factor
+    for p in REPORT_PERCENTILES:
+        values = (percentiles or {}).get(p)
+        metrics[f'epv_p{p}'] = np.full(n, np.nan) if values is None else np.asarray(values, dtype=float)
+    metrics['price'] = price
+    metrics['margin_of_safety'] = margin_of_safety(base, price)
+    metrics['zone'] = zone_labels(classify_zones(base, price))
+    return metrics
+
+
+def arrow_schema():
+    """METRICS_SCHEMA as a pyarrow schema carrying the schema version"""
+    pa = _require_pyarrow()
+    return pa.schema([(name, getattr(pa, arrow_type)()) for name, arrow_type in METRICS_SCHEMA],
+                     metadata={'epv_metrics_schema_version': SCHEMA_VERSION})
+
+
+def metrics_table(metrics):
+    """Columns from company_metrics as a pyarrow Table in schema order"""
+    pa = _require_pyarrow()
+    schema = arrow_schema()
+    missing = [field.name for field in schema if field.name not in metrics]
+    if missing:
+        raise KeyError(f"Metrics are missing schema columns: {', '.join(missing)}")
+    columns = [pa.array(metrics[field.name], type=field.type) for field in schema]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def write_metrics(metrics, path, fmt=None):
+    """Write metrics to Parquet or Arrow IPC (format from ``fmt`` or the file extension)"""
+    fmt = fmt or FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt not in ('parquet', 'arrow'):
+        raise ValueError(f"Cannot infer an export format for '{path}'. "
+                         f"Use one of: {', '.join(FORMATS)} or pass fmt='parquet'/'arrow'")
+    table = metrics_table(metrics)
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, path)
+    else:
+        import pyarrow.feather as feather
+        # Uncompressed IPC so readers can memory-map the columns without copying
+        feather.write_feather(table, path, compression='uncompressed')
+    return path
+
+
+def read_metrics(path):
+    """Load exported metrics as a pyarrow Table (Arrow IPC files are memory-mapped)"""
+    pa = _require_pyarrow()
+    if FORMATS.get(os.path.splitext(path)[1].lower()) == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.read_table(path)
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).read_all()
@@ -0,0 +1,100 @@
+"""
+Interactive EPV Frames
+Precomputed scenario x WACC x tax x capex EPV cubes embedded in plotly HTML for browser-side sliders
+"""
+
+import base64
+
+import numpy as np
+
+from epv_engine import resolve_dtype
+
+# Tax-rate shifts and maintenance capex multiples offered by the sliders
+TAX_SHIFTS = (-0.05, -0.04, -0.03, -0.02, -0.01, 0.00, 0.01, 0.02, 0.03, 0.04, 0.05)
+CAPEX_FACTORS = (0.80, 0.85, 0.90, 0.95, 1.00, 1.05, 1.10, 1.15, 1.20)
+
+# Cube axes, in storage order (the last axis varies fastest)
+CUBE_AXES = ('scenario', 'wacc', 'tax', 'capex')
+
+# 250k float32 values = 1 MB raw, ~1.3 MB base64: the cap on embedded HTML size
+MAX_CUBE_VALUES = 250_000
+
+# Runs after Plotly.newPlot; reads the cube from layout.meta and redraws on slider moves
+SLIDER_SCRIPT = """
+var gd = document.getElementById('{plot_id}');
+var cube = gd.layout.meta.epv_cube;
+var raw = atob(cube.data), bytes = new Uint8Array(raw.length);
+for (var i = 0; i < raw.length; i++) { bytes[i] = raw.charCodeAt(i); }
+var values = new Float32Array(bytes.buffer);
+var n = cube.shape;
+function active(name) {
+    var slider = gd.layout.sliders.filter(function (s) { return s.name === name; })[0];
+    return slider.active || 0;
+}
+function redraw() {
+    var w = active('wacc'), t = active('tax'), c = active('capex');
+    var curves = [], picked = [];
+    for (var s = 0; s < n[0]; s++) {
+        var y = new Array(n[1]);
+        for (var k = 0; k < n[1]; k++) { y[k] = values[((s * n[1] + k) * n[2] + t) * n[3] + c]; }
+        curves.push(y);
+        picked.push(y[w]);
+    }
+    var x = cube.wacc[w];
+    Plotly.restyle(gd, {y: curves}, cube.curve_traces);
+    Plotly.restyle(gd, {x: [picked.map(function () { return x; })], y: [picked],
+                        text: [picked.map(function (v) { return '$' + v.toFixed(2); })]},
+                   [cube.marker_trace]);
+    var update = {};
+    update['shapes[' + cube.wacc_shape + '].x0'] = x;
+    update['shapes[' + cube.wacc_shape + '].x1'] = x;
+    Plotly.relayout(gd, update);
+}
+gd.on('plotly_sliderchange', redraw);
+"""
+
+
+def epv_cube(base_earnings, scenario_factors, wacc_range, ebit_per_share, maint_capex_per_share,
+             tax_rate, tax_shifts=TAX_SHIFTS, capex_factors=CAPEX_FACTORS, precision='float64'):
+    """EPV per share for every (scenario, WACC, tax shift, capex factor) as a 4-D array.
+
+    ``base_earnings`` are distributable earnings per share at ``tax_rate`` and
+    base maintenance capex; a tax shift changes them by -EBIT x shift and a
+    capex factor by -(factor - 1) x maintenance capex, before the scenario
+    factor applies. The zero-shift, factor-1 slice equals earnings / WACC.
+    """
+    dtype = resolve_dtype(precision)
+    tax_shifts = np.asarray(tax_shifts, dtype=dtype)
+    capex_factors = np.asarray(capex_factors, dtype=dtype)
+    earnings = (base_earnings
+                - ebit_per_share * tax_shifts[:, np.newaxis]
+                - maint_capex_per_share * (capex_factors - 1))
+    factors = np.asarray(scenario_factors, dtype=dtype)[:, np.newaxis, np.newaxis, np.newaxis]
+    wacc = np.asarray(wacc_range, dtype=dtype)[:, np.newaxis, np.newaxis]
+    return factors * earnings / wacc
+
+
+def encode_cube(cube):
+    """Shape plus base64 little-endian float32 bytes, decodable as a JS Float32Array"""
+    cube = np.asarray(cube)
+    if cube.size > MAX_CUBE_VALUES:
+        raise ValueError(f"EPV cube has {cube.size:,} values; the embedded limit is "
+                         f"{MAX_CUBE_VALUES:,}. Use fewer slider steps")
+    data = np.ascontiguousarray(cube, dtype='<f4').tobytes()
+    return {'shape': list(cube.shape), 'data': base64.b64encode(data).decode('ascii')}
+
+
+def attach_cube(fig, cube, wacc_range, curve_traces, marker_trace, wacc_shape):
+    """Store an encoded cube and the trace/shape indices it drives in fig.layout.meta"""
+    meta = dict(fig.layout.meta or {})
+    meta['epv_cube'] = dict(encode_cube(cube), wacc=np.round(wacc_range, 6).tolist(),
+                            curve_traces=list(curve_traces), marker_trace=marker_trace,
+                            wacc_shape=wacc_shape)
+    fig.update_layout(meta=meta)
+    return fig
+
+
+def slider_script(fig):
+    """post_script for write_html/show when the figure carries a cube, else None"""
+    meta = fig.layout.meta
+    return SLIDER_SCRIPT if isinstance(meta, dict) and 'epv_cube' in meta else None
@@ -0,0 +1,338 @@
+"""
+EPV Monte Carlo Kernel
+Vectorized EPV simulation with adaptive stopping and correlated (Gaussian copula) input sampling
+"""
+
+import numpy as np
+
+from epv_engine import compute_epv, resolve_dtype
+
+# Percentiles reported by the Monte Carlo dashboard
+REPORT_PERCENTILES = (10, 50, 90)
+
+# Adaptive-stopping defaults (overridden by the mc_params['adaptive'] dict)
+ADAPTIVE_DEFAULTS = {
+    'batch_size': 2000,
+    'min_batches': 2,
+    'max_simulations': 200000,
+    'percentile_tolerance': 0.005,  # CI half-width as a fraction of the median EPV
+    'probability_tolerance': 0.005, # CI half-width on upside probability
+    'confidence_z': 1.96
+}
+
+# Inputs in copula order (rows/columns of mc_params['correlation'])
+COPULA_INPUTS = ('ebit', 'wacc', 'tax_rate')
+
+# Bounds on simulated WACC and tax rate (EBIT stays within 0.5x-2x its base)
+WACC_BOUNDS = (0.05, 0.15)
+TAX_BOUNDS = (0.15, 0.35)
+
+
+def draw_inputs(mc_params, n_sims, rng, dtype=np.float64):
+    """Draw clipped EBIT, WACC and tax rate samples for one company.
+
+    With mc_params['correlation'] or mc_params['sampling'] == 'truncated' the
+    draws come from the Gaussian copula in draw_company_inputs instead.
+    """
+    dtype = np.dtype(dtype)
+    base_ebit = dtype.type(mc_params['base_ebit'])
+    base_wacc = dtype.type(mc_params['wacc_base'])
+    tax_rate = dtype.type(mc_params.get('tax_rate', 0.25))
+    if uses_copula(mc_params):
+        return draw_company_inputs(base_ebit, base_wacc, tax_rate, mc_params, n_sims, rng, dtype)
+
+    # Scale standard normals drawn directly in the target precision
+    ebit_draws = rng.standard_normal(n_sims, dtype=dtype)
+    ebit_draws *= base_ebit * dtype.type(mc_params['ebit_volatility'])
+    ebit_draws += base_ebit
+    wacc_draws = rng.standard_normal(n_sims, dtype=dtype)
+    wacc_draws *= dtype.type(mc_params['wacc_volatility'])
+    wacc_draws += base_wacc
+    tax_rate_draws = rng.standard_normal(n_sims, dtype=dtype)
+    tax_rate_draws *= dtype.type(mc_params.get('tax_volatility', 0.02))
+    tax_rate_draws += tax_rate
+
+    # Ensure reasonable bounds
+    np.clip(ebit_draws, base_ebit * dtype.type(0.5), base_ebit * dtype.type(2), out=ebit_draws)
+    np.clip(wacc_draws, dtype.type(0.05), dtype.type(0.15), out=wacc_draws)
+    np.clip(tax_rate_draws, dtype.type(0.15), dtype.type(0.35), out=tax_rate_draws)
+
+    return ebit_draws, wacc_draws, tax_rate_draws
+
+
+def uses_copula(mc_params):
+    """Whether mc_params asks for correlated or truncated input sampling"""
+    return mc_params.get('correlation') is not None or mc_params.get('sampling', 'clip') == 'truncated'
+
+
+def correlated_normals(n_companies, n_sims, correlation, rng, dtype=np.float64, sectors=None,
+                       common_weight=0.0, common=None):
+    """Standard normals (inputs x companies x sims) with the given correlation between inputs.
+
+    ``correlation`` is one (k x k) matrix shared by every company, or a
+    (sectors x k x k) stack with ``sectors`` giving each company's row; all
+    matrices are factored in one batched Cholesky call and applied with one
+    (batched) matrix multiply. ``common_weight`` is the share of each input's
+    variance driven by a factor common to all companies in the same
+    simulation, so portfolio sums see cross-company dependence. Pass the
+    same (sims x k) ``common`` draws to every chunk of one universe so all
+    companies share the factor; it is drawn here when omitted.
+    """
+    dtype = np.dtype(dtype)
+    k = len(COPULA_INPUTS)
+    try:
+        chol = np.linalg.cholesky(np.asarray(correlation, dtype=float)).astype(dtype)
+    except np.linalg.LinAlgError:
+        raise ValueError("Input correlation matrices must be symmetric positive definite") from None
+    if chol.shape[-2:] != (k, k):
+        raise ValueError(f"Correlation must be {k}x{k} over {', '.join(COPULA_INPUTS)}")
+
+    normals = rng.standard_normal((n_companies, n_sims, k), dtype=dtype)
+    if common_weight:
+        normals *= dtype.type(np.sqrt(1 - common_weight))
+        if common is None:
+            common = rng.standard_normal((n_sims, k), dtype=dtype)
+        normals += dtype.type(np.sqrt(common_weight)) * np.asarray(common, dtype=dtype)
+    if chol.ndim == 2:
+        z = normals @ chol.T
+    else:
+        z = normals @ np.swapaxes(chol[np.asarray(sectors)], -1, -2)
+    return np.moveaxis(z, -1, 0)
+
+
+def truncated_normal(z, mean, std, low, high):
+    """N(mean, std) truncated to [low, high] at the same quantile as standard normal z.
+
+    The inverse-CDF map keeps each draw's rank, so copula correlation
+    survives and no probability mass piles up at the bounds as with clipping.
+    """
+    try:
+        from scipy.special import ndtr, ndtri
+    except ImportError:
+        raise ImportError("Truncated sampling requires scipy (pip install scipy)") from None
+    std = np.where(std > 0, std, 1)
+    lower, upper = ndtr((low - mean) / std), ndtr((high - mean) / std)
+    x = mean + std * ndtri(lower + ndtr(z) * (upper - lower))
+    return np.clip(x, low, high).astype(z.dtype)
+
+
+def draw_company_inputs(base_ebit, wacc, tax_rate, mc_params, n_sims, rng, dtype=np.float64,
+                        sectors=None, common=None):
+    """Correlated EBIT, WACC and tax draws for one company (scalars) or many ((companies,) arrays).
+
+    Uses mc_params 'correlation' (identity if absent), 'sampling' ('clip' or
+    'truncated') and 'common_weight' (with the shared ``common`` factor draws,
+    see correlated_normals). Draws are (companies x n_sims), or
+    (n_sims,) for scalar inputs.
+    """
+    dtype = np.dtype(dtype)
+    scalar = np.ndim(base_ebit) == 0
+    base_ebit, wacc, tax_rate = (np.atleast_1d(np.asarray(x, dtype=dtype))[:, np.newaxis]
+                                 for x in (base_ebit, wacc, tax_rate))
+    correlation = mc_params.get('correlation')
+    if correlation is None:
+        correlation = np.eye(len(COPULA_INPUTS))
+    z_ebit, z_wacc, z_tax = correlated_normals(base_ebit.shape[0], n_sims, correlation, rng, dtype,
+                                               sectors, mc_params.get('common_weight', 0.0), common)
+
+    stds = (np.abs(base_ebit) * dtype.type(mc_params.get('ebit_volatility', 0.20)),
+            dtype.type(mc_params.get('wacc_volatility', 0.015)),
+            dtype.type(mc_params.get('tax_volatility', 0.02)))
+    bounds = ((np.minimum(base_ebit * 0.5, base_ebit * 2), np.maximum(base_ebit * 0.5, base_ebit * 2)),
+              WACC_BOUNDS, TAX_BOUNDS)
+    draws = []
+    for z, mean, std, (low, high) in zip((z_ebit, z_wacc, z_tax), (base_ebit, wacc, tax_rate), stds, bounds):
+        if mc_params.get('sampling', 'clip') == 'truncated':
+            draws.append(truncated_normal(z, mean, std, low, high))
+        else:
+            draws.append(np.clip(mean + std * z, low, high).astype(dtype))
+    return tuple(draw[0] for draw in draws) if scalar else tuple(draws)
+
+
+def epv_from_draws(ebit, wacc, tax_rate, maint_capex_pct, shares=100):
+    """EPV per share from simulated inputs (maintenance capex as a share of EBIT)"""
+    maint_capex = ebit * ebit.dtype.type(maint_capex_pct)
+    return compute_epv(ebit, tax_rate, maint_capex, wacc, 0.0, shares, dtype=ebit.dtype)
+
+
+def simulate_epv(mc_params, n_sims=None, seed=42):
+    """Run a fixed-size simulation and return the EPV draws with their inputs"""
+    rng = np.random.default_rng(seed)
+    dtype = resolve_dtype(mc_params.get('precision', 'float64'))
+    n_sims = mc_params['simulations'] if n_sims is None else n_sims
+
+    ebit, wacc, tax_rate = draw_inputs(mc_params, n_sims, rng, dtype)
+    epv = epv_from_draws(ebit, wacc, tax_rate, mc_params['maint_capex_pct'],
+                         mc_params.get('shares', 100))
+    return {'epv': epv, 'ebit': ebit, 'wacc': wacc, 'tax_rate': tax_rate}
+
+
+def percentile_half_widths(sorted_epv, percentiles, z=1.96):
+    """Distribution-free CI half-widths for percentiles of a sorted sample.
+
+    Uses the binomial order-statistic interval: the q-quantile lies between
+    the order statistics at n*q -/+ z*sqrt(n*q*(1-q)) with the given confidence.
+    """
+    n = sorted_epv.size
+    q = np.asarray(percentiles, dtype=float) / 100
+    spread = z * np.sqrt(n * q * (1 - q))
+    lo = np.clip(np.floor(n * q - spread).astype(int), 0, n - 1)
+    hi = np.clip(np.ceil(n * q + spread).astype(int), 0, n - 1)
+    return (sorted_epv[hi] - sorted_epv[lo]) / 2
+
+
+def wilson_half_width(p, n, z=1.96):
+    """Wilson score CI half-width for a proportion (non-zero even at p = 0 or 1)"""
+    return z * np.sqrt(p * (1 - p) / n + z**2 / (4 * n**2)) / (1 + z**2 / n)
+
+
+def summarize_epv(epv, current_price, percentiles=REPORT_PERCENTILES, z=1.96):
+    """Percentiles, upside probability and their CI half-widths for EPV draws"""
+    sorted_epv = np.sort(epv)
+    n = sorted_epv.size
+    upside_prob = n - np.searchsorted(sorted_epv, current_price, side='right')
+    upside_prob = upside_prob / n
+
+    return {
+        'n_sims': n,
+        'percentiles': dict(zip(percentiles, np.percentile(sorted_epv, percentiles))),
+        'percentile_half_widths': dict(zip(percentiles,
+                                           percentile_half_widths(sorted_epv, percentiles, z))),
+        'upside_prob': upside_prob,
+        'upside_prob_half_width': wilson_half_width(upside_prob, n, z)
+    }
+
+
+def simulate_epv_adaptive(mc_params, current_price=105, seed=42, percentiles=REPORT_PERCENTILES):
+    """Simulate in batches until the reported percentiles are precise enough.
+
+    Stops once every percentile CI half-width is within ``percentile_tolerance``
+    of the median EPV and the upside probability half-width is within
+    ``probability_tolerance``, or when ``max_simulations`` is reached. Tight
+    distributions finish after a few batches; volatile ones keep drawing.
+    """
+    config = {**ADAPTIVE_DEFAULTS, **(mc_params.get('adaptive') or {})}
+    rng = np.random.default_rng(seed)
+    dtype = resolve_dtype(mc_params.get('precision', 'float64'))
+    batch_size = config['batch_size']
+
+    batches = {'epv': [], 'ebit': [], 'wacc': [], 'tax_rate': []}
+    n_total = 0
+    converged = False
+
+    while n_total < config['max_simulations']:
+        n_batch = min(batch_size, config['max_simulations'] - n_total)
+        ebit, wacc, tax_rate = draw_inputs(mc_params, n_batch, rng, dtype)
+        epv = epv_from_draws(ebit, wacc, tax_rate, mc_params['maint_capex_pct'],
+                             mc_params.get('shares', 100))
+        for key, values in zip(batches, (epv, ebit, wacc, tax_rate)):
+            batches[key].append(values)
+        n_total += n_batch
+
+        if len(batches['epv']) < config['min_batches']:
+            continue
+
+        summary = summarize_epv(np.concatenate(batches['epv']), current_price,
+                                percentiles, config['confidence_z'])
+        widest = max(summary['percentile_half_widths'].values())
+        scale = abs(np.median(list(summary['percentiles'].values())))
+        if (widest <= config['percentile_tolerance'] * scale and
+                summary['upside_prob_half_width'] <= config['probability_tolerance']):
+            converged = True
+            break
+
+    result = {key: np.concatenate(values) for key, values in batches.items()}
+    result['summary'] = summarize_epv(result['epv'], current_price, percentiles,
+                                      config['confidence_z'])
+    result['converged'] = converged
+    result['n_batches'] = len(batches['epv'])
+    return result
+
+
+def simulated_epv_chunks(universe, n_sims=2000, mc_params=None, seed=42, precision='float64',
+                         chunk_size=1000):
+    """Yield (company slice, companies x simulations EPV draws) chunk by chunk.
+
+    Each company is simulated around its own normalized EBIT, WACC and tax
+    rate with the volatilities from ``mc_params``; maintenance capex keeps its
+    historical share of EBIT. With mc_params 'correlation' (one matrix, or a
+    per-sector stack indexed by universe['sector']) or 'sampling' set to
+    'truncated', each chunk is drawn through the Gaussian copula with one
+    batched Cholesky transform.
+    """
+    mc_params = mc_params or {}
+    dtype = resolve_dtype(precision)
+    rng = np.random.default_rng(seed)
+
+    normalized_ebit = np.asarray(universe['ebit'], dtype=dtype).mean(axis=1)
+    maint_capex_pct = np.asarray(universe['maint_capex'], dtype=dtype).mean(axis=1) / normalized_ebit
+    wacc = np.asarray(universe['wacc'], dtype=dtype)
+    tax_rate = np.asarray(universe['tax_rate'], dtype=dtype)
+    net_debt = np.asarray(universe['net_debt'], dtype=dtype)
+    shares = np.asarray(universe['shares'], dtype=dtype)
+    sectors = universe.get('sector')
+
+    ebit_vol = dtype.type(mc_params.get('ebit_volatility', 0.20))
+    wacc_vol = dtype.type(mc_params.get('wacc_volatility', 0.015))
+    tax_vol = dtype.type(mc_params.get('tax_volatility', 0.02))
+
+    # The cross-company factor is drawn once so every chunk shares it
+    common = None
+    if uses_copula(mc_params) and mc_params.get('common_weight'):
+        common = rng.standard_normal((n_sims, len(COPULA_INPUTS)), dtype=dtype)
+
+    n_companies = normalized_ebit.size
+    for start in range(0, n_companies, chunk_size):
+        chunk = slice(start, min(start + chunk_size, n_companies))
+        shape = (chunk.stop - start, n_sims)
+        base = normalized_ebit[chunk, np.newaxis]
+
+        if uses_copula(mc_params):
+            ebit, wacc_draws, tax_draws = draw_company_inputs(
+                normalized_ebit[chunk], wacc[chunk], tax_rate[chunk], mc_params, n_sims, rng, dtype,
+                None if sectors is None else np.asarray(sectors)[chunk], common)
+        else:
+            ebit = base + base * ebit_vol * rng.standard_normal(shape, dtype=dtype)
+            ebit = np.clip(ebit, np.minimum(base * dtype.type(0.5), base * dtype.type(2)),
+                           np.maximum(base * dtype.type(0.5), base * dtype.type(2)))
+            wacc_draws = np.clip(wacc[chunk, np.newaxis] + wacc_vol * rng.standard_normal(shape, dtype=dtype),
+                                 dtype.type(0.05), dtype.type(0.15))
+            tax_draws = np.clip(tax_rate[chunk, np.newaxis] + tax_vol * rng.standard_normal(shape, dtype=dtype),
+                                dtype.type(0.15), dtype.type(0.35))
+
+        yield chunk, compute_epv(ebit, tax_draws, ebit * maint_capex_pct[chunk, np.newaxis], wacc_draws,
+                                 net_debt[chunk, np.newaxis], shares[chunk, np.newaxis], dtype=dtype)
+
+
+def simulate_universe_percentiles(universe, percentiles=REPORT_PERCENTILES, n_sims=2000,
+                                  mc_params=None, seed=42, precision='float64',
+                                  chunk_size=1000):
+    """Simulated EPV percentiles for every company in a columnar universe.
+
+    Companies are processed in chunks so the (companies x simulations) draw
+    matrix stays cache-sized; see simulated_epv_chunks for the inputs.
+    """
+    n_companies = np.shape(universe['ebit'])[0]
+    results = np.empty((n_companies, len(percentiles)), dtype=resolve_dtype(precision))
+    for chunk, epv in simulated_epv_chunks(universe, n_sims, mc_params, seed, precision, chunk_size):
+        results[chunk] = np.percentile(epv, percentiles, axis=1).T
+
+    return dict(zip(percentiles, results.T))
+
+
+def simulate_portfolio_epv(universe, holdings=None, n_sims=2000, mc_params=None, seed=42,
+                           precision='float64', chunk_size=1000):
+    """Simulated EPV of a portfolio: sum over companies of shares held x EPV per share.
+
+    ``holdings`` defaults to one share of every company. Each chunk adds one
+    (holdings @ draws) matrix-vector product, so only the (n_sims,) total is
+    kept. Cross-company dependence comes from mc_params 'common_weight' and
+    'correlation'; with independent draws the portfolio spread diversifies away.
+    """
+    dtype = resolve_dtype(precision)
+    n_companies = np.shape(universe['ebit'])[0]
+    holdings = np.ones(n_companies, dtype=dtype) if holdings is None else np.asarray(holdings, dtype=dtype)
+    total = np.zeros(n_sims, dtype=dtype)
+    for chunk, epv in simulated_epv_chunks(universe, n_sims, mc_params, seed, precision, chunk_size):
+        total += holdings[chunk] @ epv
+    return total
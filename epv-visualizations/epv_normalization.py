@@ -0,0 +1,76 @@
+"""
+EBIT Normalization Estimators
+Mean, trimmed mean, median, margin x revenue and trend-filtered normalized EBIT over whole panels
+"""
+
+import numpy as np
+
+from epv_engine import compute_epv, resolve_dtype
+
+# Smoothing for the Hodrick-Prescott trend on annual data (Ravn-Uhlig: 1600 / 4^4)
+HP_LAMBDA = 6.25
+
+# Share of years dropped from each tail by the trimmed mean
+TRIM_FRACTION = 0.10
+
+# Name -> estimator(ebit, revenue) returning one value per company (row)
+NORMALIZERS = {}
+
+
+def register_normalizer(name, estimator):
+    """Add an estimator taking (companies x years) EBIT and revenue panels"""
+    NORMALIZERS[name] = estimator
+    return estimator
+
+
+def trimmed_mean(values, fraction=TRIM_FRACTION):
+    """Mean of each row after dropping ``fraction`` of the years from both tails"""
+    n = values.shape[-1]
+    cut = int(n * fraction)
+    return np.sort(values, axis=-1)[..., cut:n - cut].mean(axis=-1)
+
+
+def hp_smoother(n_years, lamb=HP_LAMBDA):
+    """(n x n) matrix S with HP trend = S @ series: (I + lambda D'D)^-1, D the second difference"""
+    diff = np.diff(np.eye(n_years), n=2, axis=0)
+    return np.linalg.inv(np.eye(n_years) + lamb * diff.T @ diff)
+
+
+def cycle_adjusted(values, lamb=HP_LAMBDA):
+    """Latest-year HP trend of each row: current earnings power with the cycle filtered out"""
+    return values @ hp_smoother(values.shape[-1], lamb)[-1]
+
+
+register_normalizer('mean', lambda ebit, revenue: ebit.mean(axis=-1))
+register_normalizer('trimmed_mean', lambda ebit, revenue: trimmed_mean(ebit))
+register_normalizer('median', lambda ebit, revenue: np.median(ebit, axis=-1))
+register_normalizer('margin_x_revenue',
+                    lambda ebit, revenue: (ebit / revenue).mean(axis=-1) * revenue.mean(axis=-1))
+register_normalizer('cycle_adjusted', lambda ebit, revenue: cycle_adjusted(ebit))
+
+
+def normalize_ebit(ebit, revenue, methods=None):
+    """Normalized EBIT per company for each method, stacked as (methods x companies)"""
+    methods = list(methods or NORMALIZERS)
+    unknown = [name for name in methods if name not in NORMALIZERS]
+    if unknown:
+        raise ValueError(f"Unknown normalization method(s) {', '.join(unknown)}. "
+                         f"Choose from: {', '.join(NORMALIZERS)}")
+    return np.stack([NORMALIZERS[name](ebit, revenue) for name in methods])
+
+
+def normalized_epv(universe, methods=None, precision='float64'):
+    """Normalized EBIT and EPV per share under every method, side by side for a whole universe.
+
+    Also accepts a single company_record. Maintenance capex stays the
+    period average, so the methods differ only in earnings.
+    """
+    dtype = resolve_dtype(precision)
+    methods = list(methods or NORMALIZERS)
+    ebit = np.asarray(universe['ebit'], dtype=dtype)
+    revenue = np.asarray(universe['revenue'], dtype=dtype)
+    normalized = normalize_ebit(ebit, revenue, methods)
+    epv = compute_epv(normalized, universe['tax_rate'],
+                      np.asarray(universe['maint_capex'], dtype=dtype).mean(axis=-1),
+                      universe['wacc'], universe['net_debt'], universe['shares'], dtype=dtype)
+    return {'methods': np.array(methods), 'normalized_ebit': normalized, 'epv_per_share': epv}
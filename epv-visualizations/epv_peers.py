@@ -0,0 +1,141 @@
+"""
+Nearest-Peer Index
+KD-tree over standardized fundamentals for fast comparable-company selection
+"""
+
+import warnings
+
+import numpy as np
+
+from epv_franchise import asset_value, balance_sheet
+
+# Fundamentals used for similarity, matching EPVAnalyzer.peer_data
+PEER_FEATURES = ('roic', 'debt_equity', 'revenue_growth_5y')
+
+
+def universe_fundamentals(universe):
+    """ROIC, leverage and 5-year revenue growth (companies x 3) from a columnar universe.
+
+    Invested capital is the latest balance sheet at book value: PP&E,
+    intangibles and working capital net of payables and accruals.
+    Debt/equity is net debt over market equity (price x shares).
+    Non-finite values (e.g. growth from a zero or negative base) are NaN.
+    """
+    ebit = np.asarray(universe['ebit'], dtype=float)
+    revenue = np.asarray(universe['revenue'], dtype=float)
+    tax_rate = np.asarray(universe['tax_rate'], dtype=float)
+
+    nopat = ebit.mean(axis=1) * (1 - tax_rate)
+    lines = balance_sheet(universe)
+    invested_capital = np.maximum(asset_value(lines, dict.fromkeys(lines, 1.0)), 1e-9)
+    roic = nopat / invested_capital * 100
+
+    equity = np.asarray(universe['price'], dtype=float) * np.asarray(universe['shares'], dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        debt_equity = np.asarray(universe['net_debt'], dtype=float) / equity
+        growth = ((revenue[:, -1] / revenue[:, -6]) ** (1 / 5) - 1) * 100
+    features = np.column_stack([roic, debt_equity, growth])
+    return np.where(np.isfinite(features), features, np.nan)
+
+
+class PeerIndex:
+    """k-nearest-peer lookups over z-scored fundamentals, built once per snapshot.
+
+    Missing (NaN or infinite) features are imputed at the feature's mean, so
+    they neither attract nor repel peers and the KD-tree only sees finite points.
+    """
+
+    def __init__(self, features, tickers=None, weights=None, leaf_size=16):
+        features = np.asarray(features, dtype=float)
+        features = np.where(np.isfinite(features), features, np.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-missing features
+            self.mean = np.nan_to_num(np.nanmean(features, axis=0))
+            self.scale = np.nanstd(features, axis=0)
+        self.scale[~(self.scale > 0)] = 1.0
+        self.weights = np.ones(features.shape[1]) if weights is None else np.asarray(weights, dtype=float)
+        self.points = self.standardize(features)
+        self.tickers = None if tickers is None else np.asarray(tickers)
+
+        # SciPy's KD-tree when available; brute force keeps the index usable without it
+        try:
+            from scipy.spatial import cKDTree
+        except ImportError:
+            self.tree = None
+        else:
+            self.tree = cKDTree(self.points, leafsize=leaf_size)
+
+    @classmethod
+    def from_frame(cls, df, feature_columns, ticker_column=None, **kwargs):
+        """Build from a DataFrame such as EPVAnalyzer.peer_data"""
+        tickers = None if ticker_column is None else df[ticker_column].to_numpy()
+        return cls(df[list(feature_columns)].to_numpy(dtype=float), tickers, **kwargs)
+
+    def standardize(self, features):
+        """Project raw fundamentals into the index's weighted z-score space (missing values -> 0)"""
+        z = (np.asarray(features, dtype=float) - self.mean) / self.scale * self.weights
+        return np.where(np.isfinite(z), z, 0.0)
+
+    def nearest(self, points, k, chunk_size=512):
+        """Distances and indices of the k nearest indexed points to standardized points"""
+        points = np.atleast_2d(points)
+        if self.tree is not None:
+            dist, idx = self.tree.query(points, k=k)
+            return dist.reshape(len(points), k), idx.reshape(len(points), k)
+
+        dist = np.empty((len(points), k))
+        idx = np.empty((len(points), k), dtype=np.intp)
+        for start in range(0, len(points), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            sq_dist = ((points[chunk, np.newaxis, :] - self.points[np.newaxis]) ** 2).sum(axis=-1)
+            part = np.argpartition(sq_dist, k - 1, axis=1)[:, :k]
+            part_dist = np.take_along_axis(sq_dist, part, axis=1)
+            order = np.argsort(part_dist, axis=1)
+            dist[chunk] = np.sqrt(np.take_along_axis(part_dist, order, axis=1))
+            idx[chunk] = np.take_along_axis(part, order, axis=1)
+        return dist, idx
+
+    def query(self, features, k=5):
+        """Distances and row indices of the k nearest companies to raw fundamentals"""
+        return self.nearest(self.standardize(features), min(k, len(self.points)))
+
+    def peers(self, rows=None, k=5):
+        """k most similar companies for indexed rows (all by default), excluding each row itself"""
+        rows = np.arange(len(self.points)) if rows is None else np.atleast_1d(rows)
+        k = min(k, len(self.points) - 1)
+        _, idx = self.nearest(self.points[rows], k + 1)
+
+        # Drop the row itself (usually column 0, but ties can reorder it)
+        not_self = idx != rows[:, np.newaxis]
+        not_self[not_self.sum(axis=1) > k, -1] = False
+        return idx[not_self].reshape(len(rows), k)
+
+    def peer_tickers(self, rows=None, k=5):
+        """Ticker labels of each row's peers"""
+        return self.tickers[self.peers(rows, k)]
+
+
+def comparable_range(index, multiples, value_base, k=5, percentiles=(25, 50, 75)):
+    """Football-field comparable-company low/mid/high for every company.
+
+    Applies the peers' valuation multiples (e.g. price / EPV) at the given
+    percentiles to each company's own base value (e.g. its EPV per share).
+    Companies with a non-positive base, or no peer with a valid multiple, get NaN.
+    """
+    peer_rows = index.peers(k=k)
+    peer_multiples = np.asarray(multiples, dtype=float)[peer_rows]
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN peer sets
+        low, mid, high = np.nanpercentile(peer_multiples, percentiles, axis=1)
+    value_base = np.asarray(value_base, dtype=float)
+    value_base = np.where(value_base > 0, value_base, np.nan)
+    return {'low': low * value_base, 'mid': mid * value_base, 'high': high * value_base}
+
+
+def universe_comparable_range(universe, epv_per_share, k=5):
+    """comparable_range for every company of a universe: peers by fundamentals, multiples price / EPV"""
+    index = PeerIndex(universe_fundamentals(universe), universe['ticker'])
+    epv_per_share = np.asarray(epv_per_share, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        multiples = np.where(epv_per_share > 0, np.asarray(universe['price'], dtype=float) / epv_per_share, np.nan)
+    return comparable_range(index, multiples, epv_per_share, k=k)
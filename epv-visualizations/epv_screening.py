@@ -0,0 +1,85 @@
+"""
+Margin-of-Safety Screening Engine
+Vectorized investment-zone classification and top-k selection over a universe
+"""
+
+import numpy as np
+
+from epv_engine import batch_epv
+
+# Upside thresholds (value / price - 1) separating Overvalued | Hold | Buy | Strong Buy
+ZONE_RULES = {
+    # plot_4_wacc_sensitivity_enhanced: +25% / +10% / -10%
+    'wacc_sensitivity': (-0.10, 0.10, 0.25),
+    # plot_6_football_field_enhanced: +30% / +15% / -10%
+    'football_field': (-0.10, 0.15, 0.30)
+}
+ZONE_LABELS = np.array(['Overvalued', 'Hold', 'Buy', 'Strong Buy'])
+
+# Zone code (and label) for companies without a finite upside, e.g. a NaN value or a zero price
+UNRATED = -1
+UNRATED_LABEL = 'Unrated'
+
+
+def margin_of_safety(value, price):
+    """Greenwald margin of safety: the share of intrinsic value not paid for"""
+    value = np.asarray(value)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mos = 1 - np.asarray(price) / value
+    # No margin of safety exists against a non-positive value or without a price
+    return np.where((value > 0) & np.isfinite(mos), mos, -np.inf)
+
+
+def classify_zones(value, price, rules='wacc_sensitivity'):
+    """Zone code per company (0=Overvalued ... 3=Strong Buy, -1=Unrated) from value vs price"""
+    thresholds = np.asarray(ZONE_RULES[rules] if isinstance(rules, str) else rules)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        upside = np.asarray(value) / np.asarray(price) - 1
+    # searchsorted would put NaN past every threshold (Strong Buy)
+    zones = np.searchsorted(thresholds, upside, side='right').astype(np.int8)
+    return np.where(np.isfinite(upside), zones, np.int8(UNRATED)).astype(np.int8)
+
+
+def zone_labels(zones):
+    """Label per zone code, 'Unrated' for UNRATED"""
+    zones = np.asarray(zones)
+    return np.where(zones == UNRATED, UNRATED_LABEL, ZONE_LABELS[np.clip(zones, 0, None)])
+
+
+def top_k(scores, k):
+    """Indices of the k highest scores, best first, via partial selection"""
+    scores = np.asarray(scores)
+    k = min(k, scores.size)
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    candidates = np.argpartition(scores, scores.size - k)[scores.size - k:]
+    return candidates[np.argsort(scores[candidates])[::-1]]
+
+
+def screen_universe(universe, k=25, rules='wacc_sensitivity', epv=None, p10=None,
+                    precision='float64'):
+    """Margin of safety, zone and top-k opportunities for every company.
+
+    Values are the batch EPV per share unless ``p10`` (simulated P10 EPV per
+    company, e.g. from simulate_universe_percentiles) is given, in which case
+    the screen runs against the pessimistic value instead.
+    """
+    if epv is None:
+        epv = batch_epv(universe, precision=precision)['epv_per_share']
+    value = epv if p10 is None else np.asarray(p10)
+    price = np.asarray(universe['price'], dtype=value.dtype)
+
+    mos = margin_of_safety(value, price)
+    zone = classify_zones(value, price, rules)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        upside = value / price - 1
+    return {
+        'ticker': universe['ticker'],
+        'value': value,
+        'price': price,
+        'upside': upside,
+        'margin_of_safety': mos,
+        'zone': zone,
+        'zone_label': zone_labels(zone),
+        'top': top_k(mos, k)
+    }
@@ -0,0 +1,224 @@
+"""
+EPV Sensitivity Analysis
+Tornado swings and Sobol indices for every EPV input across a whole universe in stacked evaluations
+"""
+
+import numpy as np
+
+from epv_engine import compute_epv, resolve_dtype
+from epv_shared import SharedUniverse, attach_universe, slice_universe
+
+# compute_epv arguments, in call order
+EPV_INPUTS = ('ebit', 'tax_rate', 'maint_capex', 'wacc', 'net_debt', 'shares')
+
+# Input -> (bump kind, size): relative bumps scale the input, absolute ones shift it, and
+# enterprise bumps shift it by that share of enterprise value (net debt is often near zero)
+TORNADO_BUMPS = {
+    'ebit': ('relative', 0.10),
+    'tax_rate': ('absolute', 0.02),
+    'maint_capex': ('relative', 0.10),
+    'wacc': ('absolute', 0.01),
+    'net_debt': ('enterprise', 0.10),
+    'shares': ('relative', 0.05)
+}
+
+
+def epv_inputs(universe, precision='float64'):
+    """Normalized compute_epv inputs per company (panel means, as in batch_epv).
+
+    Also accepts a single company_record, giving scalars.
+    """
+    dtype = resolve_dtype(precision)
+    inputs = {name: np.asarray(universe[name], dtype=dtype) for name in EPV_INPUTS}
+    inputs['ebit'] = inputs['ebit'].mean(axis=-1)
+    inputs['maint_capex'] = inputs['maint_capex'].mean(axis=-1)
+    return inputs
+
+
+def tornado(inputs, bumps=None, dtype=None):
+    """EPV swing from bumping each input down and up, for every company at once.
+
+    ``inputs`` maps each name in EPV_INPUTS to a scalar or (companies,) array.
+    The base case and all 2k bumps are stacked into (2k + 1, companies) arrays
+    and priced with a single compute_epv call. Returns low/high EPV and
+    |high - low| swings as (inputs x companies), each company's inputs ranked
+    by swing, and a portfolio ranking by median swing relative to base EPV.
+    """
+    bumps = dict(TORNADO_BUMPS, **(bumps or {}))
+    names = [name for name in EPV_INPUTS if name in bumps]
+    k = len(names)
+    base_inputs = np.broadcast_arrays(*(np.asarray(inputs[name], dtype=dtype) for name in EPV_INPUTS))
+    # Integer inputs would truncate the bumped rows
+    base_inputs = [values if np.issubdtype(values.dtype, np.floating) else values.astype(float)
+                   for values in base_inputs]
+    enterprise_value = np.abs(compute_epv(*base_inputs[:4], 0, 1))
+
+    stacked = {}
+    for name, values in zip(EPV_INPUTS, base_inputs):
+        rows = np.repeat(values[np.newaxis], 2 * k + 1, axis=0)
+        if name in names:
+            i = names.index(name)
+            kind, size = bumps[name]
+            if kind == 'relative':
+                rows[1 + i], rows[1 + k + i] = values * (1 - size), values * (1 + size)
+            elif kind == 'absolute':
+                rows[1 + i], rows[1 + k + i] = values - size, values + size
+            elif kind == 'enterprise':
+                rows[1 + i], rows[1 + k + i] = values - size * enterprise_value, values + size * enterprise_value
+            else:
+                raise ValueError(f"Unknown bump kind '{kind}' for {name}. Use 'relative', 'absolute' or 'enterprise'")
+        stacked[name] = rows
+
+    epv = compute_epv(*(stacked[name] for name in EPV_INPUTS))
+    base, low, high = epv[0], epv[1:k + 1], epv[k + 1:]
+    swing = np.abs(high - low)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative_swing = swing / np.abs(base)
+    portfolio_swing = np.nanmedian(np.where(np.isfinite(relative_swing), relative_swing, np.nan),
+                                   axis=-1) if swing.ndim > 1 else relative_swing
+    return {
+        'inputs': np.array(names),
+        'base': base,
+        'low': low,
+        'high': high,
+        'swing': swing,
+        'order': np.argsort(-swing, axis=0, kind='stable'),
+        'portfolio_swing': portfolio_swing,
+        'portfolio_order': np.argsort(-portfolio_swing, kind='stable')
+    }
+
+
+def universe_tornado(universe, bumps=None, precision='float64'):
+    """Tornado sensitivity for every company in a columnar universe"""
+    return tornado(epv_inputs(universe, precision), bumps, dtype=resolve_dtype(precision))
+
+
+# Simulated inputs attributed by the Sobol analysis (mc_params volatilities)
+SOBOL_INPUTS = ('ebit', 'wacc', 'tax_rate', 'maint_capex')
+
+
+def saltelli_design(n, k, rng, dtype=np.float64):
+    """Standard-normal Saltelli design as a (k + 2, k, n) array.
+
+    Row 0 is sample matrix A, row 1 is B, and row 2 + i is A with column i
+    taken from B, so one stacked model call covers all n * (k + 2) runs.
+    """
+    a_b = rng.standard_normal((2, k, n), dtype=dtype)
+    design = np.repeat(a_b[:1], k + 2, axis=0)
+    design[1] = a_b[1]
+    for i in range(k):
+        design[2 + i, i] = a_b[1, i]
+    return design
+
+
+def sobol_epv(design, base_ebit, wacc, tax_rate, maint_capex_pct, mc_params, net_debt=0.0, shares=100.0):
+    """EPV for every row of a Saltelli design (inputs clipped as in draw_inputs).
+
+    With a (k + 2, k, 1, n) design and (companies, 1) inputs the result is
+    (k + 2, companies, n). Maintenance capex varies as a share of EBIT with
+    ``maint_capex_volatility`` (relative, default 10%).
+    """
+    dtype = design.dtype
+    z_ebit, z_wacc, z_tax, z_capex = (design[:, i] for i in range(len(SOBOL_INPUTS)))
+    ebit = base_ebit * (1 + dtype.type(mc_params.get('ebit_volatility', 0.20)) * z_ebit)
+    # Same [0.5x, 2x] band as draw_inputs, ordered so loss-making bases clip too
+    low, high = np.minimum(base_ebit * 0.5, base_ebit * 2), np.maximum(base_ebit * 0.5, base_ebit * 2)
+    ebit = np.clip(ebit, low, high)
+    wacc_draws = np.clip(wacc + dtype.type(mc_params.get('wacc_volatility', 0.015)) * z_wacc, 0.05, 0.15)
+    tax_draws = np.clip(tax_rate + dtype.type(mc_params.get('tax_volatility', 0.02)) * z_tax, 0.15, 0.35)
+    capex_pct = np.maximum(maint_capex_pct * (1 + dtype.type(mc_params.get('maint_capex_volatility', 0.10)) *
+                                              z_capex), 0)
+    return compute_epv(ebit, tax_draws, ebit * capex_pct, wacc_draws, net_debt, shares, dtype=dtype)
+
+
+def sobol_estimates(epv):
+    """First-order (Saltelli 2010) and total-order (Jansen) indices from design outputs.
+
+    ``epv`` has the design rows on axis 0 and samples on the last axis.
+    """
+    f_a, f_b, f_ab = epv[0], epv[1], epv[2:]
+    variance = np.var(np.concatenate([f_a, f_b], axis=-1), axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        first = np.mean(f_b * (f_ab - f_a), axis=-1) / variance
+        total = 0.5 * np.mean((f_a - f_ab) ** 2, axis=-1) / variance
+    return first, total
+
+
+def sobol_indices(mc_params, n=8192, n_boot=200, confidence=0.95, seed=42):
+    """Sobol first- and total-order indices of simulated EPV for one company's mc_params.
+
+    Returns the indices per input in SOBOL_INPUTS with bootstrap confidence
+    intervals (samples resampled with replacement, all replicates at once).
+    """
+    rng = np.random.default_rng(seed)
+    dtype = resolve_dtype(mc_params.get('precision', 'float64'))
+    design = saltelli_design(n, len(SOBOL_INPUTS), rng, dtype)
+    epv = sobol_epv(design, dtype.type(mc_params['base_ebit']), dtype.type(mc_params['wacc_base']),
+                    dtype.type(mc_params.get('tax_rate', 0.25)), dtype.type(mc_params['maint_capex_pct']),
+                    mc_params, mc_params.get('net_debt', 0.0), mc_params.get('shares', 100))
+    first, total = sobol_estimates(epv)
+
+    boot = rng.integers(0, n, (n_boot, n))
+    boot_first, boot_total = sobol_estimates(epv[:, boot])
+    tail = (1 - confidence) / 2 * 100
+    return {
+        'inputs': np.array(SOBOL_INPUTS),
+        'first_order': first,
+        'total_order': total,
+        'first_order_ci': np.percentile(boot_first, [tail, 100 - tail], axis=-1).T,
+        'total_order_ci': np.percentile(boot_total, [tail, 100 - tail], axis=-1).T,
+        'n_evaluations': epv.size
+    }
+
+
+def _universe_sobol_chunk(task):
+    """Sobol indices for one slice of companies (runs inside worker processes)"""
+    source, lo, hi, design, mc_params, precision, chunk_size = task
+    universe = slice_universe(attach_universe(source), lo, hi)
+    inputs = epv_inputs(universe, precision)
+    maint_capex_pct = inputs['maint_capex'] / inputs['ebit']
+    n_companies = inputs['ebit'].size
+    company_design = design[:, :, np.newaxis]
+    first = np.empty((len(SOBOL_INPUTS), n_companies), dtype=design.dtype)
+    total = np.empty_like(first)
+    for start in range(0, n_companies, chunk_size):
+        chunk = slice(start, min(start + chunk_size, n_companies))
+        column = {name: values[chunk, np.newaxis] for name, values in inputs.items()}
+        epv = sobol_epv(company_design, column['ebit'], column['wacc'], column['tax_rate'],
+                        maint_capex_pct[chunk, np.newaxis], mc_params, column['net_debt'], column['shares'])
+        first[:, chunk], total[:, chunk] = sobol_estimates(epv)
+    return first, total
+
+
+def universe_sobol_indices(universe, n=1024, mc_params=None, seed=42, precision='float64',
+                           chunk_size=128, workers=1):
+    """First- and total-order Sobol indices (inputs x companies) for a whole universe.
+
+    Every company is evaluated on the same Saltelli design around its own
+    normalized inputs, in (k + 2, chunk, n) blocks; ``workers`` > 1 splits
+    the companies across processes, which attach to one shared-memory copy
+    of the universe.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    mc_params = mc_params or {}
+    dtype = resolve_dtype(precision)
+    design = saltelli_design(n, len(SOBOL_INPUTS), np.random.default_rng(seed), dtype)
+
+    n_companies = len(universe['ticker'])
+    bounds = np.linspace(0, n_companies, max(workers, 1) + 1).astype(int)
+    slices = [(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+    if workers > 1:
+        with SharedUniverse(universe) as shared, ProcessPoolExecutor(max_workers=workers) as pool:
+            tasks = [(shared.manifest, lo, hi, design, mc_params, precision, chunk_size)
+                     for lo, hi in slices]
+            chunks = list(pool.map(_universe_sobol_chunk, tasks))
+    else:
+        chunks = [_universe_sobol_chunk((universe, lo, hi, design, mc_params, precision, chunk_size))
+                  for lo, hi in slices]
+    return {
+        'inputs': np.array(SOBOL_INPUTS),
+        'first_order': np.concatenate([first for first, _ in chunks], axis=1),
+        'total_order': np.concatenate([total for _, total in chunks], axis=1)
+    }
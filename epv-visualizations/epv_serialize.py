@@ -0,0 +1,120 @@
+"""
+Fast Figure Serialization
+Plotly figures written to JSON/HTML with orjson, numpy arrays encoded directly from their buffers
+"""
+
+import functools
+import json
+import re
+import uuid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+HTML_TEMPLATE = """<html>
+<head><meta charset="utf-8" /></head>
+<body>
+    <div>{plotlyjs}
+        <div id="{div_id}" class="plotly-graph-div" style="height:{height}; width:{width};"></div>
+        <script type="text/javascript">
+            window.PLOTLYENV=window.PLOTLYENV || {{}};
+            if (document.getElementById("{div_id}")) {{
+                Plotly.newPlot("{div_id}", {data}, {layout}, {config}){then}
+            }}
+        </script>
+    </div>
+</body>
+</html>"""
+
+
+def _default(obj):
+    """Values orjson cannot encode natively: object/datetime arrays, pandas objects, dates"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"Cannot serialize {type(obj).__name__} to JSON")
+
+
+def _figure_parts(fig):
+    """The figure's data and layout structures.
+
+    Reads a go.Figure's internal lists directly to skip the deep copy in the
+    public to_plotly_json(); anything else (dicts, other plotly versions,
+    figure-like objects) goes through the public API.
+    """
+    if not isinstance(fig, dict):
+        data, layout = getattr(fig, '_data', None), getattr(fig, '_layout', None)
+        if isinstance(data, (list, tuple)) and isinstance(layout, dict):
+            return data, layout
+        fig = fig.to_plotly_json()
+    return fig.get('data', []), fig.get('layout', {})
+
+
+def dumps(obj):
+    """JSON bytes for plotly-style structures; numpy arrays stay arrays (NaN -> null)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS, default=_default)
+    import plotly.io as pio
+    return pio.json.to_json_plotly(obj, engine='json').encode()
+
+
+def figure_json(fig):
+    """Plotly figure as JSON bytes in the layout of fig.to_json()"""
+    if orjson is None:
+        import plotly.io as pio
+        return pio.to_json(fig, validate=False, engine='json').encode()
+    data, layout = _figure_parts(fig)
+    return b'{"data":' + dumps(data) + b',"layout":' + dumps(layout) + b'}'
+
+
+@functools.lru_cache(maxsize=None)
+def _plotlyjs_cdn_tag():
+    """The CDN <script> tag plotly.io.to_html writes for the installed plotly.js version"""
+    import plotly.io as pio
+    html = pio.to_html({'data': [], 'layout': {}}, include_plotlyjs='cdn', full_html=False)
+    return re.search(r'<script[^>]*\ssrc="[^"]*"[^>]*></script>', html).group(0)
+
+
+def _script_safe(encoded):
+    """JSON text that cannot close the surrounding <script> tag"""
+    return encoded.decode().replace('</', '<\\/')
+
+
+def figure_html(fig, include_plotlyjs='cdn', post_script=None, div_id=None):
+    """Standalone HTML page for a plotly figure (same structure as fig.to_html)"""
+    data, layout = _figure_parts(fig)
+    div_id = div_id or str(uuid.uuid4())
+    if include_plotlyjs == 'cdn':
+        plotlyjs = _plotlyjs_cdn_tag()
+    elif include_plotlyjs:
+        from plotly.offline import get_plotlyjs
+        plotlyjs = f'<script type="text/javascript">{get_plotlyjs()}</script>'
+    else:
+        plotlyjs = ''
+    scripts = [post_script] if isinstance(post_script, str) else post_script or []
+    then = ''.join('.then(function(){' + script.replace('{plot_id}', div_id) + '})' for script in scripts)
+    width, height = layout.get('width'), layout.get('height')
+    return HTML_TEMPLATE.format(
+        plotlyjs=plotlyjs, div_id=div_id, then=then,
+        width=f'{width}px' if width else '100%', height=f'{height}px' if height else '100%',
+        data=_script_safe(dumps(data)), layout=_script_safe(dumps(layout)),
+        config=json.dumps({'responsive': True}))
+
+
+def write_figure_json(fig, path):
+    """Write a plotly figure as JSON (readable by plotly.io.read_json)"""
+    with open(path, 'wb') as f:
+        f.write(figure_json(fig))
+    return path
+
+
+def write_figure_html(fig, path, include_plotlyjs='cdn', post_script=None):
+    """Write a plotly figure as a standalone HTML page"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(figure_html(fig, include_plotlyjs, post_script))
+    return path
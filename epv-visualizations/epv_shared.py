@@ -0,0 +1,104 @@
+"""
+Shared-Memory Universe
+A columnar universe published once into shared memory, attached by name in worker processes without copies
+"""
+
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+# Column start alignment in the shared block, bytes
+ALIGN = 64
+
+# Block name -> (SharedMemory, column views) for every block this process has published or attached
+_ATTACHED = {}
+
+
+def _views(buffer, columns):
+    """numpy arrays over the shared buffer, one per manifest column"""
+    return {name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=buffer, offset=offset)
+            for name, dtype, shape, offset in columns}
+
+
+class SharedUniverse:
+    """One shared-memory block holding every column of a universe.
+
+    The creating process owns the block: use it as a context manager (or
+    call close()) so the memory is released. ``manifest`` is a small,
+    picklable description that workers pass to attach_universe.
+    """
+
+    def __init__(self, universe):
+        columns = {name: np.asarray(values) for name, values in universe.items()}
+        layout, size = [], 0
+        for name, values in columns.items():
+            if values.dtype == object:
+                values = columns[name] = values.astype(str)
+            size = -(-size // ALIGN) * ALIGN
+            layout.append((name, values.dtype.str, values.shape, size))
+            size += values.nbytes
+
+        self.shm = SharedMemory(create=True, size=max(size, 1))
+        self.universe = _views(self.shm.buf, layout)
+        for name, values in columns.items():
+            self.universe[name][...] = values
+        self.manifest = {'shared_memory': self.shm.name, 'columns': layout}
+        _ATTACHED[self.shm.name] = (self.shm, self.universe)
+
+    @property
+    def nbytes(self):
+        return self.shm.size
+
+    def close(self):
+        """Drop this process's views and free the block"""
+        _ATTACHED.pop(self.shm.name, None)
+        self.universe = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # arrays still referenced elsewhere keep the mapping alive until they go
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_universe(source):
+    """Zero-copy universe views for a SharedUniverse manifest (a plain universe passes through).
+
+    Attachments are cached per process, so repeated tasks reuse one mapping;
+    detach_universe releases it. Pool workers (fork or spawn) share the
+    publisher's resource tracker, so their registration is the publisher's
+    own: it is dropped when the publisher unlinks and cleans up the block if
+    the publisher dies without doing so.
+    """
+    if 'shared_memory' not in source:
+        return source
+    name = source['shared_memory']
+    if name not in _ATTACHED:
+        shm = SharedMemory(name=name)
+        _ATTACHED[name] = (shm, _views(shm.buf, source['columns']))
+    return _ATTACHED[name][1]
+
+
+def detach_universe(source):
+    """Close this process's mapping of a published universe (the publisher still owns the block).
+
+    Views handed out by attach_universe must not be used afterwards.
+    """
+    if 'shared_memory' not in source:
+        return
+    shm, _ = _ATTACHED.pop(source['shared_memory'], (None, None))
+    if shm is not None:
+        try:
+            shm.close()
+        except BufferError:
+            pass  # arrays still referenced elsewhere keep the mapping alive until they go
+
+
+def slice_universe(universe, lo, hi):
+    """Companies lo:hi as views (the year axis is shared)"""
+    return {name: (values if name == 'year' else values[lo:hi]) for name, values in universe.items()}
@@ -0,0 +1,218 @@
+"""
+Local Fundamentals Store
+SQLite tables for statements, prices and computed metrics keyed on (ticker, period), with an npz snapshot for warm starts
+"""
+
+import os
+import sqlite3
+import uuid
+
+import numpy as np
+
+from epv_engine import resolve_dtype
+from epv_export import METRICS_SCHEMA
+from epv_universe import BALANCE_SHEET_COLUMNS, PANEL_COLUMNS, SCALAR_COLUMNS
+
+COMPANY_COLUMNS = SCALAR_COLUMNS + BALANCE_SHEET_COLUMNS
+
+# Largest ticker list bound into one IN (...) query (SQLite caps host parameters)
+QUERY_BATCH = 500
+
+# Primary keys double as the (ticker, period) lookup index; WITHOUT ROWID stores rows in key order.
+# meta.value is untyped: it holds the integer version and the text store_id
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS companies (
+    ticker TEXT PRIMARY KEY, position INTEGER, {', '.join(f'{name} REAL' for name in COMPANY_COLUMNS)}
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS fundamentals (
+    ticker TEXT, fiscal_year INTEGER, {', '.join(f'{name} REAL' for name in PANEL_COLUMNS)},
+    PRIMARY KEY (ticker, fiscal_year)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS prices (
+    ticker TEXT, date TEXT, close REAL, PRIMARY KEY (ticker, date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS metrics (
+    {', '.join(f"{name} {'TEXT' if kind == 'string' else 'REAL'}" for name, kind in METRICS_SCHEMA)},
+    PRIMARY KEY (ticker)
+) WITHOUT ROWID;
+"""
+
+
+def _placeholders(n):
+    return ', '.join('?' * n)
+
+
+class FundamentalsStore:
+    """An on-disk store for one universe: statements, prices and computed metrics.
+
+    Every universe write bumps a version number (prices and metrics are not
+    in the snapshot, so writing them does not); load_universe serves the npz
+    snapshot beside the database while both the database's id (a UUID
+    written at creation) and its version match, and rebuilds it otherwise.
+    Use as a context manager (or call close()).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.snapshot_path = f"{os.path.splitext(path)[0]}.snapshot.npz"
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+        with self.connection:
+            self.connection.execute("INSERT OR IGNORE INTO meta VALUES ('store_id', ?)", (str(uuid.uuid4()),))
+        self.store_id = self.connection.execute("SELECT value FROM meta WHERE key = 'store_id'").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def version(self):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return row[0] if row else 0
+
+    def _bump_version(self):
+        self.connection.execute("INSERT INTO meta VALUES ('version', 1) "
+                                "ON CONFLICT (key) DO UPDATE SET value = value + 1")
+
+    def tickers(self):
+        """Stored tickers in universe order"""
+        return [row[0] for row in self.connection.execute("SELECT ticker FROM companies ORDER BY position")]
+
+    def write_universe(self, universe):
+        """Insert or replace every company of a columnar universe (tickers keep their order)"""
+        tickers = np.asarray(universe['ticker']).tolist()
+        years = np.asarray(universe['year']).tolist()
+        start = self.connection.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM companies").fetchone()[0]
+        company_rows = zip(tickers, range(start, start + len(tickers)),
+                           *(np.asarray(universe[name], dtype=float).tolist() for name in COMPANY_COLUMNS))
+        panels = [np.asarray(universe[name], dtype=float).tolist() for name in PANEL_COLUMNS]
+        fundamental_rows = ((ticker, year, *(panel[i][j] for panel in panels))
+                            for i, ticker in enumerate(tickers) for j, year in enumerate(years))
+        with self.connection:
+            # Re-written tickers keep their original position
+            self.connection.executemany(
+                f"INSERT INTO companies VALUES ({_placeholders(len(COMPANY_COLUMNS) + 2)}) "
+                f"ON CONFLICT (ticker) DO UPDATE SET "
+                f"{', '.join(f'{name} = excluded.{name}' for name in COMPANY_COLUMNS)}", company_rows)
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO fundamentals VALUES ({_placeholders(len(PANEL_COLUMNS) + 2)})",
+                fundamental_rows)
+            self._bump_version()
+
+    def write_prices(self, tickers, dates, prices):
+        """Store a (tickers x dates) close-price panel; NaN prices are skipped"""
+        dates = np.asarray(dates, dtype='datetime64[D]').astype(str).tolist()
+        prices = np.asarray(prices, dtype=float)
+        company, day = np.nonzero(np.isfinite(prices))
+        tickers = np.asarray(tickers)
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO prices VALUES (?, ?, ?)",
+                zip(tickers[company].tolist(), (dates[d] for d in day.tolist()), prices[company, day].tolist()))
+
+    def write_metrics(self, metrics):
+        """Store company_metrics columns, one row per ticker"""
+        names = [name for name, _ in METRICS_SCHEMA]
+        columns = [np.asarray(metrics[name]).tolist() for name in names]
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO metrics VALUES ({_placeholders(len(names))})", zip(*columns))
+
+    def load_company(self, ticker, precision='float64'):
+        """One company's dashboard inputs, shaped like epv_universe.company_record (two indexed lookups)"""
+        dtype = resolve_dtype(precision)
+        company = self.connection.execute(
+            f"SELECT {', '.join(COMPANY_COLUMNS)} FROM companies WHERE ticker = ?", (ticker,)).fetchone()
+        if company is None:
+            raise KeyError(f"Ticker '{ticker}' is not in the store")
+        rows = self.connection.execute(
+            f"SELECT fiscal_year, {', '.join(PANEL_COLUMNS)} FROM fundamentals "
+            f"WHERE ticker = ? ORDER BY fiscal_year", (ticker,)).fetchall()
+        table = np.array(rows, dtype=float).reshape(-1, len(PANEL_COLUMNS) + 1)
+        record = {'ticker': ticker, 'year': table[:, 0].astype(int)}
+        record.update({name: table[:, i + 1].astype(dtype) for i, name in enumerate(PANEL_COLUMNS)})
+        record.update({name: dtype.type(value) for name, value in zip(COMPANY_COLUMNS, company)})
+        return record
+
+    def _query_universe(self, dtype):
+        """Build the columnar universe from the tables; missing (ticker, year) cells are NaN"""
+        companies = self.connection.execute(
+            f"SELECT ticker, position, {', '.join(COMPANY_COLUMNS)} FROM companies ORDER BY position").fetchall()
+        universe = {'ticker': np.array([row[0] for row in companies], dtype=str)}
+        positions = np.array([row[1] for row in companies], dtype=float)
+        scalars = np.array([row[2:] for row in companies], dtype=float).reshape(-1, len(COMPANY_COLUMNS))
+        rows = self.connection.execute(
+            f"SELECT c.position, f.fiscal_year, {', '.join(f'f.{name}' for name in PANEL_COLUMNS)} "
+            f"FROM fundamentals f JOIN companies c USING (ticker)").fetchall()
+        table = np.array(rows, dtype=float).reshape(-1, len(PANEL_COLUMNS) + 2)
+
+        years = np.unique(table[:, 1]).astype(int)
+        universe['year'] = years
+        # Positions are sorted but not necessarily contiguous; rank them into row numbers
+        row = np.searchsorted(positions, table[:, 0])
+        column = np.searchsorted(years, table[:, 1])
+        for i, name in enumerate(PANEL_COLUMNS):
+            panel = np.full((len(companies), years.size), np.nan, dtype=dtype)
+            panel[row, column] = table[:, i + 2]
+            universe[name] = panel
+        for i, name in enumerate(COMPANY_COLUMNS):
+            universe[name] = scalars[:, i].astype(dtype)
+        return universe
+
+    def load_universe(self, precision='float64', use_snapshot=True):
+        """The whole stored universe as columnar arrays, from the snapshot when it is current"""
+        dtype = resolve_dtype(precision)
+        version = self.version
+        if use_snapshot and os.path.exists(self.snapshot_path):
+            with np.load(self.snapshot_path) as snapshot:
+                if ('_store_id' in snapshot.files and str(snapshot['_store_id']) == self.store_id
+                        and int(snapshot['_version']) == version and snapshot['ebit'].dtype == dtype):
+                    return {name: snapshot[name] for name in snapshot.files
+                            if name not in ('_store_id', '_version')}
+
+        universe = self._query_universe(dtype)
+        if use_snapshot:
+            # Write then rename so a concurrent reader never sees a partial file
+            partial = f"{self.snapshot_path}.partial.npz"
+            np.savez(partial, _store_id=self.store_id, _version=version, **universe)
+            os.replace(partial, self.snapshot_path)
+        return universe
+
+    def load_prices(self, tickers=None):
+        """(tickers, dates, tickers x dates close panel) with NaN where no price is stored"""
+        if tickers is None:
+            tickers = np.asarray(self.tickers(), dtype=str)
+            rows = self.connection.execute("SELECT ticker, date, close FROM prices").fetchall()
+        else:
+            # Batched IN (...) lookups walk the (ticker, date) primary key
+            tickers = np.asarray(tickers, dtype=str)
+            rows = []
+            for start in range(0, tickers.size, QUERY_BATCH):
+                batch = tickers[start:start + QUERY_BATCH].tolist()
+                rows += self.connection.execute(
+                    f"SELECT ticker, date, close FROM prices WHERE ticker IN ({_placeholders(len(batch))})",
+                    batch).fetchall()
+        if not rows:
+            return tickers, np.array([], dtype='datetime64[D]'), np.empty((tickers.size, 0))
+        row_tickers, row_dates, close = zip(*rows)
+        dates, day = np.unique(np.array(row_dates, dtype='datetime64[D]'), return_inverse=True)
+        order = np.argsort(tickers)
+        company = order[np.searchsorted(tickers, row_tickers, sorter=order)]
+        prices = np.full((tickers.size, dates.size), np.nan)
+        prices[company, day] = close
+        return tickers, dates, prices
+
+    def load_metrics(self):
+        """Stored metrics as columns in METRICS_SCHEMA order"""
+        names = [name for name, _ in METRICS_SCHEMA]
+        rows = self.connection.execute(f"SELECT {', '.join(names)} FROM metrics").fetchall()
+        return {name: np.array(values, dtype=str if kind == 'string' else float)
+                for (name, kind), values in zip(METRICS_SCHEMA, zip(*rows) if rows else ([],) * len(names))}
@@ -0,0 +1,127 @@
+"""
+Shock-Path Stress Testing
+Named multi-year shocks to EBIT, margins, maintenance capex and WACC, applied to a whole universe in one broadcast EPV pass
+"""
+
+import numpy as np
+
+from epv_engine import compute_epv, resolve_dtype
+
+# Path inputs: ebit, maint_capex and wacc are relative changes (-0.20 = 20% lower);
+# margin is a change in EBIT margin in fractions of revenue (-0.02 = two points)
+SHOCK_INPUTS = ('ebit', 'margin', 'maint_capex', 'wacc')
+
+# Name -> {input: per-year path}; paths cover the last len(path) years of the history.
+# ebit, margin and maint_capex paths move the period means; the wacc path is applied at
+# its peak (its highest year within the history), since a stress test capitalizes the
+# stressed earnings at the worst rate the shock reaches rather than wherever it ends
+SHOCK_PATHS = {}
+
+# worst_shock for companies with no EPV under any shock (e.g. all-NaN inputs)
+NO_SHOCK = -1
+
+
+def register_shock(name, **paths):
+    """Add a named shock path, e.g. register_shock('Credit Crunch', wacc=[0.2, 0.3], ebit=[-0.1, -0.2])"""
+    unknown = [key for key in paths if key not in SHOCK_INPUTS]
+    if unknown:
+        raise ValueError(f"Unknown shock input(s) {', '.join(unknown)}. Choose from: {', '.join(SHOCK_INPUTS)}")
+    SHOCK_PATHS[name] = {key: list(path) for key, path in paths.items()}
+    return SHOCK_PATHS[name]
+
+
+# Named after the dashboards' event annotations
+register_shock('Market Downturn', ebit=[-0.15, -0.25, -0.10], margin=[-0.01, -0.02, -0.01],
+               maint_capex=[0.00, 0.05, 0.05], wacc=[0.10, 0.15, 0.05])
+register_shock('Post-Pandemic Rebound', ebit=[-0.30, 0.10, 0.20], margin=[-0.03, 0.01, 0.02],
+               maint_capex=[-0.20, 0.10, 0.15], wacc=[0.05, -0.05, 0.00])
+register_shock('Rate Shock', wacc=[0.25, 0.35])
+register_shock('Margin Squeeze', margin=[-0.02, -0.03, -0.03], maint_capex=[0.10, 0.10, 0.10])
+
+
+def shock_matrix(shocks, n_years, dtype=np.float64):
+    """(shocks x years) arrays per input, each path right-aligned to the latest years.
+
+    Paths longer than the history keep their most recent ``n_years`` values.
+    """
+    matrices = {key: np.zeros((len(shocks), n_years), dtype=dtype) for key in SHOCK_INPUTS}
+    for i, name in enumerate(shocks):
+        if name not in SHOCK_PATHS:
+            raise KeyError(f"Unknown shock '{name}'. Registered: {', '.join(SHOCK_PATHS)}")
+        for key, path in SHOCK_PATHS[name].items():
+            path = path[-n_years:]
+            if path:
+                matrices[key][i, n_years - len(path):] = path
+    return matrices
+
+
+def wacc_peaks(shocks, n_years, dtype=np.float64):
+    """Highest relative WACC change each shock's path reaches within the last ``n_years`` (0 without one)."""
+    peaks = np.zeros(len(shocks), dtype=dtype)
+    for i, name in enumerate(shocks):
+        path = SHOCK_PATHS[name].get('wacc', [])[-n_years:]
+        if path:
+            peaks[i] = max(path)
+    return peaks
+
+
+def stress_epv(universe, shocks=None, precision='float64'):
+    """EPV per share under every shock for every company, plus deltas against the base case.
+
+    Normalized EBIT and maintenance capex are period means, so each shock's
+    effect on them is one (shocks x years) @ (years x companies) product. The
+    stressed WACC is the base rate scaled by the path's peak (see wacc_peaks),
+    the rate the stressed earnings are capitalized at. Arrays are (shocks x companies).
+    Companies with no EPV under any shock get worst_shock NO_SHOCK and a NaN
+    worst_price_impact.
+    """
+    dtype = resolve_dtype(precision)
+    shocks = list(shocks or SHOCK_PATHS)
+    ebit = np.atleast_2d(np.asarray(universe['ebit'], dtype=dtype))
+    revenue = np.atleast_2d(np.asarray(universe['revenue'], dtype=dtype))
+    maint_capex = np.atleast_2d(np.asarray(universe['maint_capex'], dtype=dtype))
+    n_years = ebit.shape[-1]
+    paths = shock_matrix(shocks, n_years, dtype)
+
+    base_ebit = ebit.mean(axis=-1)
+    base_capex = maint_capex.mean(axis=-1)
+    stressed_ebit = base_ebit + (paths['ebit'] @ ebit.T + paths['margin'] @ revenue.T) / n_years
+    stressed_capex = base_capex + paths['maint_capex'] @ maint_capex.T / n_years
+    wacc = np.asarray(universe['wacc'], dtype=dtype)
+    stressed_wacc = wacc * (1 + wacc_peaks(shocks, n_years, dtype)[:, np.newaxis])
+
+    tax_rate, net_debt, shares = universe['tax_rate'], universe['net_debt'], universe['shares']
+    base = compute_epv(base_ebit, tax_rate, base_capex, wacc, net_debt, shares, dtype=dtype)
+    stressed = compute_epv(stressed_ebit, tax_rate, stressed_capex, stressed_wacc, net_debt, shares, dtype=dtype)
+    delta = stressed - base
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta_pct = delta / np.abs(base)
+        # Change as a share of the price stays meaningful when base EPV is near zero
+        price_impact = delta / np.asarray(universe['price'], dtype=dtype)
+    # argmin over an all-inf column is 0, which would name the first shock the worst
+    rated = ~np.isnan(delta).all(axis=0)
+    worst = np.where(rated, np.argmin(np.where(np.isnan(delta), np.inf, delta), axis=0), NO_SHOCK)
+    worst_impact = np.take_along_axis(price_impact, np.maximum(worst, 0)[np.newaxis], axis=0)[0]
+    return {
+        'shocks': np.array(shocks),
+        'base_epv': base,
+        'epv': stressed,
+        'delta': delta,
+        'delta_pct': delta_pct,
+        'price_impact': price_impact,
+        'worst_shock': worst,
+        'worst_price_impact': np.where(rated, worst_impact, np.nan)
+    }
+
+
+def worst_case_ranking(result, tickers, shock=None, top=None):
+    """Tickers ordered by stressed EPV change as a share of price, most damaged first, with those values.
+
+    Ranks by each company's worst shock, or by one named ``shock``.
+    """
+    if shock is None:
+        values = result['worst_price_impact']
+    else:
+        values = result['price_impact'][list(result['shocks']).index(shock)]
+    order = np.argsort(np.where(np.isnan(values), np.inf, values), kind='stable')[:top]
+    return np.asarray(tickers)[order], values[order]
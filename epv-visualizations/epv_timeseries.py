@@ -0,0 +1,125 @@
+"""
+Price vs EPV Tracking Time Series
+As-of joins of sparse, restated valuations onto dense daily prices for a whole universe
+"""
+
+import numpy as np
+
+from epv_engine import resolve_dtype
+from epv_screening import margin_of_safety
+
+DOWNSAMPLE_FREQS = ('W', 'M', 'Q', 'Y')
+
+
+def trading_days(start='2004-01-01', end='2024-01-01'):
+    """Business days between two dates as datetime64[D]"""
+    days = np.arange(np.datetime64(start, 'D'), np.datetime64(end, 'D'))
+    return days[np.is_busday(days)]
+
+
+def make_sample_price_history(n_tickers, dates, start_prices=None, seed=42, precision='float64'):
+    """Synthetic daily closes (tickers x days) following geometric Brownian motion"""
+    rng = np.random.default_rng(seed)
+    dtype = resolve_dtype(precision)
+    if start_prices is None:
+        start_prices = rng.lognormal(4.0, 0.6, n_tickers)
+
+    drift = rng.normal(0.07, 0.03, (n_tickers, 1)) / 252
+    vol = rng.uniform(0.15, 0.45, (n_tickers, 1)) / np.sqrt(252)
+    log_returns = drift - vol**2 / 2 + vol * rng.standard_normal((n_tickers, dates.size))
+    log_returns[:, 0] = 0
+    prices = np.asarray(start_prices, dtype=float)[:, np.newaxis] * np.exp(np.cumsum(log_returns, axis=1))
+    return prices.astype(dtype)
+
+
+def make_sample_valuations(prices, dates, restatement_rate=0.05, max_restatement_lag=90, seed=42):
+    """Quarterly EPV points per ticker (with occasional restatements) around the price path"""
+    rng = np.random.default_rng(seed)
+    n_tickers = prices.shape[0]
+    day_idx = np.arange(0, dates.size, 63)  # ~quarterly in trading days
+    ticker_idx = np.repeat(np.arange(n_tickers), day_idx.size)
+    day_idx = np.tile(day_idx, n_tickers)
+
+    publish_dates = dates[day_idx] + rng.integers(20, 45, day_idx.size).astype('timedelta64[D]')
+    epv = prices[ticker_idx, day_idx] * rng.lognormal(0.1, 0.25, day_idx.size)
+
+    # Restatements: same ticker, republished later with a revised value
+    restated = rng.random(day_idx.size) < restatement_rate
+    ticker_idx = np.concatenate([ticker_idx, ticker_idx[restated]])
+    publish_dates = np.concatenate([publish_dates, publish_dates[restated] +
+                                    rng.integers(30, max_restatement_lag, restated.sum()).astype('timedelta64[D]')])
+    epv = np.concatenate([epv, epv[restated] * rng.normal(1.0, 0.1, restated.sum())])
+    return {'ticker_idx': ticker_idx, 'publish_date': publish_dates, 'epv': epv.astype(prices.dtype)}
+
+
+def asof_align(ticker_idx, publish_dates, values, dates, n_tickers):
+    """Align sparse valuation points to a dense (tickers x days) grid.
+
+    Each day takes the latest value published on or before it (no look-ahead).
+    Points are sorted once by (ticker, trading day, input order) so that when
+    several land on the same day the last one in the input wins, then a
+    running maximum of row positions forward-fills every ticker in one pass.
+    """
+    ticker_idx = np.asarray(ticker_idx)
+    values = np.asarray(values)
+    n_days = dates.size
+
+    # First trading day on or after publication; points after the last day are dropped
+    day_idx = np.searchsorted(dates, np.asarray(publish_dates, dtype='datetime64[D]'), side='left')
+    keep = day_idx < n_days
+    keys = ticker_idx[keep] * n_days + day_idx[keep]
+    order = np.lexsort((np.flatnonzero(keep), keys))
+    keys, vals = keys[order], values[keep][order]
+
+    # Last point per (ticker, day) key
+    last = np.append(keys[1:] != keys[:-1], True)
+    keys, vals = keys[last], vals[last]
+
+    position = np.full(n_tickers * n_days, -1, dtype=np.int64)
+    position[keys] = np.arange(keys.size)
+    position = position.reshape(n_tickers, n_days)
+    # Forward fill: valid slots carry increasing positions within each ticker row
+    np.maximum.accumulate(position, axis=1, out=position)
+
+    aligned = np.full((n_tickers, n_days), np.nan, dtype=np.result_type(vals.dtype, np.float32))
+    filled = position >= 0
+    aligned[filled] = vals[position[filled]]
+    return aligned
+
+
+def tracking_series(prices, aligned_epv):
+    """Discount/premium of price to EPV and margin of safety for every ticker and day"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        premium = prices / aligned_epv - 1
+    # Days before a ticker's first valuation stay missing rather than -inf
+    mos = np.where(np.isnan(aligned_epv), np.nan, margin_of_safety(aligned_epv, prices))
+    return {'premium': premium, 'margin_of_safety': mos.astype(premium.dtype)}
+
+
+def downsample(dates, values, freq='W', how='last'):
+    """Reduce daily (..., days) series to one point per week/month/quarter/year.
+
+    ``how='last'`` keeps each period's final observation; ``how='mean'``
+    averages the non-missing days.
+    """
+    if freq == 'W':
+        # Monday-based weeks (datetime64[W] weeks start on Thursday)
+        periods = (dates - np.datetime64('1970-01-05', 'D')).astype(np.int64) // 7
+    elif freq in ('M', 'Q'):
+        periods = dates.astype('datetime64[M]').astype(np.int64) // (3 if freq == 'Q' else 1)
+    elif freq == 'Y':
+        periods = dates.astype('datetime64[Y]').astype(np.int64)
+    else:
+        raise ValueError(f"Unknown frequency '{freq}'. Choose from: {', '.join(DOWNSAMPLE_FREQS)}")
+    starts = np.flatnonzero(np.r_[True, periods[1:] != periods[:-1]])
+    ends = np.r_[starts[1:], dates.size] - 1
+
+    if how == 'last':
+        return dates[ends], values[..., ends]
+    if how == 'mean':
+        valid = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(valid, values, 0), starts, axis=-1)
+        counts = np.add.reduceat(valid.astype(np.int32), starts, axis=-1)
+        with np.errstate(invalid='ignore'):
+            return dates[ends], sums / counts
+    raise ValueError(f"Unknown downsample method '{how}'. Choose 'last' or 'mean'")
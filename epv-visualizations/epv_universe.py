@@ -0,0 +1,128 @@
+"""
+Columnar Company Universe
+Array layout shared by the batch EPV engines, plus a synthetic sample universe
+"""
+
+import numpy as np
+
+from epv_engine import compute_epv, resolve_dtype
+
+# (companies x years) panels, $ millions
+PANEL_COLUMNS = ('ebit', 'revenue', 'total_capex', 'maint_capex', 'depreciation', 'ppe')
+
+# One value per company: rates, $ millions, millions of shares, $/share
+SCALAR_COLUMNS = ('tax_rate', 'wacc', 'net_debt', 'shares', 'price')
+
+# Latest balance-sheet line items per company, $ millions (PP&E is the last year of the ppe panel;
+# cash is already netted in net_debt)
+BALANCE_SHEET_COLUMNS = ('receivables', 'inventory', 'other_assets', 'intangibles', 'payables',
+                         'accrued_liabilities')
+
+# Profile of the built-in sample company that every script uses
+SAMPLE_YEARS = np.arange(2014, 2024)
+SAMPLE_EBIT = np.array([105, 120, 145, 130, 95, 80, 110, 155, 125, 115], dtype=float)
+SAMPLE_REVENUE = np.array([800, 920, 1100, 980, 750, 650, 850, 1200, 980, 900], dtype=float)
+SAMPLE_TOTAL_CAPEX = np.array([80, 95, 75, 110, 85], dtype=float)        # 2019-2023
+SAMPLE_MAINT_CAPEX = np.array([50, 55, 52, 60, 58], dtype=float)
+SAMPLE_DEPRECIATION = np.array([45, 48, 50, 52, 55], dtype=float)
+SAMPLE_PPE = np.array([500, 520, 540, 580, 600], dtype=float)       # asset base
+SAMPLE_BALANCE_SHEET = {'receivables': 110.0, 'inventory': 90.0, 'other_assets': 20.0,
+                        'intangibles': 45.0, 'payables': 70.0, 'accrued_liabilities': 30.0}
+
+
+def sample_company_universe(ticker='SAMPLE', precision='float64'):
+    """The built-in sample company as a one-row universe.
+
+    Capex history only covers 2019-2023, so earlier years are back-filled with
+    the five-year averages (leaving the normalized figures unchanged) and the
+    asset base with its 2019 level. Shares
+    are set so the base-case EPV lands near the dashboards' $125.
+    """
+    dtype = resolve_dtype(precision)
+    n_backfill = SAMPLE_YEARS.size - SAMPLE_TOTAL_CAPEX.size
+
+    def backfill(values):
+        return np.concatenate([np.full(n_backfill, values.mean()), values])[np.newaxis]
+
+    columns = {
+        'ebit': SAMPLE_EBIT[np.newaxis],
+        'revenue': SAMPLE_REVENUE[np.newaxis],
+        'total_capex': backfill(SAMPLE_TOTAL_CAPEX),
+        'maint_capex': backfill(SAMPLE_MAINT_CAPEX),
+        'depreciation': backfill(SAMPLE_DEPRECIATION),
+        'ppe': np.concatenate([np.full(n_backfill, SAMPLE_PPE[0]), SAMPLE_PPE])[np.newaxis],
+        'tax_rate': np.array([0.25]),
+        'wacc': np.array([0.08]),
+        'net_debt': np.array([0.0]),
+        'shares': np.array([3.3]),
+        'price': np.array([105.0])
+    }
+    universe = {'ticker': np.array([ticker]), 'year': SAMPLE_YEARS.copy()}
+    columns.update({name: np.array([value]) for name, value in SAMPLE_BALANCE_SHEET.items()})
+    for name in PANEL_COLUMNS + SCALAR_COLUMNS + BALANCE_SHEET_COLUMNS:
+        universe[name] = columns[name].astype(dtype)
+    return universe
+
+
+def make_sample_universe(n_companies=1000, seed=42, precision='float64'):
+    """Generate a synthetic universe scaled and perturbed from the sample company"""
+    rng = np.random.default_rng(seed)
+    dtype = resolve_dtype(precision)
+    n_years = SAMPLE_YEARS.size
+
+    size = rng.lognormal(0.0, 1.0, (n_companies, 1))
+    cycle_noise = rng.normal(1.0, 0.08, (n_companies, n_years))
+    margin = rng.uniform(0.7, 1.3, (n_companies, 1))
+
+    revenue = SAMPLE_REVENUE * size * cycle_noise
+    ebit = SAMPLE_EBIT * size * cycle_noise * margin
+    capex_intensity = rng.uniform(0.06, 0.14, (n_companies, 1))
+    total_capex = revenue * capex_intensity * rng.normal(1.0, 0.1, (n_companies, n_years))
+    maint_capex = total_capex * rng.uniform(0.5, 0.8, (n_companies, 1))
+    depreciation = maint_capex * rng.uniform(0.8, 1.1, (n_companies, n_years))
+
+    tax_rate = rng.uniform(0.18, 0.30, n_companies)
+    wacc = rng.uniform(0.07, 0.12, n_companies)
+    net_debt = ebit.mean(axis=1) * rng.uniform(-0.5, 3.0, n_companies)
+    shares = 3.6 * size[:, 0] * rng.uniform(0.8, 1.2, n_companies)
+
+    epv = compute_epv(ebit.mean(axis=1), tax_rate, maint_capex.mean(axis=1), wacc,
+                      net_debt, shares)
+    price = np.abs(epv) * rng.lognormal(0.0, 0.3, n_companies) + 1.0
+
+    # Net PP&E rolls forward from an opening asset base with capex less depreciation
+    opening_ppe = revenue[:, :1] * rng.uniform(0.45, 0.85, (n_companies, 1))
+    ppe = opening_ppe + np.cumsum(total_capex - depreciation, axis=1)
+
+    # Working capital and other balance-sheet items as shares of latest revenue
+    balance_sheet_ranges = {'receivables': (0.08, 0.18), 'inventory': (0.05, 0.20),
+                            'other_assets': (0.01, 0.05), 'intangibles': (0.00, 0.30),
+                            'payables': (0.05, 0.12), 'accrued_liabilities': (0.02, 0.06)}
+    balance_sheet = [revenue[:, -1] * rng.uniform(*balance_sheet_ranges[name], n_companies)
+                     for name in BALANCE_SHEET_COLUMNS]
+
+    universe = {'ticker': np.array([f'CO{i:05d}' for i in range(n_companies)]),
+                'year': SAMPLE_YEARS.copy()}
+    for name, values in zip(PANEL_COLUMNS + SCALAR_COLUMNS + BALANCE_SHEET_COLUMNS,
+                            (ebit, revenue, total_capex, maint_capex, depreciation, ppe,
+                             tax_rate, wacc, net_debt, shares, price, *balance_sheet)):
+        universe[name] = values.astype(dtype)
+    return universe
+
+
+def company_record(universe, ticker, epv_per_share=None):
+    """One company's rows from a columnar universe as a plain dict"""
+    matches = np.flatnonzero(universe['ticker'] == ticker)
+    if matches.size == 0:
+        raise KeyError(f"Ticker '{ticker}' is not in the universe")
+    return company_at(universe, int(matches[0]), epv_per_share)
+
+
+def company_at(universe, index, epv_per_share=None):
+    """company_record for the company in row ``index`` (no ticker search, for loops over a universe)"""
+    record = {'ticker': universe['ticker'][index], 'year': universe['year']}
+    for name in PANEL_COLUMNS + SCALAR_COLUMNS + BALANCE_SHEET_COLUMNS:
+        record[name] = universe[name][index]
+    if epv_per_share is not None:
+        record['epv_per_share'] = epv_per_share[index]
+    return record
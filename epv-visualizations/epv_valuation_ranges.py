@@ -0,0 +1,106 @@
+"""
+Valuation Range Arrays
+Football-field method ranges as one structured array of (company, method) rows, with vectorized fair-value and overlap maths
+"""
+
+import numpy as np
+
+from epv_engine import resolve_dtype
+
+# Risk labels used by the football field, stored as int8 codes (-1 = unrated)
+RISK_CLASSES = ('Low', 'Medium', 'High')
+
+
+def range_dtype(precision='float64'):
+    """Row layout: company index, method code, low/mid/high $/share, confidence %, weight, risk code"""
+    value = resolve_dtype(precision)
+    return np.dtype([('company', np.int32), ('method', np.int16), ('low', value), ('mid', value),
+                     ('high', value), ('confidence', np.float32), ('weight', np.float32), ('risk', np.int8)])
+
+
+def valuation_ranges(rows, methods=None, company=0, precision='float64'):
+    """Pack football-field dicts into a structured array; returns (ranges, method names).
+
+    Rows need 'method', 'low' and 'high'. A missing 'mid' is the range
+    midpoint, a missing 'weight' is 1 and missing 'confidence'/'risk' are
+    NaN/unrated. Method names get codes in first-seen order, after any given
+    ``methods`` (pass the same tuple to pack several companies consistently).
+    """
+    methods = list(methods or ())
+    codes = {name: code for code, name in enumerate(methods)}
+    ranges = np.empty(len(rows), dtype=range_dtype(precision))
+    for i, row in enumerate(rows):
+        if row['method'] not in codes:
+            codes[row['method']] = len(methods)
+            methods.append(row['method'])
+        ranges[i] = (company, codes[row['method']], row['low'], row.get('mid', (row['low'] + row['high']) / 2),
+                     row['high'], row.get('confidence', np.nan), row.get('weight', 1.0),
+                     RISK_CLASSES.index(row['risk']) if 'risk' in row else -1)
+    return ranges, np.array(methods)
+
+
+def range_records(ranges, methods):
+    """Structured rows back to the football-field dicts (for plotting a handful of rows)"""
+    return [{'method': str(methods[row['method']]), 'low': float(row['low']), 'mid': float(row['mid']),
+             'high': float(row['high']), 'confidence': float(row['confidence']), 'weight': float(row['weight']),
+             'risk': RISK_CLASSES[row['risk']] if row['risk'] >= 0 else None}
+            for row in ranges]
+
+
+def _company_count(ranges, n_companies):
+    """An explicit company count (0 included), else one past the highest company index (0 without rows)"""
+    if n_companies is None:
+        n_companies = int(ranges['company'].max()) + 1 if ranges.size else 0
+    return n_companies
+
+
+def weighted_fair_value(ranges, n_companies=None, by_confidence=False):
+    """Weighted average midpoint per company (NaN for companies without weight).
+
+    Weights are the 'weight' field, multiplied by confidence when
+    ``by_confidence`` is set. One bincount pass, whatever the row count.
+    """
+    n_companies = _company_count(ranges, n_companies)
+    weight = ranges['weight'].astype(float)
+    if by_confidence:
+        weight = weight * np.nan_to_num(ranges['confidence'])
+    total = np.bincount(ranges['company'], weights=weight * ranges['mid'], minlength=n_companies)
+    weights = np.bincount(ranges['company'], weights=weight, minlength=n_companies)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return total / weights
+
+
+def range_overlap(ranges, low, high):
+    """Share of each row's range inside [low, high]; per-company bounds are looked up by company index.
+
+    With low == high (e.g. the current price) this is 1 for rows whose
+    range contains that value and 0 otherwise.
+    """
+    low, high = np.asarray(low), np.asarray(high)
+    if low.ndim:
+        low, high = low[ranges['company']], high[ranges['company']]
+    overlap = np.minimum(ranges['high'], high) - np.maximum(ranges['low'], low)
+    width = ranges['high'] - ranges['low']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        share = np.where(width > 0, np.clip(overlap, 0, None) / width,
+                         (ranges['low'] >= low) & (ranges['high'] <= high))
+    # A single value (low == high) scores whether the row's range contains it
+    contains = (ranges['low'] <= low) & (ranges['high'] >= high)
+    return np.where(high > low, share, contains).astype(float)
+
+
+def consensus_range(ranges, n_companies=None):
+    """Per-company intersection of all method ranges as (low, high); low > high means no common value"""
+    n_companies = _company_count(ranges, n_companies)
+    low = np.full(n_companies, -np.inf)
+    high = np.full(n_companies, np.inf)
+    np.maximum.at(low, ranges['company'], ranges['low'])
+    np.minimum.at(high, ranges['company'], ranges['high'])
+    return low, high
+
+
+def pairwise_overlap(ranges):
+    """(rows x rows) length of the overlap between every pair of ranges (e.g. one company's methods)"""
+    overlap = (np.minimum(ranges['high'][:, np.newaxis], ranges['high'])
+               - np.maximum(ranges['low'][:, np.newaxis], ranges['low']))
+    return np.clip(overlap, 0, None)
@@ -0,0 +1,141 @@
+"""
+EPV Plot Registry
+Dashboard variants register by name and declare their inputs; modules load on demand
+"""
+
+import importlib
+
+# Input name -> how to build it (module, attribute, run settings it accepts)
+INPUT_REGISTRY = {}
+
+# Plot name -> where it lives and which inputs it needs
+PLOT_REGISTRY = {}
+
+
+def register_input(name, module, builder, accepts=()):
+    """Register a shared plot input built by ``module.builder(**run settings)``"""
+    INPUT_REGISTRY[name] = {'module': module, 'builder': builder, 'accepts': tuple(accepts)}
+
+
+def register_plot(name, module, function, owner=None, requires=None, company_aware=False,
+                  description=''):
+    """Register a dashboard by name.
+
+    ``owner`` names an input whose method ``function`` draws the plot (the
+    suite classes); otherwise ``module.function`` is called with ``requires``
+    mapping keyword arguments to input names. Nothing is imported here.
+    """
+    PLOT_REGISTRY[name] = {
+        'module': module,
+        'function': function,
+        'owner': owner,
+        'requires': dict(requires or {}),
+        'company_aware': company_aware,
+        'description': description
+    }
+
+
+def required_inputs(plot_names):
+    """Distinct inputs needed by a set of plots, in first-use order"""
+    names = []
+    for plot_name in plot_names:
+        spec = PLOT_REGISTRY[plot_name]
+        for input_name in ([spec['owner']] if spec['owner'] else []) + list(spec['requires'].values()):
+            if input_name not in names:
+                names.append(input_name)
+    return names
+
+
+def required_modules(plot_names):
+    """Modules a run of these plots will import"""
+    modules = [PLOT_REGISTRY[name]['module'] for name in plot_names]
+    modules += [INPUT_REGISTRY[name]['module'] for name in required_inputs(plot_names)]
+    return sorted(set(modules))
+
+
+class PlotRun:
+    """One rendering pass: imports modules and builds each input once, on first use"""
+
+    def __init__(self, company=None, precision='float64'):
+        self.settings = {'company': company, 'precision': precision}
+        self.inputs = {}
+
+    def get_input(self, name):
+        """Build (or reuse) a registered input"""
+        if name not in self.inputs:
+            spec = INPUT_REGISTRY[name]
+            builder = getattr(importlib.import_module(spec['module']), spec['builder'])
+            kwargs = {key: self.settings[key] for key in spec['accepts']}
+            self.inputs[name] = builder(**kwargs)
+        return self.inputs[name]
+
+    def render(self, plot_name, show=False):
+        """Draw a registered plot and return its figure"""
+        spec = PLOT_REGISTRY[plot_name]
+        if spec['owner']:
+            plot = getattr(self.get_input(spec['owner']), spec['function'])
+            return plot(show=show)
+
+        plot = getattr(importlib.import_module(spec['module']), spec['function'])
+        kwargs = {key: self.get_input(input_name) for key, input_name in spec['requires'].items()}
+        return plot(show=show, **kwargs)
+
+
+# Shared inputs
+register_input('complete_suite', 'complete_epv_suite', 'EnhancedEPVSuite',
+               accepts=('precision', 'company'))
+register_input('analyzer', 'enhanced_epv_analysis', 'EPVAnalyzer')
+register_input('professional_data', 'enhanced_prompts_2_implementation', 'create_sample_data')
+register_input('enhanced_data', 'ultimate_enhanced_epv', 'create_enhanced_data')
+
+# complete_epv_suite.py
+register_plot('ebit', 'complete_epv_suite', 'plot_1_normalized_ebit_enhanced',
+              owner='complete_suite', company_aware=True,
+              description="EBIT normalization with volatility and cycle panels")
+register_plot('capex', 'complete_epv_suite', 'plot_2_capex_breakdown_enhanced',
+              owner='complete_suite', company_aware=True,
+              description="Maintenance vs growth capex breakdown")
+register_plot('epv-dcf', 'complete_epv_suite', 'plot_3_epv_dcf_interactive_enhanced',
+              owner='complete_suite', company_aware=True,
+              description="Interactive EPV vs DCF comparison")
+register_plot('wacc', 'complete_epv_suite', 'plot_4_wacc_sensitivity_enhanced',
+              owner='complete_suite', company_aware=True,
+              description="WACC sensitivity with investment zones")
+register_plot('waterfall', 'complete_epv_suite', 'plot_5_epv_waterfall_enhanced',
+              owner='complete_suite',
+              description="EPV build-up waterfall per scenario")
+register_plot('football-field', 'complete_epv_suite', 'plot_6_football_field_enhanced',
+              owner='complete_suite', company_aware=True,
+              description="Valuation football field with risk levels")
+
+# enhanced_epv_analysis.py
+register_plot('ebit-advanced', 'enhanced_epv_analysis', 'plot_normalized_ebit_advanced',
+              owner='analyzer', description="EBIT normalization with margin and revenue panels")
+register_plot('epv-dcf-dashboard', 'enhanced_epv_analysis', 'plot_interactive_epv_dcf_enhanced',
+              owner='analyzer', description="EPV vs DCF dashboard with terminal multiples")
+register_plot('monte-carlo', 'enhanced_epv_analysis', 'plot_monte_carlo_simulation',
+              owner='analyzer', description="Monte Carlo EPV distribution and risk metrics")
+
+# enhanced_prompts_2_implementation.py
+register_plot('ebit-professional', 'enhanced_prompts_2_implementation',
+              'plot_1_normalized_ebit_professional', requires={'data': 'professional_data'},
+              description="2x3 professional EBIT normalization suite")
+register_plot('capex-professional', 'enhanced_prompts_2_implementation',
+              'plot_2_maintenance_capex_professional', requires={'data': 'professional_data'},
+              description="2x3 professional maintenance capex suite")
+
+# ultimate_enhanced_epv.py
+register_plot('ebit-enhanced', 'ultimate_enhanced_epv', 'plot_1_enhanced_ebit',
+              requires={'data': 'enhanced_data'}, description="EBIT normalization with trend")
+register_plot('capex-enhanced', 'ultimate_enhanced_epv', 'plot_2_enhanced_capex',
+              requires={'data': 'enhanced_data'}, description="Capex breakdown with ratios")
+register_plot('epv-dcf-enhanced', 'ultimate_enhanced_epv', 'plot_3_enhanced_epv_dcf',
+              requires={'data': 'enhanced_data'}, description="EPV vs DCF decision matrix")
+
+# ultimate_epv.py (self-contained data)
+register_plot('ebit-ultimate', 'ultimate_epv', 'enhanced_ebit_analysis',
+              description="Compact EBIT normalization")
+register_plot('capex-ultimate', 'ultimate_epv', 'enhanced_capex_analysis',
+              description="Compact capex breakdown")
+register_plot('epv-dcf-ultimate', 'ultimate_epv', 'enhanced_epv_dcf_comparison',
+              description="Compact EPV vs DCF comparison")
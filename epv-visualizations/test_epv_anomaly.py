@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from epv_anomaly import flag_counts, scan_anomalies, zscores
+from epv_universe import make_sample_universe, sample_company_universe
+
+
+def test_zscores_match_professional_chart_bands():
+    ebit = sample_company_universe()['ebit']
+    z = zscores(ebit)[0]
+    assert z[7] == pytest.approx((155 - ebit.mean()) / ebit.std(ddof=1))
+    robust = zscores(np.array([[10.0, 11.0, 9.0, 10.0, 100.0]]), 'robust')[0]
+    assert robust[-1] > 50 and abs(robust[0]) < 1
+    assert np.all(np.isnan(zscores(np.full((1, 5), 3.0))))
+    with pytest.raises(ValueError):
+        zscores(ebit, 'iqr')
+
+
+def test_scan_flags_planted_outliers():
+    universe = make_sample_universe(300)
+    universe['ebit'][[12, 250], [3, 8]] *= 6
+    table = scan_anomalies(universe, method='robust')
+    ebit_rows = table['series'] == 'ebit'
+    flagged = set(zip(table['ticker'][ebit_rows], table['year'][ebit_rows]))
+    assert {('CO00012', 2017), ('CO00250', 2022)} <= flagged
+    assert np.all(np.abs(table['zscore']) > 2)
+    assert np.all(np.diff(np.abs(table['zscore'])) <= 0)
+
+    counts = flag_counts(table, universe['ticker'])
+    assert counts.sum() == table['ticker'].size and counts[12] >= 1
+    # Only the requested tickers are counted, whatever else the table flags
+    selected = flag_counts(table, ['CO00250', 'CO00012'])
+    assert list(selected) == [counts[250], counts[12]]
+    assert flag_counts(table, []).size == 0
+
+
+def test_missing_years_are_flagged_without_hiding_outliers():
+    universe = make_sample_universe(50)
+    universe['ebit'][1, 4] *= 20
+    universe['revenue'][1, 7] = np.nan
+    universe['revenue'][2, 2] = 0.0
+    table = scan_anomalies(universe)
+    flagged = set(zip(table['ticker'], table['series'], table['year']))
+    # The outlier is still found on both series despite the missing revenue year
+    assert {('CO00001', 'ebit', 2018), ('CO00001', 'margin', 2018)} <= flagged
+    assert {('CO00001', 'margin', 2021), ('CO00002', 'margin', 2016)} <= flagged
+    missing = ~np.isfinite(table['value'])
+    assert missing.sum() == 2 and np.isnan(table['zscore'][missing]).all()
+    assert np.all(np.abs(table['zscore'][~missing]) > 2)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from epv_backtest import (backtest, carry_prices, max_drawdown, parameter_grid, rebalance_days, run_backtests,
+                          zone_signals)
+from epv_timeseries import asof_align, make_sample_price_history, make_sample_valuations, trading_days
+
+
+def test_zone_signals_wait_for_first_valuation():
+    prices = np.array([[100.0, 100.0, 100.0]])
+    epv = np.array([[np.nan, 130.0, 80.0]])
+    np.testing.assert_array_equal(zone_signals(prices, epv), [[-1, 3, 0]])
+
+
+def test_strategy_holds_undervalued_name_from_next_day():
+    dates = trading_days('2024-01-01', '2024-04-01')
+    growth = np.cumprod(np.full(dates.size, 1.01))
+    prices = np.vstack([100 * growth, np.full(dates.size, 100.0)])
+    epv = np.vstack([prices[0] * 2, prices[1] * 0.5])
+
+    result = backtest(prices, epv, dates, {'cost_bps': 0})
+    first = rebalance_days(dates, 'M')[0]
+    np.testing.assert_allclose(result['equity'][:first + 1], 1)
+    np.testing.assert_allclose(result['equity'][first:], growth[first:] / growth[first])
+    np.testing.assert_array_equal(result['holdings'], 1)
+    # The benchmark holds both names: half the return of the winner each month
+    assert result['stats']['excess_cagr'] > 0
+    assert result['stats']['max_drawdown'] == pytest.approx(0)
+
+
+def test_delisted_name_keeps_its_last_price():
+    np.testing.assert_array_equal(carry_prices(np.array([[np.nan, 5.0, np.nan, 4.0, np.nan]])),
+                                  [[np.nan, 5.0, 5.0, 4.0, 4.0]])
+    dates = trading_days('2024-01-01', '2024-04-01')
+    first = rebalance_days(dates, 'M')[0]
+    prices = np.full((2, dates.size), 100.0)
+    # The second name halves, then stops trading: the loss stays in the equity curve
+    prices[1, first + 5:] = 50.0
+    prices[1, first + 10:] = np.nan
+    epv = np.full((2, dates.size), 200.0)
+
+    equity = backtest(prices, epv, dates, {'cost_bps': 0})['equity']
+    assert equity[first + 10] == pytest.approx(0.75)
+    assert equity[-1] == pytest.approx(0.75)
+
+
+def test_costs_and_drawdown():
+    assert max_drawdown(np.array([1.0, 1.2, 0.9, 1.5])) == pytest.approx(0.25)
+    dates = trading_days('2024-01-01', '2024-03-01')
+    prices = np.full((1, dates.size), 50.0)
+    epv = np.full((1, dates.size), 100.0)
+    result = backtest(prices, epv, dates, {'cost_bps': 25})
+    assert result['equity'][-1] == pytest.approx(1 - 0.0025)
+
+
+def test_parallel_grid_matches_serial():
+    dates = trading_days('2020-01-01', '2022-01-01')
+    prices = make_sample_price_history(60, dates)
+    valuations = make_sample_valuations(prices, dates)
+    epv = asof_align(valuations['ticker_idx'], valuations['publish_date'], valuations['epv'], dates, 60)
+    grid = parameter_grid(rebalance=('Q',))
+    serial = run_backtests(prices, epv, dates, grid)
+    assert run_backtests(prices, epv, dates, grid, workers=2) == serial
+    assert [row['min_zone'] for row in serial] == ['Buy', 'Strong Buy', 'Buy', 'Strong Buy']
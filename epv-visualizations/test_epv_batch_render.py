@@ -0,0 +1,57 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+
+from enhanced_prompts_2_implementation import (create_sample_data, plot_1_normalized_ebit_professional,
+                                               plot_2_maintenance_capex_professional)
+from epv_batch_render import CapexPageTemplate, EBITPageTemplate, render_universe
+from epv_universe import company_at, company_record, make_sample_universe, sample_company_universe
+
+
+def test_template_updates_in_place():
+    universe = make_sample_universe(3)
+    template = EBITPageTemplate(universe['year'], dpi=20)
+    fig = template.fig
+    for index in range(3):
+        company = company_at(universe, index)
+        assert template.update(company) is fig
+        np.testing.assert_allclose([bar.get_height() for bar in template.bars], company['ebit'])
+    assert template.stats_legend.get_texts()[1].get_text() == (
+        f"Normalized EBIT: ${company['ebit'].mean():.1f}M")
+    template.close()
+
+
+def test_capex_page_matches_professional_suite_figures():
+    template = CapexPageTemplate(sample_company_universe()['year'][-5:], dpi=20)
+    template.update(company_record(sample_company_universe(), 'SAMPLE'))
+    assert [bar.get_height() for bar in template.growth_bars] == [30, 40, 23, 50, 27]
+    assert template.allocation_legend.get_texts()[0].get_text() == 'Avg Maintenance: $55.0M'
+    template.close()
+
+
+def test_professional_plots_draw_through_the_templates():
+    data = create_sample_data()
+    fig = plot_1_normalized_ebit_professional(show=False, data=data)
+    ax1, ax2 = fig.axes[:2]
+    assert [bar.get_height() for bar in ax1.containers[0]] == data[0]['EBIT']
+    assert [bar.get_height() for bar in ax2.containers[1]] == data[0]['Industry_EBIT']
+    assert ax1.get_legend().get_texts()[1].get_text() == 'Normalized EBIT: $118.0M'
+    plt.close(fig)
+
+    fig = plot_2_maintenance_capex_professional(show=False, data=data)
+    assert fig.axes[0].get_legend().get_texts()[0].get_text() == 'Avg Maintenance: $55.0M'
+    # Asset turnover keeps the suite's simplified 900 revenue
+    turnover = [bar.get_height() for bar in fig.axes[4].containers[0]]
+    np.testing.assert_allclose(turnover, 900 / np.asarray(data[1]['Asset_Base']))
+    plt.close(fig)
+
+
+def test_render_universe_writes_selected_pages(tmp_path):
+    universe = make_sample_universe(4)
+    written = render_universe(universe, ['CO00001', 'CO00003'], output_dir=str(tmp_path), dpi=20)
+    assert [path.split('/')[-1] for path in written] == [
+        'CO00001_ebit-professional.png', 'CO00001_capex-professional.png',
+        'CO00003_ebit-professional.png', 'CO00003_capex-professional.png']
+    with Image.open(written[0]) as image:
+        assert image.size == (480, 320)
+        assert image.mode == 'RGB'
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from epv_bootstrap import block_bootstrap_indices, bootstrap_epv, bootstrap_mean_ci, resample_weights
+from epv_engine import batch_epv
+from epv_universe import company_record, make_sample_universe
+
+
+def test_indices_are_circular_blocks_of_consecutive_years():
+    indices = block_bootstrap_indices(10, 500, block_length=3, rng=np.random.default_rng(0))
+    assert indices.shape == (500, 10)
+    steps = np.diff(indices, axis=1)[:, [0, 1, 3, 4, 6, 7]]
+    assert np.all((steps == 1) | (steps == -9))
+    assert set(np.unique(indices)) == set(range(10))
+
+
+def test_weights_give_resampled_means():
+    panel = np.random.default_rng(1).normal(100, 20, (7, 10))
+    indices = block_bootstrap_indices(10, 50, rng=np.random.default_rng(2))
+    weights = resample_weights(indices, 10)
+    np.testing.assert_allclose(weights.sum(axis=1), 1)
+    np.testing.assert_allclose(panel @ weights.T, panel[:, indices].mean(axis=-1))
+
+
+def test_universe_intervals_match_single_company():
+    universe = make_sample_universe(40)
+    result = bootstrap_epv(universe, n_boot=400, seed=5)
+    np.testing.assert_allclose(result['epv_per_share'], batch_epv(universe)['epv_per_share'])
+    assert result['epv_ci'].shape == (40, 2)
+    low, high = result['normalized_ebit_ci'].T
+    assert np.all((low <= result['normalized_ebit']) & (result['normalized_ebit'] <= high))
+
+    single = bootstrap_epv(company_record(universe, universe['ticker'][9]), n_boot=400, seed=5)
+    np.testing.assert_allclose(single['epv_ci'], result['epv_ci'][9])
+    np.testing.assert_allclose(single['maint_capex_ci'], result['maint_capex_ci'][9])
+    assert single['epv_per_share'] == pytest.approx(result['epv_per_share'][9])
+
+
+def test_mean_ci_brackets_sample_mean():
+    ebit = [105, 120, 145, 130, 95, 80, 110, 155, 125, 115]
+    low, high = bootstrap_mean_ci(ebit)
+    assert low < np.mean(ebit) < high
+    assert high - low < np.ptp(ebit)
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from epv_capex import estimate_maint_capex, with_estimated_maint_capex
+from epv_engine import batch_epv
+from epv_universe import company_record, make_sample_universe, sample_company_universe
+
+
+def test_growth_capex_follows_sales_increases():
+    record = company_record(sample_company_universe(), 'SAMPLE')
+    estimate = estimate_maint_capex(record)
+    ratio = np.mean(record['ppe'] / record['revenue'])
+    assert estimate['ppe_to_sales'] == pytest.approx(ratio)
+    # 2019 -> 2020 sales rise by 200: growth capex would be ~118 but is capped at total capex
+    assert estimate['growth_capex'][6] == 95 and estimate['maint_capex'][6] == 0
+    # Falling sales: all capex is maintenance
+    assert estimate['maint_capex'][3] == record['total_capex'][3]
+    np.testing.assert_allclose(estimate['maint_capex'] + estimate['growth_capex'], record['total_capex'])
+
+
+def test_estimates_feed_batch_epv():
+    universe = make_sample_universe(50)
+    estimate = estimate_maint_capex(universe)
+    assert estimate['maint_capex'].shape == universe['maint_capex'].shape
+    assert np.all((estimate['maint_capex'] >= 0) & (estimate['maint_capex'] <= universe['total_capex']))
+    np.testing.assert_allclose(estimate['sustainability_ratio'],
+                               (estimate['maint_capex'] / universe['depreciation']).mean(axis=1))
+
+    epv = batch_epv(with_estimated_maint_capex(universe))
+    np.testing.assert_allclose(epv['maint_capex'], estimate['maint_capex'].mean(axis=1))
+    single = estimate_maint_capex(company_record(universe, universe['ticker'][3]))
+    np.testing.assert_allclose(single['maint_capex'], estimate['maint_capex'][3])
@@ -0,0 +1,43 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from epv_cli import parse_args, run_compute_only
+
+
+def compute(tmp_path, *argv):
+    return run_compute_only(parse_args(['--compute-only', '--output-dir', str(tmp_path), *argv]))
+
+
+def test_companies_need_a_universe():
+    with pytest.raises(SystemExit):
+        parse_args(['--companies', 'CO00001'])
+    with pytest.raises(SystemExit):
+        parse_args(['--plots', 'no-such-plot'])
+
+
+def test_unknown_tickers_are_rejected(tmp_path):
+    with pytest.raises(SystemExit, match='CO99999'):
+        compute(tmp_path, '--universe-size', '20', '--companies', 'CO00001', 'CO99999')
+    with pytest.raises(SystemExit, match='UNKNOWN'):
+        compute(tmp_path, '--universe-size', '20', '--companies', 'UNKNOWN')
+
+
+def test_percentiles_do_not_depend_on_workers(tmp_path):
+    argv = ('--universe-size', '600', '--simulations', '300')
+    single = compute(tmp_path / 'one', *argv, '--workers', '1')
+    pooled = compute(tmp_path / 'two', *argv, '--workers', '2')
+    assert len(single) == 600
+    np.testing.assert_array_equal(single['epv_p10'], pooled['epv_p10'])
+
+
+def test_selected_companies_with_anomalies_and_stress(tmp_path):
+    metrics = compute(tmp_path, '--universe-size', '50', '--companies', 'CO00003', 'CO00001',
+                      '--anomalies', 'robust', '--stress')
+    assert list(metrics['ticker']) == ['CO00001', 'CO00003']
+    stress = pd.read_csv(os.path.join(tmp_path, 'epv_stress.csv'))
+    assert sorted(stress['ticker']) == ['CO00001', 'CO00003']
+    anomalies = pd.read_csv(os.path.join(tmp_path, 'epv_anomalies.csv'))
+    assert set(anomalies['ticker']) <= {'CO00001', 'CO00003'}
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from epv_dcf import batch_dcf, dcf_scenarios, dcf_value
+from epv_engine import batch_epv
+from epv_universe import make_sample_universe
+
+
+def explicit_dcf(cash_flow, wacc, growth, years, terminal_growth):
+    """Year-by-year reference: discounted growing cash flows plus a Gordon terminal value"""
+    flows = [cash_flow * (1 + growth) ** t / (1 + wacc) ** t for t in range(1, years + 1)]
+    terminal = cash_flow * (1 + growth) ** years * (1 + terminal_growth) / (wacc - terminal_growth)
+    return sum(flows) + terminal / (1 + wacc) ** years
+
+
+@pytest.mark.parametrize('growth, terminal_growth', [(0.0, 0.0), (0.04, 0.03), (0.09, 0.02)])
+def test_closed_form_matches_year_by_year(growth, terminal_growth):
+    dcf = dcf_value(10.0, 0.09, growth, years=10, terminal_growth=terminal_growth)
+    assert dcf['value'] == pytest.approx(explicit_dcf(10.0, 0.09, growth, 10, terminal_growth))
+
+
+def test_zero_growth_dcf_is_epv_and_growth_above_wacc_is_nan():
+    scenarios = dcf_scenarios(10.0, 0.08)
+    assert scenarios['value'][0] == pytest.approx(125.0)
+    assert scenarios['terminal_multiple'][0] == pytest.approx(12.5)
+    assert np.isnan(dcf_value(10.0, 0.02, 0.03)['value'])
+
+
+def test_batch_dcf_broadcasts_growth_wacc_and_companies():
+    universe = make_sample_universe(500)
+    own = batch_dcf(universe)
+    np.testing.assert_allclose(own['dcf_per_share'][0], own['epv_per_share'])
+
+    grid = batch_dcf(universe, wacc=np.array([0.07, 0.09, 0.11]))
+    assert grid['dcf_per_share'].shape == (4, 3, 500)
+    cash_flow = batch_epv(universe)['distributable_earnings'][7]
+    assert grid['enterprise_value'][2, 1, 7] == pytest.approx(dcf_value(cash_flow, 0.09, 0.04)['value'])
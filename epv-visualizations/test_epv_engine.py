@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from epv_engine import batch_epv, compute_epv, resolve_dtype, wacc_sensitivity_grid
+from epv_monte_carlo import simulate_epv, simulate_epv_adaptive
+from epv_universe import make_sample_universe
+
+MC_PARAMS = {
+    'base_ebit': 125,
+    'ebit_volatility': 0.20,
+    'wacc_base': 0.09,
+    'wacc_volatility': 0.015,
+    'tax_rate': 0.25,
+    'maint_capex_pct': 0.06,
+    'simulations': 100000
+}
+
+
+def test_compute_epv_matches_waterfall():
+    # Base Case scenario from the waterfall dashboard
+    epv = compute_epv(1500, 0.25, 400, 0.08, 2000, 100)
+    assert epv == pytest.approx((1500 * 0.75 - 400) / 0.08 / 100 - 20)
+
+
+def test_unknown_precision_is_rejected():
+    with pytest.raises(ValueError):
+        resolve_dtype('float16')
+
+
+def test_float32_monte_carlo_stays_float32():
+    results = simulate_epv({**MC_PARAMS, 'precision': 'float32'}, n_sims=1000)
+    for key in ('epv', 'ebit', 'wacc', 'tax_rate'):
+        assert results[key].dtype == np.float32
+
+    adaptive = simulate_epv_adaptive({**MC_PARAMS, 'precision': 'float32', 'adaptive': {}})
+    assert adaptive['epv'].dtype == np.float32
+
+
+def test_float32_percentiles_track_float64():
+    full = simulate_epv({**MC_PARAMS, 'precision': 'float64'})['epv']
+    compact = simulate_epv({**MC_PARAMS, 'precision': 'float32'})['epv']
+    percentiles = [10, 50, 90]
+    # float32 normals use their own ziggurat stream, so the bound is statistical
+    np.testing.assert_allclose(np.percentile(compact, percentiles),
+                               np.percentile(full, percentiles), rtol=1e-2)
+
+
+def test_float32_batch_epv_and_grid():
+    universe = make_sample_universe(500)
+    full = batch_epv(universe, precision='float64')['epv_per_share']
+    compact = batch_epv(universe, precision='float32')['epv_per_share']
+    assert compact.dtype == np.float32
+    np.testing.assert_allclose(compact, full, rtol=1e-4, atol=1e-3)
+    np.testing.assert_allclose(np.percentile(compact, [10, 50, 90]),
+                               np.percentile(full, [10, 50, 90]), rtol=1e-4)
+
+    grid = wacc_sensitivity_grid([9.0, 10.0, 11.0], np.arange(0.06, 0.121, 0.005),
+                                 precision='float32')
+    assert grid.dtype == np.float32
+    assert grid.shape == (3, 13)
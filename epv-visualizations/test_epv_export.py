@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from epv_export import METRICS_SCHEMA, company_metrics, read_metrics, write_metrics
+from epv_monte_carlo import simulate_universe_percentiles
+from epv_universe import make_sample_universe, sample_company_universe
+
+pytest.importorskip('pyarrow')
+
+
+def test_sample_company_matches_dashboard_statistics():
+    metrics = company_metrics(sample_company_universe())
+    assert metrics['normalized_ebit'][0] == pytest.approx(118.0)
+    assert metrics['consistency_score'][0] == pytest.approx(81.0, abs=0.05)
+    assert metrics['maint_ratio'][0] == pytest.approx(275 / 445)
+    assert metrics['epv_conservative'][0] == pytest.approx(metrics['epv_per_share'][0] * 0.92)
+    assert np.isnan(metrics['epv_p50'][0])
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.arrow'])
+def test_round_trip_keeps_stable_schema(tmp_path, suffix):
+    universe = make_sample_universe(200)
+    percentiles = simulate_universe_percentiles(universe, n_sims=200)
+    metrics = company_metrics(universe, percentiles)
+    table = read_metrics(write_metrics(metrics, str(tmp_path / f'metrics{suffix}')))
+
+    assert table.column_names == [name for name, _ in METRICS_SCHEMA]
+    assert table.schema.metadata[b'epv_metrics_schema_version'] == b'1'
+    np.testing.assert_array_equal(table.column('epv_p90').to_numpy(), percentiles[90])
+    assert table.column('ticker').to_pylist() == list(universe['ticker'])
+
+
+def test_incomplete_metrics_are_rejected(tmp_path):
+    metrics = company_metrics(make_sample_universe(5))
+    del metrics['zone']
+    with pytest.raises(KeyError):
+        write_metrics(metrics, str(tmp_path / 'metrics.parquet'))
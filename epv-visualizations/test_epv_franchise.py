@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from epv_engine import batch_epv
+from epv_franchise import franchise_value, screen_franchises
+from epv_universe import company_record, make_sample_universe, sample_company_universe
+
+
+def test_sample_company_asset_values():
+    values = franchise_value(company_record(sample_company_universe(), 'SAMPLE'))
+    # 110 + 90 + 600 PP&E + 20 - 70 - 30; goodwill reproduces nothing
+    assert values['reproduction_value'] == pytest.approx(720)
+    assert values['liquidation_value'] == pytest.approx(110 * 0.85 + 90 * 0.5 + 600 * 0.4 + 20 * 0.25 - 100)
+    assert values['franchise_value'] == pytest.approx(values['epv_enterprise_value'] - 720)
+    assert values['reproduction_per_share'] == pytest.approx(720 / 3.3)
+
+
+def test_factors_and_batch_consistency():
+    universe = make_sample_universe(200)
+    values = franchise_value(universe, factors={'intangibles': 1.0})
+    np.testing.assert_allclose(values['epv_enterprise_value'], batch_epv(universe)['enterprise_value'])
+    base = franchise_value(universe)
+    np.testing.assert_allclose(values['reproduction_value'] - base['reproduction_value'], universe['intangibles'])
+    with pytest.raises(KeyError):
+        franchise_value(universe, factors={'brand': 1.0})
+
+
+def test_screen_returns_franchises_best_first():
+    universe = make_sample_universe(500)
+    tickers, values = screen_franchises(universe, min_ratio=1.0)
+    ratio = dict(zip(universe['ticker'], values['franchise_ratio']))
+    assert all(ratio[t] >= 1.0 for t in tickers)
+    assert [ratio[t] for t in tickers] == sorted((ratio[t] for t in tickers), reverse=True)
+    assert len(tickers) == np.sum((values['franchise_ratio'] >= 1.0) & (values['reproduction_value'] > 0))
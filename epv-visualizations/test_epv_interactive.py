@@ -0,0 +1,40 @@
+import base64
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from epv_engine import wacc_sensitivity_grid
+from epv_interactive import (CAPEX_FACTORS, MAX_CUBE_VALUES, TAX_SHIFTS, attach_cube, encode_cube, epv_cube,
+                             slider_script)
+
+WACC_RANGE = np.arange(0.06, 0.121, 0.005)
+
+
+def test_base_slice_matches_wacc_grid():
+    cube = epv_cube(10.0, [0.9, 1.0, 1.1], WACC_RANGE, 35.8, 16.7, 0.25)
+    assert cube.shape == (3, len(WACC_RANGE), len(TAX_SHIFTS), len(CAPEX_FACTORS))
+    np.testing.assert_allclose(cube[:, :, TAX_SHIFTS.index(0.0), CAPEX_FACTORS.index(1.0)],
+                               wacc_sensitivity_grid([9.0, 10.0, 11.0], WACC_RANGE))
+    # Higher tax and heavier capex both lower EPV
+    assert cube[1, 0, -1, 4] == pytest.approx((10.0 - 35.8 * 0.05) / 0.06)
+    assert cube[1, 0, 5, -1] == pytest.approx((10.0 - 16.7 * 0.2) / 0.06)
+
+
+def test_encoded_cube_round_trips_as_float32():
+    cube = epv_cube(10.0, [1.0, 1.25], WACC_RANGE, 35.8, 16.7, 0.25)
+    encoded = encode_cube(cube)
+    decoded = np.frombuffer(base64.b64decode(encoded['data']), dtype='<f4').reshape(encoded['shape'])
+    np.testing.assert_allclose(decoded, cube, rtol=1e-6)
+    with pytest.raises(ValueError):
+        encode_cube(np.zeros(MAX_CUBE_VALUES + 1))
+
+
+def test_slider_script_only_for_figures_with_a_cube():
+    fig = go.Figure(go.Scatter(x=WACC_RANGE, y=10 / WACC_RANGE))
+    assert slider_script(fig) is None
+    fig.add_vline(x=0.09)
+    attach_cube(fig, epv_cube(10.0, [1.0], WACC_RANGE, 35.8, 16.7, 0.25), WACC_RANGE,
+                curve_traces=[0], marker_trace=0, wacc_shape=0)
+    assert 'plotly_sliderchange' in slider_script(fig)
+    assert 'epv_cube' in fig.to_html(include_plotlyjs=False, post_script=slider_script(fig))
@@ -0,0 +1,99 @@
+import numpy as np
+
+from epv_monte_carlo import (correlated_normals, draw_inputs, simulate_epv, simulate_epv_adaptive,
+                             simulate_portfolio_epv, simulate_universe_percentiles, summarize_epv)
+from epv_universe import make_sample_universe
+
+MC_PARAMS = {
+    'base_ebit': 125,
+    'ebit_volatility': 0.20,
+    'wacc_base': 0.09,
+    'wacc_volatility': 0.015,
+    'tax_rate': 0.25,
+    'maint_capex_pct': 0.06,
+    'simulations': 10000,
+    'adaptive': {}
+}
+
+
+def test_fixed_run_matches_scalar_formula():
+    results = simulate_epv(MC_PARAMS, n_sims=500)
+    expected = [(e * (1 - t) - e * 0.06) / w / 100
+                for e, w, t in zip(results['ebit'], results['wacc'], results['tax_rate'])]
+    np.testing.assert_allclose(results['epv'], expected)
+
+
+def test_adaptive_run_meets_tolerance():
+    results = simulate_epv_adaptive(MC_PARAMS, current_price=10)
+    summary = results['summary']
+    assert results['converged']
+    assert max(summary['percentile_half_widths'].values()) <= 0.005 * summary['percentiles'][50]
+    assert summary['upside_prob_half_width'] <= 0.005
+
+
+def test_volatile_inputs_need_more_batches():
+    stable = simulate_epv_adaptive({**MC_PARAMS, 'ebit_volatility': 0.05}, current_price=10)
+    volatile = simulate_epv_adaptive({**MC_PARAMS, 'ebit_volatility': 0.40}, current_price=10)
+    assert stable['n_batches'] < volatile['n_batches']
+
+
+def test_adaptive_run_stops_at_cap():
+    params = {**MC_PARAMS, 'adaptive': {'max_simulations': 5000, 'percentile_tolerance': 1e-6}}
+    results = simulate_epv_adaptive(params, current_price=10)
+    assert not results['converged']
+    assert results['epv'].size == 5000
+
+
+def test_summary_upside_probability():
+    summary = summarize_epv(np.arange(1, 101, dtype=float), current_price=90)
+    assert summary['upside_prob'] == 0.10
+    assert 0 < summary['upside_prob_half_width'] < 0.10
+
+
+def test_copula_draws_match_target_correlation():
+    target = np.array([[1.0, -0.5, 0.3], [-0.5, 1.0, 0.0], [0.3, 0.0, 1.0]])
+    z = correlated_normals(4, 50000, target, np.random.default_rng(0))
+    assert z.shape == (3, 4, 50000)
+    np.testing.assert_allclose(np.corrcoef(z[:, 2]), target, atol=0.02)
+
+
+def test_truncated_sampling_stays_in_bounds_without_mass_at_edges():
+    params = dict(MC_PARAMS, sampling='truncated', wacc_volatility=0.05)
+    ebit, wacc, tax = draw_inputs(params, 20000, np.random.default_rng(1))
+    assert wacc.min() >= 0.05 and wacc.max() <= 0.15
+    assert 62.5 <= ebit.min() and ebit.max() <= 250
+    # Clipping would park ~37% of WACC draws exactly on a bound
+    assert np.mean((wacc == 0.05) | (wacc == 0.15)) < 0.001
+
+
+def test_default_sampling_unchanged_by_copula_path():
+    universe = make_sample_universe(50, seed=3)
+    default = simulate_universe_percentiles(universe, n_sims=4000)
+    assert np.array_equal(default[50], simulate_universe_percentiles(universe, n_sims=4000,
+                                                                     mc_params={'sampling': 'clip'})[50])
+    identity = simulate_universe_percentiles(universe, n_sims=4000, mc_params={'correlation': np.eye(3)})
+    # Same distribution through the copula path: medians agree, not bit-for-bit
+    spread = default[90] - default[10]
+    assert np.all(np.abs(identity[50] - default[50]) < 0.1 * spread)
+
+
+def test_portfolio_epv_sums_company_draws():
+    universe = make_sample_universe(30, seed=4)
+    holdings = np.arange(1, 31, dtype=float)
+    params = {'correlation': np.eye(3), 'common_weight': 0.5}
+    total = simulate_portfolio_epv(universe, holdings, n_sims=300, mc_params=params, chunk_size=7)
+    whole = simulate_portfolio_epv(universe, holdings, n_sims=300, mc_params=params, chunk_size=30)
+    assert total.shape == (300,)
+    # Common factor keeps the portfolio spread well above the independent case
+    independent = simulate_portfolio_epv(universe, holdings, n_sims=300, mc_params={'correlation': np.eye(3)})
+    assert total.std() > 1.3 * independent.std()
+    np.testing.assert_allclose(np.median(total), np.median(whole), rtol=0.05)
+
+
+def test_portfolio_spread_does_not_depend_on_chunk_size():
+    universe = make_sample_universe(1000, seed=5)
+    params = {'correlation': np.eye(3), 'common_weight': 0.5}
+    spreads = [simulate_portfolio_epv(universe, n_sims=2000, mc_params=params, chunk_size=size).std()
+               for size in (10, 100, 1000)]
+    # Every chunk shares one common factor, so the correlated risk is the same however it is split
+    np.testing.assert_allclose(spreads, spreads[-1], rtol=0.1)
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from epv_engine import batch_epv
+from epv_normalization import cycle_adjusted, normalize_ebit, normalized_epv, trimmed_mean
+from epv_universe import company_record, make_sample_universe
+
+
+def test_estimators_on_sample_history():
+    ebit = np.array([[105, 120, 145, 130, 95, 80, 110, 155, 125, 115.0]])
+    revenue = ebit * 10
+    result = normalize_ebit(ebit, revenue, ['mean', 'trimmed_mean', 'median', 'margin_x_revenue'])
+    np.testing.assert_allclose(result[:, 0], [118.0, 118.125, 117.5, 118.0])
+    assert trimmed_mean(ebit)[0] == pytest.approx(np.mean([95, 105, 110, 115, 120, 125, 130, 145]))
+    with pytest.raises(ValueError):
+        normalize_ebit(ebit, revenue, ['mode'])
+
+
+def test_cycle_adjustment_keeps_trend_and_strips_cycle():
+    years = np.arange(12)
+    trend = 100 + 5 * years
+    cycle = 20 * np.sin(years * np.pi / 2)
+    assert cycle_adjusted(trend[np.newaxis])[0] == pytest.approx(trend[-1])
+    assert abs(cycle_adjusted((trend + cycle)[np.newaxis])[0] - trend[-1]) < abs(cycle[-1])
+
+
+def test_universe_methods_side_by_side():
+    universe = make_sample_universe(30)
+    result = normalized_epv(universe)
+    assert result['epv_per_share'].shape == (len(result['methods']), 30)
+    mean_row = list(result['methods']).index('mean')
+    np.testing.assert_allclose(result['epv_per_share'][mean_row], batch_epv(universe)['epv_per_share'])
+
+    single = normalized_epv(company_record(universe, universe['ticker'][4]))
+    np.testing.assert_allclose(single['normalized_ebit'], result['normalized_ebit'][:, 4])
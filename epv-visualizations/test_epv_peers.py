@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from epv_peers import PeerIndex, comparable_range, universe_fundamentals
+from epv_universe import SAMPLE_BALANCE_SHEET, make_sample_universe, sample_company_universe
+
+PEER_DATA = pd.DataFrame({
+    'Company': ['Target Co', 'Peer A', 'Peer B', 'Peer C', 'Peer D', 'Peer E'],
+    'ROIC': [15.2, 12.8, 18.1, 9.4, 13.6, 22.3],
+    'Debt_Equity': [0.3, 0.5, 0.2, 0.8, 0.4, 0.1],
+    'Revenue_Growth_5Y': [8.2, 5.1, 12.3, 2.8, 6.9, 15.7]
+})
+
+
+def test_peers_exclude_self_and_rank_by_similarity():
+    index = PeerIndex.from_frame(PEER_DATA, ['ROIC', 'Debt_Equity', 'Revenue_Growth_5Y'], 'Company')
+    peers = index.peer_tickers(rows=[0], k=2)[0]
+    assert 'Target Co' not in peers
+    assert list(peers) == ['Peer D', 'Peer B']
+
+
+def test_roic_uses_the_book_balance_sheet():
+    universe = sample_company_universe()
+    sheet = SAMPLE_BALANCE_SHEET
+    invested_capital = (universe['ppe'][0, -1] + sheet['receivables'] + sheet['inventory'] + sheet['other_assets']
+                        + sheet['intangibles'] - sheet['payables'] - sheet['accrued_liabilities'])
+    nopat = universe['ebit'][0].mean() * (1 - universe['tax_rate'][0])
+    np.testing.assert_allclose(universe_fundamentals(universe)[0, 0], nopat / invested_capital * 100)
+
+
+def test_kd_tree_matches_brute_force():
+    features = universe_fundamentals(make_sample_universe(2000))
+    tree_index = PeerIndex(features)
+    brute_index = PeerIndex(features)
+    brute_index.tree = None
+
+    np.testing.assert_array_equal(tree_index.peers(k=5), brute_index.peers(k=5))
+    tree_dist, _ = tree_index.query(features[:10], k=3)
+    brute_dist, _ = brute_index.query(features[:10], k=3)
+    np.testing.assert_allclose(tree_dist, brute_dist)
+
+
+def test_non_finite_fundamentals_are_imputed():
+    universe = make_sample_universe(200)
+    universe['revenue'][0, -6] = 0.0    # infinite growth
+    universe['revenue'][1, -6] = np.nan
+    features = universe_fundamentals(universe)
+    assert np.isnan(features[[0, 1], 2]).all()
+
+    index = PeerIndex(features)
+    assert np.isfinite(index.points).all()
+    assert np.all(index.points[[0, 1], 2] == 0)
+    # The other companies' growth z-scores are not squashed by a huge outlier
+    assert np.nanstd(index.points[:, 2]) > 0.9
+    assert index.peers(k=5).shape == (200, 5)
+
+
+def test_comparable_range_is_ordered():
+    multiples = np.array([0.8, 1.0, 1.2, 0.9, 1.1, 1.3])
+    index = PeerIndex(PEER_DATA[['ROIC', 'Debt_Equity', 'Revenue_Growth_5Y']].to_numpy())
+    ranges = comparable_range(index, multiples, np.full(6, 125.0), k=3)
+    assert np.all(ranges['low'] <= ranges['mid'])
+    assert np.all(ranges['mid'] <= ranges['high'])
@@ -0,0 +1,51 @@
+import numpy as np
+
+from epv_monte_carlo import simulate_universe_percentiles
+from epv_screening import UNRATED, ZONE_LABELS, classify_zones, margin_of_safety, screen_universe, top_k, zone_labels
+from epv_universe import make_sample_universe
+
+
+def test_zone_rules_match_dashboards():
+    value = np.array([131.25, 120.0, 105.0, 90.0, 140.0])
+    zones = classify_zones(value, 105.0, 'wacc_sensitivity')
+    assert list(ZONE_LABELS[zones]) == ['Strong Buy', 'Buy', 'Hold', 'Overvalued', 'Strong Buy']
+    zones = classify_zones(value, 105.0, 'football_field')
+    assert list(ZONE_LABELS[zones]) == ['Buy', 'Hold', 'Hold', 'Overvalued', 'Strong Buy']
+
+
+def test_non_finite_upside_is_unrated():
+    zones = classify_zones([np.nan, 150.0, np.inf, 150.0, 80.0], [100.0, np.nan, 100.0, 0.0, 100.0])
+    assert list(zones) == [UNRATED] * 4 + [0]
+    assert list(zone_labels(zones)) == ['Unrated'] * 4 + ['Overvalued']
+
+
+def test_margin_of_safety_ignores_non_positive_values():
+    mos = margin_of_safety([200.0, -10.0], [100.0, 5.0])
+    assert mos[0] == 0.5
+    assert mos[1] == -np.inf
+
+
+def test_missing_price_is_not_a_top_opportunity():
+    universe = make_sample_universe(10)
+    universe['price'][3] = np.nan
+    screen = screen_universe(universe, k=3)
+    assert screen['margin_of_safety'][3] == -np.inf
+    assert 3 not in screen['top']
+
+
+def test_top_k_matches_full_sort():
+    scores = np.random.default_rng(0).normal(size=10000)
+    np.testing.assert_array_equal(top_k(scores, 20), np.argsort(scores)[::-1][:20])
+    assert top_k(scores[:3], 10).size == 3
+
+
+def test_screen_universe_with_p10_values():
+    universe = make_sample_universe(300)
+    screen = screen_universe(universe, k=10)
+    assert screen['top'].size == 10
+    assert np.all(np.diff(screen['margin_of_safety'][screen['top']]) <= 0)
+
+    p10 = simulate_universe_percentiles(universe, percentiles=(10,), n_sims=500)[10]
+    pessimistic = screen_universe(universe, k=10, p10=p10)
+    # Screening on P10 can only lower the value each company is judged on
+    assert np.all(pessimistic['value'] <= screen['value'] + 1e-9)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from epv_engine import batch_epv, compute_epv
+from epv_sensitivity import (EPV_INPUTS, SOBOL_INPUTS, TORNADO_BUMPS, epv_inputs, sobol_indices, tornado,
+                             universe_sobol_indices, universe_tornado)
+from epv_universe import company_record, make_sample_universe, sample_company_universe
+
+
+def test_sample_company_swings_rank_ebit_first():
+    inputs = epv_inputs(company_record(sample_company_universe(), 'SAMPLE'))
+    swings = tornado(inputs)
+    ebit = list(swings['inputs']).index('ebit')
+    assert swings['low'][ebit] == pytest.approx(compute_epv(118 * 0.9, 0.25, 55, 0.08, 0, 3.3))
+    assert swings['inputs'][swings['order'][0]] == 'ebit'
+    # Net debt moves by 10% of enterprise value, so debt-free companies still swing
+    enterprise_value = compute_epv(118, 0.25, 55, 0.08, 0, 1)
+    assert swings['swing'][list(swings['inputs']).index('net_debt')] == pytest.approx(
+        2 * 0.10 * enterprise_value / 3.3)
+
+
+def test_stacked_call_matches_one_bump_at_a_time():
+    universe = make_sample_universe(300)
+    swings = universe_tornado(universe)
+    np.testing.assert_allclose(swings['base'], batch_epv(universe)['epv_per_share'])
+    assert swings['swing'].shape == (len(EPV_INPUTS), 300)
+
+    inputs = epv_inputs(universe)
+    for i, name in enumerate(swings['inputs']):
+        kind, size = TORNADO_BUMPS[name]
+        if kind == 'enterprise':
+            size = size * np.abs(compute_epv(*(inputs[n] for n in EPV_INPUTS[:4]), 0, 1))
+        up = inputs[name] * (1 + size) if kind == 'relative' else inputs[name] + size
+        expected = compute_epv(*(up if n == name else inputs[n] for n in EPV_INPUTS))
+        np.testing.assert_allclose(swings['high'][i], expected)
+
+
+def test_net_debt_swing_is_continuous_at_zero():
+    inputs = {'ebit': 100, 'tax_rate': 0.25, 'maint_capex': 20, 'wacc': 0.08,
+              'net_debt': np.array([0, 1, -1, 400]), 'shares': 10}
+    swing = tornado(inputs)['swing'][list(EPV_INPUTS).index('net_debt')]
+    np.testing.assert_allclose(swing, 2 * 0.10 * compute_epv(100, 0.25, 20, 0.08, 0, 1) / 10)
+
+
+def test_integer_inputs_are_not_truncated():
+    inputs = {'ebit': 100, 'tax_rate': 0.25, 'maint_capex': 20, 'wacc': 0.08, 'net_debt': 50, 'shares': 10}
+    as_ints = dict(inputs, ebit=np.array([100]), maint_capex=np.array([20]), net_debt=np.array([50]))
+    as_floats = dict(inputs, ebit=np.array([100.0]), maint_capex=np.array([20.0]), net_debt=np.array([50.0]))
+    for key in ('low', 'high', 'swing'):
+        np.testing.assert_allclose(tornado(as_ints)[key], tornado(as_floats)[key])
+
+
+def test_unknown_bump_kind_is_rejected():
+    with pytest.raises(ValueError):
+        universe_tornado(make_sample_universe(5), bumps={'ebit': ('percent', 10)})
+
+
+MC_PARAMS = {'base_ebit': 125, 'ebit_volatility': 0.20, 'wacc_base': 0.09, 'wacc_volatility': 0.015,
+             'tax_rate': 0.25, 'maint_capex_pct': 0.06}
+
+
+def test_sobol_indices_attribute_variance_to_random_inputs():
+    result = sobol_indices(dict(MC_PARAMS, tax_volatility=0, maint_capex_volatility=0), n=4096, n_boot=100)
+    first = dict(zip(result['inputs'], result['first_order']))
+    total = dict(zip(result['inputs'], result['total_order']))
+    assert first['tax_rate'] == total['tax_rate'] == first['maint_capex'] == total['maint_capex'] == 0
+    assert first['ebit'] > first['wacc'] > 0.3
+    assert result['total_order'].sum() == pytest.approx(1, abs=0.1)
+    low, high = result['total_order_ci'].T
+    assert np.all((low <= result['total_order']) & (result['total_order'] <= high))
+    assert result['n_evaluations'] == 4096 * (len(SOBOL_INPUTS) + 2)
+
+
+def test_universe_sobol_matches_single_company():
+    universe = make_sample_universe(50)
+    inputs = {name: values[7] for name, values in epv_inputs(universe).items()}
+    params = dict(MC_PARAMS, base_ebit=inputs['ebit'], wacc_base=inputs['wacc'], tax_rate=inputs['tax_rate'],
+                  maint_capex_pct=inputs['maint_capex'] / inputs['ebit'], net_debt=inputs['net_debt'],
+                  shares=inputs['shares'])
+    single = sobol_indices(params, n=512, n_boot=10, seed=3)
+    batched = universe_sobol_indices(universe, n=512, mc_params=MC_PARAMS, seed=3, chunk_size=16)
+    assert batched['first_order'].shape == (len(SOBOL_INPUTS), 50)
+    np.testing.assert_allclose(batched['first_order'][:, 7], single['first_order'], atol=1e-9)
+    np.testing.assert_allclose(batched['total_order'][:, 7], single['total_order'], atol=1e-9)
@@ -0,0 +1,51 @@
+import json
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+import epv_serialize
+from epv_serialize import figure_html, figure_json, write_figure_json
+
+
+def make_figure():
+    x = np.linspace(0.06, 0.12, 13)
+    fig = go.Figure(go.Scatter(x=x, y=np.where(x > 0.11, np.nan, 10 / x), name='EPV </script>'))
+    fig.add_trace(go.Histogram(x=np.random.default_rng(0).normal(10, 2, 500)))
+    fig.update_layout(title_text='WACC Sensitivity', width=800, height=500)
+    return fig
+
+
+def test_figure_json_matches_plotly_encoder(tmp_path):
+    fig = make_figure()
+    assert json.loads(figure_json(fig)) == json.loads(pio.to_json(fig, engine='json'))
+    restored = pio.read_json(write_figure_json(fig, str(tmp_path / 'fig.json')))
+    np.testing.assert_allclose(restored.data[0].x, fig.data[0].x)
+
+
+def test_json_fallback_without_orjson(monkeypatch):
+    fig = make_figure()
+    monkeypatch.setattr(epv_serialize, 'orjson', None)
+    assert json.loads(figure_json(fig)) == json.loads(pio.to_json(fig, engine='json'))
+
+
+def test_figure_like_objects_use_the_public_api():
+    fig = make_figure()
+
+    class Exported:
+        """Only the public to_plotly_json(), as from a wrapper or another plotly version"""
+        def to_plotly_json(self):
+            return fig.to_plotly_json()
+
+    assert json.loads(figure_json(Exported())) == json.loads(figure_json(fig))
+    assert json.loads(figure_json(fig.to_dict())) == json.loads(figure_json(fig))
+
+
+def test_figure_html_embeds_data_and_post_script():
+    fig = make_figure()
+    html = figure_html(fig, post_script="console.log('{plot_id}')", div_id='epv-plot')
+    assert 'Plotly.newPlot("epv-plot"' in html and "console.log('epv-plot')" in html
+    assert 'width:800px' in html and 'cdn.plot.ly' in html
+    assert html.count('</script>') == 2
+    data = html.split('Plotly.newPlot("epv-plot", ', 1)[1].split(', {"', 1)[0]
+    assert json.loads(data)[0]['name'] == 'EPV </script>'
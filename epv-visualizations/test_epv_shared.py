@@ -0,0 +1,43 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import epv_shared
+from epv_shared import SharedUniverse, attach_universe, detach_universe, slice_universe
+from epv_universe import make_sample_universe
+
+
+def _column_sum(task):
+    manifest, name = task
+    universe = attach_universe(manifest)
+    total, last = float(universe[name].sum()), str(universe['ticker'][-1])
+    del universe
+    detach_universe(manifest)
+    return total, last, manifest['shared_memory'] in epv_shared._ATTACHED
+
+
+def test_publish_round_trips_every_column():
+    universe = make_sample_universe(25)
+    with SharedUniverse(universe) as shared:
+        views = attach_universe(shared.manifest)
+        assert set(views) == set(universe)
+        for name, values in universe.items():
+            np.testing.assert_array_equal(views[name], values)
+        assert np.shares_memory(slice_universe(views, 5, 9)['ebit'], views['ebit'])
+        assert shared.nbytes >= sum(values.nbytes for values in universe.values())
+
+
+def test_workers_attach_by_name():
+    universe = make_sample_universe(40)
+    # Spawned workers start empty, so they must attach to the block by name
+    context = multiprocessing.get_context('spawn')
+    with SharedUniverse(universe) as shared, ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+        results = list(pool.map(_column_sum, [(shared.manifest, 'ebit'), (shared.manifest, 'price')]))
+    assert results[0] == (universe['ebit'].sum(), 'CO00039', False)
+    assert results[1][0] == universe['price'].sum()
+
+
+def test_plain_universe_passes_through():
+    universe = make_sample_universe(3)
+    assert attach_universe(universe) is universe
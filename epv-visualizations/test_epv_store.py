@@ -0,0 +1,94 @@
+import os
+
+import numpy as np
+import pytest
+
+from epv_export import company_metrics
+from epv_store import FundamentalsStore
+from epv_universe import company_record, make_sample_universe
+
+
+def test_universe_round_trip_and_snapshot_refresh(tmp_path):
+    universe = make_sample_universe(40)
+    with FundamentalsStore(str(tmp_path / 'epv.db')) as store:
+        store.write_universe(universe)
+        cold = store.load_universe()
+        assert os.path.exists(store.snapshot_path)
+        for name, values in universe.items():
+            np.testing.assert_array_equal(cold[name], values)
+
+        # A write invalidates the snapshot: the next load sees the new figures
+        changed = {name: (values if name == 'year' else values[3:4]) for name, values in universe.items()}
+        changed['price'] = changed['price'] * 2
+        store.write_universe(changed)
+        warm = store.load_universe()
+        assert warm['price'][3] == universe['price'][3] * 2
+        assert list(warm['ticker']) == list(universe['ticker'])
+
+
+def test_single_company_matches_company_record(tmp_path):
+    universe = make_sample_universe(25)
+    with FundamentalsStore(str(tmp_path / 'epv.db')) as store:
+        store.write_universe(universe)
+        loaded = store.load_company('CO00007')
+        with pytest.raises(KeyError):
+            store.load_company('MISSING')
+    expected = company_record(universe, 'CO00007')
+    assert set(loaded) == set(expected)
+    for name, values in expected.items():
+        np.testing.assert_array_equal(loaded[name], values)
+
+
+def test_prices_and_metrics_round_trip(tmp_path):
+    universe = make_sample_universe(10)
+    dates = np.arange('2023-01-02', '2023-01-12', dtype='datetime64[D]')
+    prices = np.random.default_rng(0).uniform(10, 20, (10, dates.size))
+    prices[2, :4] = np.nan
+    metrics = company_metrics(universe)
+    with FundamentalsStore(str(tmp_path / 'epv.db')) as store:
+        store.write_universe(universe)
+        store.write_prices(universe['ticker'], dates, prices)
+        store.write_metrics(metrics)
+        tickers, loaded_dates, loaded_prices = store.load_prices(universe['ticker'][::-1])
+        loaded_metrics = store.load_metrics()
+    np.testing.assert_array_equal(loaded_dates, dates)
+    np.testing.assert_array_equal(loaded_prices, prices[::-1])
+    np.testing.assert_array_equal(loaded_metrics['epv_per_share'], metrics['epv_per_share'])
+    assert list(loaded_metrics['zone']) == list(metrics['zone'])
+
+
+def test_warm_load_is_served_from_snapshot(tmp_path, monkeypatch):
+    universe = make_sample_universe(12)
+    with FundamentalsStore(str(tmp_path / 'epv.db')) as store:
+        store.write_universe(universe)
+        store.load_universe()
+
+        def no_query(self, dtype):
+            raise AssertionError("warm load queried the database")
+
+        monkeypatch.setattr(FundamentalsStore, '_query_universe', no_query)
+        warm = store.load_universe()
+        np.testing.assert_array_equal(warm['ebit'], universe['ebit'])
+        # Prices are not in the snapshot, so writing them keeps it current
+        store.write_prices(universe['ticker'], ['2023-01-02'], np.ones((12, 1)))
+        assert store.version == 1 and isinstance(store.store_id, str)
+        np.testing.assert_array_equal(store.load_universe()['ebit'], universe['ebit'])
+        # A stale snapshot (after a write) must be rebuilt from the tables
+        store.write_universe({name: (values if name == 'year' else values[:1])
+                              for name, values in universe.items()})
+        with pytest.raises(AssertionError, match='queried'):
+            store.load_universe()
+
+
+def test_recreated_database_ignores_old_snapshot(tmp_path):
+    path = str(tmp_path / 'epv.db')
+    with FundamentalsStore(path) as store:
+        store.write_universe(make_sample_universe(5))
+        assert store.load_universe()['ticker'].size == 5
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    # Same version number (1) in a new database: the old snapshot must not be served
+    with FundamentalsStore(path) as store:
+        store.write_universe(make_sample_universe(3))
+        assert store.load_universe()['ticker'].size == 3
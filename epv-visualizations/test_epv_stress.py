@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from epv_engine import batch_epv
+from epv_stress import (NO_SHOCK, SHOCK_PATHS, register_shock, shock_matrix, stress_epv, wacc_peaks,
+                        worst_case_ranking)
+from epv_universe import make_sample_universe, sample_company_universe
+
+
+def test_broadcast_stress_matches_per_company_recompute():
+    universe = make_sample_universe(30)
+    result = stress_epv(universe)
+    assert result['epv'].shape == (len(SHOCK_PATHS), 30)
+    np.testing.assert_allclose(result['base_epv'], batch_epv(universe)['epv_per_share'])
+
+    # Market Downturn by hand: apply the path to the last three years and recompute
+    i, company = list(result['shocks']).index('Market Downturn'), 4
+    path = SHOCK_PATHS['Market Downturn']
+    ebit = universe['ebit'][company].copy()
+    ebit[-3:] = ebit[-3:] * (1 + np.array(path['ebit'])) + np.array(path['margin']) * universe['revenue'][company, -3:]
+    capex = universe['maint_capex'][company].copy()
+    capex[-3:] *= 1 + np.array(path['maint_capex'])
+    wacc = universe['wacc'][company] * (1 + max(path['wacc']))
+    expected = ((ebit.mean() * (1 - universe['tax_rate'][company]) - capex.mean()) / wacc
+                - universe['net_debt'][company]) / universe['shares'][company]
+    assert result['epv'][i, company] == pytest.approx(expected)
+
+
+def test_rate_shock_on_sample_company():
+    result = stress_epv(sample_company_universe(), shocks=['Rate Shock'])
+    # Capitalizing at a 35% higher WACC cuts enterprise value to 1/1.35 (no net debt)
+    assert result['delta_pct'][0, 0] == pytest.approx(1 / 1.35 - 1)
+    assert result['shocks'][result['worst_shock'][0]] == 'Rate Shock'
+
+
+def test_wacc_path_applies_at_its_peak():
+    register_shock('Test Rate Spike', wacc=[0.40, 0.10, 0.00])
+    register_shock('Test Rate Cut', wacc=[-0.10, -0.20])
+    try:
+        np.testing.assert_allclose(wacc_peaks(['Test Rate Spike', 'Test Rate Cut', 'Margin Squeeze'], 5),
+                                   [0.40, -0.10, 0.0])
+        # Only the last two years are in a two-year history
+        assert wacc_peaks(['Test Rate Spike'], 2)[0] == pytest.approx(0.10)
+        result = stress_epv(sample_company_universe(), shocks=['Test Rate Spike'])
+        assert result['delta_pct'][0, 0] == pytest.approx(1 / 1.40 - 1)
+    finally:
+        del SHOCK_PATHS['Test Rate Spike'], SHOCK_PATHS['Test Rate Cut']
+
+
+def test_company_without_epv_has_no_worst_shock():
+    universe = make_sample_universe(3)
+    universe['ebit'][1] = np.nan
+    result = stress_epv(universe)
+    assert list(result['worst_shock'] == NO_SHOCK) == [False, True, False]
+    assert np.isnan(result['worst_price_impact'][1])
+    assert np.isfinite(result['worst_price_impact'][[0, 2]]).all()
+
+
+def test_worst_case_ranking_and_registration():
+    register_shock('Test Collapse', ebit=[-0.9] * 20)
+    try:
+        assert shock_matrix(['Test Collapse'], 10)['ebit'].shape == (1, 10)
+        universe = make_sample_universe(50)
+        result = stress_epv(universe, shocks=['Rate Shock', 'Test Collapse'])
+        tickers, impact = worst_case_ranking(result, universe['ticker'], top=5)
+        assert tickers.size == 5 and np.all(np.diff(impact) >= 0)
+        assert impact[0] == result['worst_price_impact'].min()
+        with pytest.raises(ValueError):
+            register_shock('Bad', revenue=[-0.1])
+        with pytest.raises(KeyError):
+            stress_epv(universe, shocks=['Missing'])
+    finally:
+        SHOCK_PATHS.pop('Test Collapse')
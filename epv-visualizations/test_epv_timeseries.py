@@ -0,0 +1,37 @@
+import numpy as np
+
+from epv_timeseries import asof_align, downsample, tracking_series, trading_days
+
+
+def test_asof_align_uses_latest_published_value():
+    dates = trading_days('2024-01-01', '2024-02-01')
+    ticker_idx = [0, 0, 0, 1]
+    published = np.array(['2024-01-03', '2024-01-10', '2024-01-10', '2024-01-06'],
+                         dtype='datetime64[D]')
+    epv = [100.0, 110.0, 112.0, 50.0]  # 112 restates 110 on the same day
+
+    aligned = asof_align(ticker_idx, published, epv, dates, n_tickers=2)
+    day = {str(d): i for i, d in enumerate(dates)}
+    assert np.isnan(aligned[0, day['2024-01-02']])
+    assert aligned[0, day['2024-01-09']] == 100.0
+    assert aligned[0, day['2024-01-10']] == 112.0
+    assert aligned[0, -1] == 112.0
+    # Published on a Saturday: first visible the next trading day
+    assert np.isnan(aligned[1, day['2024-01-05']])
+    assert aligned[1, day['2024-01-08']] == 50.0
+
+
+def test_tracking_series_and_downsample():
+    dates = trading_days('2024-01-01', '2024-03-01')
+    prices = np.full((1, dates.size), 80.0)
+    aligned = np.full((1, dates.size), 100.0)
+    aligned[0, :5] = np.nan
+
+    series = tracking_series(prices, aligned)
+    assert np.isnan(series['margin_of_safety'][0, 0])
+    np.testing.assert_allclose(series['premium'][0, 5:], -0.2)
+    np.testing.assert_allclose(series['margin_of_safety'][0, 5:], 0.2)
+
+    month_ends, monthly = downsample(dates, series['premium'], 'M', how='mean')
+    assert list(month_ends.astype(str)) == ['2024-01-31', '2024-02-29']
+    np.testing.assert_allclose(monthly[0], [-0.2, -0.2])
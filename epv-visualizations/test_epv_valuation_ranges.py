@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from epv_valuation_ranges import (consensus_range, pairwise_overlap, range_dtype, range_overlap,
+                                  range_records, valuation_ranges, weighted_fair_value)
+
+ROWS = [
+    {'method': 'EPV', 'low': 115, 'mid': 125, 'high': 135, 'confidence': 95, 'weight': 40, 'risk': 'Low'},
+    {'method': 'DCF', 'low': 110, 'mid': 165, 'high': 240, 'confidence': 70, 'weight': 25, 'risk': 'High'},
+    {'method': 'Asset-Based', 'low': 85, 'high': 135, 'confidence': 80, 'weight': 5, 'risk': 'Medium'}
+]
+
+
+def test_pack_round_trips_football_field_rows():
+    ranges, methods = valuation_ranges(ROWS)
+    assert ranges.dtype == range_dtype() and ranges.itemsize <= 40
+    assert list(methods) == ['EPV', 'DCF', 'Asset-Based']
+    records = range_records(ranges, methods)
+    assert records[2]['mid'] == 110 and records[2]['risk'] == 'Medium'
+    assert records[1] == ROWS[1]
+
+
+def test_weighted_fair_value_matches_row_loop():
+    rng = np.random.default_rng(0)
+    n_companies, n_methods = 500, 6
+    ranges = np.zeros(n_companies * n_methods, dtype=range_dtype())
+    ranges['company'] = np.repeat(np.arange(n_companies), n_methods)
+    ranges['method'] = np.tile(np.arange(n_methods), n_companies)
+    ranges['low'] = rng.uniform(50, 100, ranges.size)
+    ranges['high'] = ranges['low'] + rng.uniform(0, 50, ranges.size)
+    ranges['mid'] = (ranges['low'] + ranges['high']) / 2
+    ranges['weight'] = rng.uniform(0, 1, ranges.size)
+    ranges['confidence'] = rng.uniform(50, 95, ranges.size)
+
+    fair = weighted_fair_value(ranges, by_confidence=True)
+    company = ranges[ranges['company'] == 7]
+    weight = company['weight'].astype(float) * company['confidence']
+    assert fair[7] == pytest.approx((weight * company['mid']).sum() / weight.sum())
+    assert np.isnan(weighted_fair_value(ranges, n_companies + 1)[-1])
+
+
+def test_overlap_and_consensus():
+    ranges, _ = valuation_ranges(ROWS)
+    np.testing.assert_allclose(range_overlap(ranges, 120, 140), [0.75, 20 / 130, 0.3])
+    np.testing.assert_array_equal(range_overlap(ranges, 130, 130), [1, 1, 1])
+    low, high = consensus_range(ranges)
+    assert (low[0], high[0]) == (115, 135)
+    overlap = pairwise_overlap(ranges)
+    assert overlap[0, 1] == 20 and overlap[1, 2] == 25 and overlap[2, 2] == 50
+
+
+def test_company_count_handles_no_rows_and_explicit_counts():
+    empty, _ = valuation_ranges([])
+    assert weighted_fair_value(empty).shape == (0,)
+    assert consensus_range(empty)[0].shape == (0,)
+    # Companies past the last row get NaN / unbounded entries
+    ranges, _ = valuation_ranges(ROWS)
+    assert np.isnan(weighted_fair_value(ranges, n_companies=3)[1:]).all()
+    low, high = consensus_range(ranges, n_companies=2)
+    assert low[1] == -np.inf and high[1] == np.inf
@@ -0,0 +1,65 @@
+import importlib
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from plot_registry import INPUT_REGISTRY, PLOT_REGISTRY, PlotRun, required_inputs, required_modules
+
+
+def test_shared_inputs_are_declared_once():
+    assert required_inputs(['ebit', 'wacc', 'ebit-professional', 'capex-professional']) == [
+        'complete_suite', 'professional_data']
+    assert required_modules(['ebit-ultimate', 'capex-ultimate']) == ['ultimate_epv']
+
+
+def test_run_loads_only_requested_modules_and_builds_inputs_once():
+    for module in ('enhanced_prompts_2_implementation', 'complete_epv_suite'):
+        sys.modules.pop(module, None)
+
+    run = PlotRun()
+    for name in ('ebit-professional', 'capex-professional'):
+        plt.close(run.render(name))
+
+    assert 'enhanced_prompts_2_implementation' in sys.modules
+    assert 'complete_epv_suite' not in sys.modules
+    assert list(run.inputs) == ['professional_data']
+
+
+def test_every_registered_plot_resolves():
+    for spec in PLOT_REGISTRY.values():
+        owner = importlib.import_module(spec['module'])
+        if spec['owner']:
+            owner = getattr(owner, INPUT_REGISTRY[spec['owner']]['builder'])
+        assert callable(getattr(owner, spec['function']))
+
+
+def test_football_field_dcf_rows_come_from_dcf_scenarios():
+    from complete_epv_suite import EnhancedEPVSuite
+
+    suite = EnhancedEPVSuite()
+    fig = suite.plot_6_football_field_enhanced(show=False)
+    mids = {method: x for trace in fig.data if trace.mode == 'markers' for method, x in zip(trace.y, trace.x)}
+    dcf = dict(zip(suite.dcf_df['Growth Rate'], suite.dcf_df['DCF Value']))
+    assert mids['DCF (0% Growth)'] == dcf['0%'] and mids['DCF (4% Growth)'] == dcf['4%']
+
+
+def test_company_football_field_uses_only_company_ranges():
+    from complete_epv_suite import EnhancedEPVSuite
+    from epv_engine import batch_epv
+    from epv_peers import universe_comparable_range
+    from epv_universe import company_record, make_sample_universe
+
+    universe = make_sample_universe(40)
+    epv = batch_epv(universe)['epv_per_share']
+    company = company_record(universe, 'CO00007', epv)
+    comparable = universe_comparable_range(universe, epv)
+    company['comparable_range'] = {bound: float(values[7]) for bound, values in comparable.items()}
+
+    fig = EnhancedEPVSuite(company=company).plot_6_football_field_enhanced(show=False)
+    mids = {method: x for trace in fig.data if trace.mode == 'markers' for method, x in zip(trace.y, trace.x)}
+    assert 'Precedent Transactions' not in mids and 'Sum-of-the-Parts' not in mids
+    assert mids['EPV Base Case'] == epv[7]
+    assert mids['Comparable Companies'] == company['comparable_range']['mid']
+    assert [a.text for a in fig.layout.annotations] == [f"Current Price: ${universe['price'][7]:.2f}"]
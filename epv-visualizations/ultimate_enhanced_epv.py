@@ -14,6 +14,8 @@ from matplotlib.patches import Patch
 import warnings
 warnings.filterwarnings('ignore')
 
+from epv_dcf import dcf_scenarios
+
 plt.style.use('seaborn-v0_8-whitegrid')
 sns.set_palette("Set2")
 
@@ -35,9 +37,10 @@ def create_enhanced_data():
     }
     
     # DCF scenarios
+    dcf = dcf_scenarios(10.00, 0.08)
     dcf_data = {
-        'Growth Rate': ['0%', '2%', '4%', '6%'],
-        'DCF Value': [95.00, 120.00, 165.00, 240.00]
+        'Growth Rate': dcf['growth_rate'],
+        'DCF Value': dcf['value']
     }
     
     # EPV scenarios
@@ -48,11 +51,11 @@ def create_enhanced_data():
     
     return ebit_data, capex_data, dcf_data, epv_scenarios, events
 
-def plot_1_enhanced_ebit():
+def plot_1_enhanced_ebit(show=True, data=None):
     """1. MASSIVELY Enhanced EBIT Normalization"""
     print("\n🎯 ENHANCED EBIT NORMALIZATION ANALYSIS...")
     
-    ebit_data, _, _, _, events = create_enhanced_data()
+    ebit_data, _, _, _, events = data or create_enhanced_data()
     ebit_df = pd.DataFrame(ebit_data)
     
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 14))
@@ -148,13 +151,15 @@ def plot_1_enhanced_ebit():
     ax4.axis('off')
     
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
-def plot_2_enhanced_capex():
+def plot_2_enhanced_capex(show=True, data=None):
     """2. MASSIVELY Enhanced Capex Analysis"""
     print("\n🎯 ENHANCED CAPEX BREAKDOWN ANALYSIS...")
     
-    _, capex_data, _, _, _ = create_enhanced_data()
+    _, capex_data, _, _, _ = data or create_enhanced_data()
     capex_df = pd.DataFrame(capex_data)
     capex_df['Growth Capex'] = capex_df['Total Capex'] - capex_df['Maintenance Capex']
     
@@ -259,13 +264,15 @@ def plot_2_enhanced_capex():
     ax4.axis('off')
     
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
-def plot_3_enhanced_epv_dcf():
+def plot_3_enhanced_epv_dcf(show=True, data=None):
     """3. MASSIVELY Enhanced EPV vs DCF Interactive"""
     print("\n🎯 ENHANCED EPV vs DCF INTERACTIVE ANALYSIS...")
     
-    _, _, dcf_data, epv_scenarios, _ = create_enhanced_data()
+    _, _, dcf_data, epv_scenarios, _ = data or create_enhanced_data()
     dcf_df = pd.DataFrame(dcf_data)
     
     fig = make_subplots(
@@ -338,7 +345,9 @@ def plot_3_enhanced_epv_dcf():
     
     # Investment decision matrix
     methods = ['EPV Conservative', 'EPV Base', 'DCF 0%', 'DCF 4%', 'DCF 6%']
-    values = [115, 125, 95, 165, 240]
+    dcf_values = dict(zip(dcf_df['Growth Rate'], dcf_df['DCF Value']))
+    values = [epv_scenarios['Conservative'], epv_scenarios['Base Case'],
+              dcf_values['0%'], dcf_values['4%'], dcf_values['6%']]
     risk_scores = [5, 5, 15, 60, 90]
     
     # Color code by investment recommendation
@@ -370,7 +379,9 @@ def plot_3_enhanced_epv_dcf():
         template='plotly_white'
     )
     
-    fig.show()
+    if show:
+        fig.show()
+    return fig
 
 def run_enhanced_suite():
     """Execute the enhanced EPV suite"""
@@ -379,9 +390,10 @@ def run_enhanced_suite():
     print("🔬 Professional Analytics • Advanced Insights • Investment-Grade Quality")
     print("=" * 80)
     
-    plot_1_enhanced_ebit()
-    plot_2_enhanced_capex() 
-    plot_3_enhanced_epv_dcf()
+    data = create_enhanced_data()
+    plot_1_enhanced_ebit(data=data)
+    plot_2_enhanced_capex(data=data)
+    plot_3_enhanced_epv_dcf(data=data)
     
     print("\n✅ ENHANCED EPV SUITE COMPLETE!")
     print("📊 All Visualizations Enhanced with Professional Features")
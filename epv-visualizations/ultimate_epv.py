@@ -14,9 +14,11 @@ from matplotlib.patches import Patch
 import warnings
 warnings.filterwarnings('ignore')
 
+from epv_dcf import dcf_scenarios
+
 plt.style.use('seaborn-v0_8-whitegrid')
 
-def enhanced_ebit_analysis():
+def enhanced_ebit_analysis(show=True):
     """Enhanced EBIT Normalization with Professional Analytics"""
     print("\n🎯 ENHANCED EBIT NORMALIZATION ANALYSIS")
     
@@ -106,9 +108,11 @@ Use ${avg_ebit:.1f}M as normalized EBIT"""
     ax4.axis('off')
     
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
-def enhanced_capex_analysis():
+def enhanced_capex_analysis(show=True):
     """Enhanced Capex Breakdown Analysis"""
     print("\n🎯 ENHANCED CAPEX BREAKDOWN ANALYSIS")
     
@@ -196,16 +200,19 @@ Use ${avg_maint:.1f}M for maintenance capex"""
     ax4.axis('off')
     
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
-def enhanced_epv_dcf_comparison():
+def enhanced_epv_dcf_comparison(show=True):
     """Enhanced EPV vs DCF Interactive Analysis"""
     print("\n🎯 ENHANCED EPV vs DCF ANALYSIS")
     
     # Data
+    dcf = dcf_scenarios(10.00, 0.08)
     dcf_data = {
-        'Growth Rate': ['0%', '2%', '4%', '6%'],
-        'DCF Value': [95.00, 120.00, 165.00, 240.00]
+        'Growth Rate': dcf['growth_rate'],
+        'DCF Value': dcf['value']
     }
     epv_scenarios = {"Conservative": 115.00, "Base Case": 125.00, "Optimistic": 135.00}
     
@@ -272,7 +279,9 @@ def enhanced_epv_dcf_comparison():
     
     # Decision matrix
     methods = ['EPV Cons', 'EPV Base', 'DCF 0%', 'DCF 4%', 'DCF 6%']
-    values = [115, 125, 95, 165, 240]
+    dcf_values = dict(zip(dcf_df['Growth Rate'], dcf_df['DCF Value']))
+    values = [epv_scenarios['Conservative'], epv_scenarios['Base Case'],
+              dcf_values['0%'], dcf_values['4%'], dcf_values['6%']]
     risks = [5, 5, 10, 50, 80]
     
     fig.add_trace(
@@ -289,7 +298,9 @@ def enhanced_epv_dcf_comparison():
         template='plotly_white'
     )
     
-    fig.show()
+    if show:
+        fig.show()
+    return fig
 
 def run_ultimate_epv_suite():
     """Run the ultimate enhanced EPV suite"""